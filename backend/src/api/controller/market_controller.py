@@ -64,11 +64,14 @@ async def market_index_history(
             market=market, symbol=index_code, days=days
         )
 
-        return {
-            "code": 0,
-            "data": data,
-            "message": "success",
-        }
+        # 数据均为 JSON 原生类型，直接返回 JSONResponse，跳过 jsonable_encoder 的逐字段递归转换
+        return JSONResponse(
+            content={
+                "code": 0,
+                "data": data,
+                "message": "success",
+            }
+        )
 
     except HTTPException:
         raise
@@ -154,15 +157,18 @@ async def market_index(
                 interval=period,
             )
 
-        return {
-            "code": 0,
-            "data": {
-                "market": market,
-                "symbol": index_code,
-                "name": index_info["name"],
-                "items": data,
-            },
-        }
+        # 同上，行情 dict 的时间已格式化为字符串，可直接序列化
+        return JSONResponse(
+            content={
+                "code": 0,
+                "data": {
+                    "market": market,
+                    "symbol": index_code,
+                    "name": index_info["name"],
+                    "items": data,
+                },
+            }
+        )
 
     except HTTPException:
         raise
@@ -53,8 +53,13 @@ CACHE_TTL_REALTIME = 30  # 实时数据缓存30秒
 CACHE_TTL_MINUTE = 60  # 分钟数据缓存1分钟
 CACHE_TTL_DAILY = 300  # 日数据缓存5分钟
 CACHE_TTL_HISTORY = 3600 * 24  # 历史数据缓存1天（历史数据不会变化）
+CACHE_TTL_INDEX_HISTORY = 3600 * 4  # 指数日线缓存4小时（最后一根为当日K线，收盘前会变化）
 CACHE_TTL_WATCHLIST = 3600 * 24  # 自选列表缓存1天
 
+# 本地磁盘缓存（Parquet），进程重启后无需等待上游接口即可恢复列表数据
+DISK_CACHE_DIR = os.environ.get("DISK_CACHE_DIR", "/tmp/investment_copilot")
+CACHE_TTL_DISK = 3600  # 磁盘缓存1小时内视为有效
+
 # 日志设置
 LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO")
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
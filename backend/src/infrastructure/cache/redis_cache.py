@@ -3,6 +3,7 @@ import logging
 from datetime import date, datetime
 from typing import Any, Optional, Union
 
+import msgpack
 import redis
 from redis.exceptions import RedisError
 from src.config import REDIS_RETRY, REDIS_TIMEOUT, REDIS_URL
@@ -21,6 +22,13 @@ class DateTimeEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+def _msgpack_default(obj):
+    """msgpack 序列化钩子，datetime 与 JSON 缓存保持一致，转为 ISO 字符串"""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not msgpack serializable")
+
+
 class RedisCache:
     """Redis缓存服务"""
 
@@ -53,6 +61,29 @@ class RedisCache:
             logger.error(f"Redis set error: {str(e)}")
             return False
 
+    async def get_packed(self, key: str) -> Optional[Any]:
+        """获取 msgpack 编码的缓存（用于 K 线等大体积数值数据）"""
+        try:
+            data = self.client.get(key)
+            if data:
+                return msgpack.unpackb(data, raw=False)
+            return None
+        except (RedisError, ValueError, msgpack.UnpackException) as e:
+            logger.error(f"Redis get_packed error: {str(e)}")
+            return None
+
+    async def set_packed(self, key: str, value: Any, timeout: int = 300) -> bool:
+        """以 msgpack 编码设置缓存，默认过期时间5分钟"""
+        try:
+            return self.client.setex(
+                key,
+                timeout,
+                msgpack.packb(value, use_bin_type=True, default=_msgpack_default),
+            )
+        except (RedisError, TypeError, ValueError) as e:
+            logger.error(f"Redis set_packed error: {str(e)}")
+            return False
+
     async def delete(self, key: str) -> bool:
         """删除缓存"""
         try:
@@ -1,3 +1,8 @@
+from src.infrastructure.client.akshare.session import install_shared_session
+
+# 所有 akshare 请求复用同一个连接池
+install_shared_session()
+
 from src.infrastructure.client.akshare.stock import StockClient
 from src.infrastructure.client.akshare.fund import FundClient
 from src.infrastructure.client.akshare.gold import GoldClient
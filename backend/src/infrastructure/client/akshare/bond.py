@@ -6,7 +6,11 @@ from datetime import datetime
 from typing import Any, Dict, List
 
 import akshare as ak
+import numpy as np
+import pandas as pd
 
+from src.infrastructure.client.akshare import cache as ak_cache
+from src.infrastructure.client.akshare.frame import coerce_numeric, frame_to_records
 from src.infrastructure.client.base import BaseClient
 
 logger = logging.getLogger(__name__)
@@ -15,6 +19,12 @@ logger = logging.getLogger(__name__)
 class BondClient(BaseClient):
     """债券数据客户端"""
 
+    # 可转债 / 沪深债券行情中需要转为数值的列
+    _CB_NUMERIC_COLS = [
+        "price", "increase_rt", "ytm_rt", "volume", "amt", "premium_rt", "convert_value",
+    ]
+    _SPOT_NUMERIC_COLS = ["最新价", "今开", "最高", "最低", "涨跌额", "涨跌幅", "成交量", "成交额"]
+
     async def request(self, *args, **kwargs) -> Any:
         pass
 
@@ -22,30 +32,26 @@ class BondClient(BaseClient):
         """获取中国国债收益率"""
         try:
             df = ak.bond_china_yield()
-            
-            result = []
-            now = datetime.now()
-            
-            # 取最新一天的数据
-            if not df.empty:
-                latest_date = df["日期"].max()
-                df = df[df["日期"] == latest_date]
-                
-                for _, row in df.iterrows():
-                    term = row.get("曲线名称", "")
-                    if "中债国债" in term:
-                        # 解析期限
-                        term_str = term.replace("中债国债收益率曲线", "").strip()
-                        result.append({
-                            "time": now,
-                            "country": "CN",
-                            "term": term_str,
-                            "yield_rate": float(row.get("收益率", 0) or 0),
-                            "change": 0,
-                            "prev_yield": 0,
-                        })
-            
-            return result
+            if df.empty:
+                return []
+
+            # 取最新一天的中债国债收益率曲线
+            df = df.loc[
+                df["日期"].eq(df["日期"].max())
+                & df["曲线名称"].str.contains("中债国债", regex=False, na=False)
+            ]
+            num = coerce_numeric(df, ["收益率"])
+
+            out = pd.DataFrame({
+                "time": datetime.now(),
+                "country": "CN",
+                # 解析期限
+                "term": df["曲线名称"].str.replace("中债国债收益率曲线", "", regex=False).str.strip(),
+                "yield_rate": num["收益率"],
+                "change": 0,
+                "prev_yield": 0,
+            })
+            return frame_to_records(out)
         except Exception as e:
             logger.error(f"Failed to get treasury yield: {e}")
             return []
@@ -61,56 +67,70 @@ class BondClient(BaseClient):
         # 获取可转债数据
         if bond_type is None or bond_type == "convertible":
             try:
-                df = ak.bond_cb_jsl()
-                
-                for _, row in df.iterrows():
-                    result.append({
-                        "time": now,
-                        "code": row.get("bond_id", ""),
-                        "name": row.get("bond_nm", ""),
-                        "bond_type": "convertible",
-                        "price": float(row.get("price", 0) or 0),
-                        "open": 0,
-                        "high": 0,
-                        "low": 0,
-                        "close": float(row.get("price", 0) or 0),
-                        "change": float(row.get("increase_rt", 0) or 0),
-                        "change_percent": float(row.get("increase_rt", 0) or 0),
-                        "ytm": float(row.get("ytm_rt", 0) or 0),
-                        "volume": float(row.get("volume", 0) or 0),
-                        "amount": float(row.get("amt", 0) or 0),
-                        "convert_premium": float(row.get("premium_rt", 0) or 0),
-                        "convert_value": float(row.get("convert_value", 0) or 0),
-                    })
+                df = ak_cache.bond_cb_jsl()
+                num = coerce_numeric(df, self._CB_NUMERIC_COLS)
+
+                out = pd.DataFrame({
+                    "time": now,
+                    "code": df.get("bond_id", ""),
+                    "name": df.get("bond_nm", ""),
+                    "bond_type": "convertible",
+                    "price": num["price"],
+                    "open": 0,
+                    "high": 0,
+                    "low": 0,
+                    "close": num["price"],
+                    "change": num["increase_rt"],
+                    "change_percent": num["increase_rt"],
+                    "ytm": num["ytm_rt"],
+                    "volume": num["volume"],
+                    "amount": num["amt"],
+                    "convert_premium": num["premium_rt"],
+                    "convert_value": num["convert_value"],
+                })
+                result.extend(frame_to_records(out))
             except Exception as e:
                 logger.error(f"Failed to get convertible bond data: {e}")
 
         # 获取国债/企业债数据
         if bond_type is None or bond_type in ["treasury", "corporate"]:
             try:
-                df = ak.bond_zh_hs_spot()
-                
-                for _, row in df.iterrows():
-                    bt = self._parse_bond_type(row.get("名称", ""))
-                    if bond_type and bt != bond_type:
-                        continue
-                    
-                    result.append({
-                        "time": now,
-                        "code": row.get("代码", ""),
-                        "name": row.get("名称", ""),
-                        "bond_type": bt,
-                        "price": float(row.get("最新价", 0) or 0),
-                        "open": float(row.get("今开", 0) or 0),
-                        "high": float(row.get("最高", 0) or 0),
-                        "low": float(row.get("最低", 0) or 0),
-                        "close": float(row.get("最新价", 0) or 0),
-                        "change": float(row.get("涨跌额", 0) or 0),
-                        "change_percent": float(row.get("涨跌幅", 0) or 0),
-                        "ytm": 0,
-                        "volume": float(row.get("成交量", 0) or 0),
-                        "amount": float(row.get("成交额", 0) or 0),
-                    })
+                df = ak_cache.bond_zh_hs_spot()
+
+                names = df["名称"].astype(str)
+                bt = pd.Series(
+                    np.select(
+                        [
+                            names.str.contains("国债", regex=False),
+                            names.str.contains("转债", regex=False),
+                        ],
+                        ["treasury", "convertible"],
+                        default="corporate",
+                    ),
+                    index=df.index,
+                )
+                if bond_type:
+                    mask = bt == bond_type
+                    df, bt = df[mask], bt[mask]
+
+                num = coerce_numeric(df, self._SPOT_NUMERIC_COLS)
+                out = pd.DataFrame({
+                    "time": now,
+                    "code": df.get("代码", ""),
+                    "name": df.get("名称", ""),
+                    "bond_type": bt,
+                    "price": num["最新价"],
+                    "open": num["今开"],
+                    "high": num["最高"],
+                    "low": num["最低"],
+                    "close": num["最新价"],
+                    "change": num["涨跌额"],
+                    "change_percent": num["涨跌幅"],
+                    "ytm": 0,
+                    "volume": num["成交量"],
+                    "amount": num["成交额"],
+                })
+                result.extend(frame_to_records(out))
             except Exception as e:
                 logger.error(f"Failed to get bond spot data: {e}")
 
@@ -120,31 +140,22 @@ class BondClient(BaseClient):
         """搜索债券"""
         try:
             # 搜索可转债
-            df = ak.bond_cb_jsl()
+            df = ak_cache.bond_cb_jsl()
             
             mask = df["bond_id"].str.contains(keyword, na=False) | \
                    df["bond_nm"].str.contains(keyword, na=False)
             df = df[mask].head(20)
-            
-            return [
-                {
-                    "code": row["bond_id"],
-                    "name": row["bond_nm"],
-                    "bond_type": "convertible",
-                    "price": float(row.get("price", 0) or 0),
-                    "change_percent": float(row.get("increase_rt", 0) or 0),
-                }
-                for _, row in df.iterrows()
-            ]
+
+            num = coerce_numeric(df, ["price", "increase_rt"])
+            out = pd.DataFrame({
+                "code": df["bond_id"],
+                "name": df["bond_nm"],
+                "bond_type": "convertible",
+                "price": num["price"],
+                "change_percent": num["increase_rt"],
+            })
+            return frame_to_records(out)
         except Exception as e:
             logger.error(f"Failed to search bond: {e}")
             return []
 
-    def _parse_bond_type(self, name: str) -> str:
-        """解析债券类型"""
-        if "国债" in name:
-            return "treasury"
-        elif "转债" in name:
-            return "convertible"
-        else:
-            return "corporate"
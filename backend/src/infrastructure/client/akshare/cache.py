@@ -0,0 +1,114 @@
+"""
+AKShare 接口进程内短时缓存
+
+对远程抓取开销较大的 AKShare 接口做一层 TTL 缓存，同一进程内短时间的重复请求
+只触发一次上游 HTTP 请求和 DataFrame 构建。
+
+注意：缓存返回的是同一个 DataFrame 对象，调用方不要原地修改。
+"""
+
+import threading
+from functools import partial
+
+import akshare as ak
+from cachetools import TTLCache, cached
+from cachetools.keys import hashkey
+from src.config import CACHE_TTL_DAILY, CACHE_TTL_REALTIME
+from src.infrastructure.client.akshare.frame import safe_float_array
+
+# 所有接口共享一个缓存，键中带上接口名和参数
+_ttl_cache = TTLCache(maxsize=128, ttl=CACHE_TTL_REALTIME)
+_ttl_lock = threading.Lock()
+
+
+# 日线类接口（盘中只有最后一根 K 线在变）用更长的 TTL
+_daily_cache = TTLCache(maxsize=64, ttl=CACHE_TTL_DAILY)
+_daily_lock = threading.Lock()
+
+
+def _ttl_cached(name: str):
+    """按接口名 + 参数缓存结果"""
+    return cached(_ttl_cache, key=partial(hashkey, name), lock=_ttl_lock)
+
+
+def _daily_cached(name: str):
+    """按接口名 + 参数缓存日线结果"""
+    return cached(_daily_cache, key=partial(hashkey, name), lock=_daily_lock)
+
+
+# ==================== 债券 ====================
+
+
+@_ttl_cached("bond_cb_jsl")
+def bond_cb_jsl():
+    """可转债实时行情（集思录）"""
+    return ak.bond_cb_jsl()
+
+
+@_ttl_cached("bond_zh_hs_spot")
+def bond_zh_hs_spot():
+    """沪深债券实时行情"""
+    return ak.bond_zh_hs_spot()
+
+
+# ==================== 外汇 ====================
+
+
+@_ttl_cached("fx_spot_quote")
+def fx_spot_quote():
+    """人民币外汇即期报价"""
+    return ak.fx_spot_quote()
+
+
+@_ttl_cached("fx_hist_em")
+def fx_hist_em(symbol: str):
+    """外汇历史行情（东方财富）"""
+    return ak.fx_hist_em(symbol=symbol)
+
+
+# ==================== 期货 ====================
+
+
+@_ttl_cached("futures_main_sina")
+def futures_main_sina(symbol: str):
+    """
+    期货主力连续合约行情（新浪），期货与黄金客户端共用
+    首列（日期）之外的行情列在入缓存前统一转为 float64，命中缓存时不必再逐格解析
+    """
+    df = ak.futures_main_sina(symbol=symbol)
+    if df is None or df.empty:
+        return df
+    return df.assign(**{col: safe_float_array(df[col]) for col in df.columns[1:]})
+
+
+# ==================== 指数 ====================
+
+
+@_ttl_cached("stock_zh_index_spot_em")
+def stock_zh_index_spot_em():
+    """A股指数实时行情（东方财富），各指数共用一次拉取"""
+    return ak.stock_zh_index_spot_em()
+
+
+@_ttl_cached("stock_hk_index_spot_sina")
+def stock_hk_index_spot_sina():
+    """港股指数实时行情（新浪），各指数共用一次拉取"""
+    return ak.stock_hk_index_spot_sina()
+
+
+@_daily_cached("stock_zh_index_daily")
+def stock_zh_index_daily(symbol: str):
+    """A股指数日线"""
+    return ak.stock_zh_index_daily(symbol=symbol)
+
+
+@_daily_cached("stock_hk_index_daily_sina")
+def stock_hk_index_daily_sina(symbol: str):
+    """港股指数日线（新浪）"""
+    return ak.stock_hk_index_daily_sina(symbol=symbol)
+
+
+@_daily_cached("index_us_stock_sina")
+def index_us_stock_sina(symbol: str):
+    """美股指数日线（新浪）"""
+    return ak.index_us_stock_sina(symbol=symbol)
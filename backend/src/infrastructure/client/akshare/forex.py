@@ -6,7 +6,11 @@ from datetime import datetime
 from typing import Any, Dict, List
 
 import akshare as ak
+import numpy as np
+import pandas as pd
 
+from src.infrastructure.client.akshare import cache as ak_cache
+from src.infrastructure.client.akshare.frame import coerce_numeric, frame_to_records
 from src.infrastructure.client.base import BaseClient
 
 logger = logging.getLogger(__name__)
@@ -36,6 +40,13 @@ class ForexClient(BaseClient):
         "GBP/JPY": {"name": "英镑/日元", "category": "cross"},
     }
 
+    # 货币对 -> 名称/分类，供整列 map 使用
+    _PAIR_NAMES = {code: info["name"] for code, info in FOREX_PAIRS.items()}
+    _PAIR_CATEGORIES = {code: info["category"] for code, info in FOREX_PAIRS.items()}
+
+    # 即期报价中需要转为数值的列
+    _SPOT_NUMERIC_COLS = ["最新价", "昨收价", "今开价", "最高价", "最低价", "买入价", "卖出价"]
+
     async def request(self, *args, **kwargs) -> Any:
         pass
 
@@ -49,37 +60,37 @@ class ForexClient(BaseClient):
 
         try:
             # 获取外汇实时行情
-            df = ak.fx_spot_quote()
-            
-            for _, row in df.iterrows():
-                code = row.get("货币对", "")
-                pair_info = self.FOREX_PAIRS.get(code, {})
-                
-                cat = pair_info.get("category", "other")
-                if category and cat != category:
-                    continue
-                
-                price = float(row.get("最新价", 0) or 0)
-                prev_close = float(row.get("昨收价", 0) or 0)
-                change = price - prev_close if prev_close else 0
-                change_percent = (change / prev_close * 100) if prev_close else 0
-                
-                result.append({
-                    "time": now,
-                    "code": code,
-                    "name": pair_info.get("name", code),
-                    "category": cat,
-                    "price": price,
-                    "open": float(row.get("今开价", 0) or 0),
-                    "high": float(row.get("最高价", 0) or 0),
-                    "low": float(row.get("最低价", 0) or 0),
-                    "close": price,
-                    "change": change,
-                    "change_percent": change_percent,
-                    "bid": float(row.get("买入价", 0) or 0),
-                    "ask": float(row.get("卖出价", 0) or 0),
-                    "spread": 0,
-                })
+            df = ak_cache.fx_spot_quote()
+
+            codes = df["货币对"]
+            cats = codes.map(self._PAIR_CATEGORIES).fillna("other")
+            if category:
+                mask = cats == category
+                df, codes, cats = df[mask], codes[mask], cats[mask]
+
+            num = coerce_numeric(df, self._SPOT_NUMERIC_COLS)
+            price = num["最新价"]
+            prev_close = num["昨收价"].replace(0, np.nan)
+            change = (price - prev_close).fillna(0)
+            change_percent = (change / prev_close * 100).fillna(0)
+
+            out = pd.DataFrame({
+                "time": now,
+                "code": codes,
+                "name": codes.map(self._PAIR_NAMES).fillna(codes),
+                "category": cats,
+                "price": price,
+                "open": num["今开价"],
+                "high": num["最高价"],
+                "low": num["最低价"],
+                "close": price,
+                "change": change,
+                "change_percent": change_percent,
+                "bid": num["买入价"],
+                "ask": num["卖出价"],
+                "spread": 0,
+            })
+            result = frame_to_records(out)
         except Exception as e:
             logger.error(f"Failed to get forex realtime: {e}")
 
@@ -96,31 +107,28 @@ class ForexClient(BaseClient):
         
         try:
             df = ak.fx_pair_quote()
-            
-            for _, row in df.iterrows():
-                code = row.get("货币对", "")
-                if code not in self.FOREX_PAIRS:
-                    continue
-                
-                pair_info = self.FOREX_PAIRS[code]
-                price = float(row.get("最新价", 0) or 0)
-                
-                result.append({
-                    "time": now,
-                    "code": code,
-                    "name": pair_info["name"],
-                    "category": pair_info["category"],
-                    "price": price,
-                    "open": 0,
-                    "high": 0,
-                    "low": 0,
-                    "close": price,
-                    "change": 0,
-                    "change_percent": 0,
-                    "bid": float(row.get("买入价", 0) or 0),
-                    "ask": float(row.get("卖出价", 0) or 0),
-                    "spread": 0,
-                })
+            df = df[df["货币对"].isin(self.FOREX_PAIRS)]
+
+            codes = df["货币对"]
+            num = coerce_numeric(df, ["最新价", "买入价", "卖出价"])
+
+            out = pd.DataFrame({
+                "time": now,
+                "code": codes,
+                "name": codes.map(self._PAIR_NAMES),
+                "category": codes.map(self._PAIR_CATEGORIES),
+                "price": num["最新价"],
+                "open": 0,
+                "high": 0,
+                "low": 0,
+                "close": num["最新价"],
+                "change": 0,
+                "change_percent": 0,
+                "bid": num["买入价"],
+                "ask": num["卖出价"],
+                "spread": 0,
+            })
+            result = frame_to_records(out)
         except Exception as e:
             logger.error(f"Failed to get BOC forex: {e}")
         
@@ -137,20 +145,18 @@ class ForexClient(BaseClient):
             # 转换货币对格式
             symbol = code.replace("/", "")
             
-            df = ak.fx_hist_em(symbol=symbol)
-            
-            result = []
-            for _, row in df.iterrows():
-                result.append({
-                    "time": row["日期"],
-                    "code": code,
-                    "open": float(row.get("开盘", 0) or 0),
-                    "high": float(row.get("最高", 0) or 0),
-                    "low": float(row.get("最低", 0) or 0),
-                    "close": float(row.get("收盘", 0) or 0),
-                })
-            
-            return result
+            df = ak_cache.fx_hist_em(symbol=symbol)
+            num = coerce_numeric(df, ["开盘", "最高", "最低", "收盘"])
+
+            out = pd.DataFrame({
+                "time": df["日期"],
+                "code": code,
+                "open": num["开盘"],
+                "high": num["最高"],
+                "low": num["最低"],
+                "close": num["收盘"],
+            })
+            return frame_to_records(out)
         except Exception as e:
             logger.error(f"Failed to get forex history for {code}: {e}")
             return []
@@ -0,0 +1,81 @@
+"""
+DataFrame 转换工具
+"""
+
+from typing import Any, Dict, Iterable, List
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+
+def frame_to_records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """
+    DataFrame 转为 List[Dict]
+    走 Arrow 的列式转换，比 to_dict(orient="records") 更快；
+    类型无法转换时回退到 pandas
+    """
+    try:
+        return pa.Table.from_pandas(df, preserve_index=False).to_pylist()
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return df.to_dict(orient="records")
+
+
+def frame_to_record_batch(df: pd.DataFrame) -> Any:
+    """DataFrame 转为 Arrow RecordBatch（列式，不产生逐行 dict）"""
+    return pa.RecordBatch.from_pandas(df, preserve_index=False)
+
+
+def _to_float_array(values: pd.Series, default: float = 0.0) -> np.ndarray:
+    """
+    整列转为 float64 数组，空值或无法解析时填充 default
+    已是数值类型的列直接取底层数组，跳过 to_numeric 的类型推断
+    """
+    if pd.api.types.is_numeric_dtype(values):
+        arr = values.to_numpy(dtype=np.float64, na_value=np.nan)
+    else:
+        arr = pd.to_numeric(values, errors="coerce").to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
+    return np.where(np.isnan(arr), default, arr)
+
+
+def coerce_numeric(
+    df: pd.DataFrame, cols: Iterable[str], default: float = 0.0
+) -> pd.DataFrame:
+    """
+    按整列将指定列转为 float64，返回只包含这些列的新 DataFrame（不修改原 df）
+    列不存在、值无法解析或为空时都填充 default
+    """
+    return pd.DataFrame(
+        {
+            col: (
+                _to_float_array(df[col], default)
+                if col in df.columns
+                else np.full(len(df), default)
+            )
+            for col in cols
+        },
+        index=df.index,
+    )
+
+
+def safe_float(val: Any) -> float:
+    """单个值转 float，去掉 % 和千分位逗号；空值、"-" 或无法解析时返回 0.0"""
+    try:
+        if val is None or val == "" or val == "-":
+            return 0.0
+        return float(str(val).replace("%", "").replace(",", ""))
+    except (ValueError, TypeError):
+        return 0.0
+
+
+def safe_float_array(values: pd.Series) -> np.ndarray:
+    """safe_float 的整列版本，返回 float64 数组"""
+    if not pd.api.types.is_numeric_dtype(values):
+        values = (
+            values.astype(str)
+            .str.replace("%", "", regex=False)
+            .str.replace(",", "", regex=False)
+        )
+    return _to_float_array(values)
@@ -2,22 +2,136 @@
 基金数据客户端 - 使用 AKShare
 """
 
+import asyncio
 import logging
+import os
+import re
+import threading
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import akshare as ak
+import numpy as np
+import pandas as pd
+from src.config import CACHE_TTL_DISK, DISK_CACHE_DIR
+from src.infrastructure.client.akshare.frame import coerce_numeric, frame_to_records
 from src.infrastructure.client.base import BaseClient
 
 logger = logging.getLogger(__name__)
 
+# 基金名称 -> 基金类型的推断规则，按顺序匹配
+# 匹配对象为转成大写后的名称，因此 ETF/LOF/QDII 不区分大小写
+_FUND_TYPE_RULES = [
+    # 指数型（优先判断，因为 ETF/LOF 可能包含其他关键词）
+    (re.compile(r"ETF|LOF|指数"), "指数型"),
+    (re.compile(r"QDII|美元|美国|纳斯达克|标普"), "QDII"),
+    (re.compile(r"债|利率|信用"), "债券型"),
+    (re.compile(r"混合|配置|平衡|灵活"), "混合型"),
+    (re.compile(r"股票|成长|价值|蓝筹"), "股票型"),
+]
+
+# ETF 名称 -> ETF 类型的推断规则，按顺序匹配
+_ETF_TYPE_RULES = [
+    (
+        re.compile("|".join(["纳斯达克", "标普", "日经", "恒生", "德国", "法国", "港股", "美国", "日本"])),
+        "跨境ETF",
+    ),
+    (re.compile("|".join(["黄金", "白银", "原油", "豆粕", "有色", "能源化工"])), "商品ETF"),
+    (re.compile("|".join(["国债", "企债", "信用债", "可转债", "利率"])), "债券ETF"),
+    (
+        re.compile(
+            "|".join([
+                "银行", "证券", "保险", "金融", "地产", "房地产",
+                "医药", "医疗", "生物", "芯片", "半导体", "科技", "通信", "5G",
+                "新能源", "光伏", "电池", "汽车", "军工", "国防",
+                "消费", "食品", "白酒", "家电", "农业", "畜牧",
+                "传媒", "游戏", "互联网", "软件", "计算机",
+                "钢铁", "煤炭", "有色", "化工", "建材", "机械",
+            ])
+        ),
+        "行业ETF",
+    ),
+    (
+        re.compile("|".join(["沪深300", "中证500", "中证1000", "上证50", "创业板", "科创", "深证", "上证"])),
+        "宽基ETF",
+    ),
+]
+
 
 class FundClient(BaseClient):
     """基金数据客户端"""
 
-    async def request(self, *args, **kwargs) -> Any:
-        pass
+    # 开放式基金排行榜数值列 -> 输出字段
+    _RANK_NUMERIC_FIELDS = {
+        "单位净值": "nav",
+        "累计净值": "acc_nav",
+        "日增长率": "change_percent",
+        "近1周": "return_1w",
+        "近1月": "return_1m",
+        "近3月": "return_3m",
+        "近6月": "return_6m",
+        "近1年": "return_1y",
+        "今年来": "return_ytd",
+    }
+
+    # 基金净值走势数值列
+    _NAV_HISTORY_NUMERIC_COLS = ("单位净值", "累计净值", "日增长率")
+
+    # ETF 历史行情数值列 -> 输出字段
+    _ETF_HISTORY_NUMERIC_FIELDS = {
+        "开盘": "open",
+        "收盘": "close",
+        "最高": "high",
+        "最低": "low",
+        "成交量": "volume",
+        "成交额": "amount",
+        "涨跌幅": "change_percent",
+        "换手率": "turnover",
+    }
+
+    # 开放式基金排行榜原始数据缓存
+    _rank_df_cache: Optional[pd.DataFrame] = None
+    _rank_df_cache_time: float = 0
+    _RANK_DF_CACHE_TTL = 60  # 缓存 1 分钟
+    _rank_df_lock = threading.Lock()
+
+    # 共享 IO 线程池，用于并发执行互不依赖的 AKShare 请求
+    _io_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="fund-io")
+
+    async def request(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        在线程池中执行同步的客户端方法，避免 AKShare 阻塞事件循环
+        使用事件循环默认线程池，与方法内部并发请求所用的 _io_pool 分开，避免嵌套提交时互相等待
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(func, *args, **kwargs))
+
+    def _get_rank_df(self) -> pd.DataFrame:
+        """获取缓存的开放式基金排行榜 DataFrame（各方法共用，调用方不要原地修改）"""
+        now = time.time()
+
+        if (
+            FundClient._rank_df_cache is not None
+            and now - FundClient._rank_df_cache_time < self._RANK_DF_CACHE_TTL
+        ):
+            return FundClient._rank_df_cache
+
+        with FundClient._rank_df_lock:
+            now = time.time()
+            if (
+                FundClient._rank_df_cache is not None
+                and now - FundClient._rank_df_cache_time < self._RANK_DF_CACHE_TTL
+            ):
+                return FundClient._rank_df_cache
+
+            df = ak.fund_open_fund_rank_em(symbol="全部")
+            FundClient._rank_df_cache = df
+            FundClient._rank_df_cache_time = now
+            return df
 
     def get_fund_list(self, fund_type: str = None) -> List[Dict[str, Any]]:
         """
@@ -25,24 +139,14 @@ class FundClient(BaseClient):
         :param fund_type: 基金类型 (股票型/混合型/债券型/指数型/货币型/QDII)
         """
         try:
-            # 获取开放式基金实时数据
-            df = ak.fund_open_fund_rank_em(symbol="全部")
-
-            result = []
-            for _, row in df.iterrows():
-                ft = self._parse_fund_type(row.get("基金类型", ""))
-                if fund_type and ft != fund_type:
-                    continue
+            # 排行榜数据没有基金类型列，直接复用场外基金缓存中按名称推断好的类型
+            frame = self._get_otc_fund_frame()
 
-                result.append(
-                    {
-                        "code": row["基金代码"],
-                        "name": row["基金简称"],
-                        "fund_type": ft,
-                    }
-                )
+            out = frame[["code", "name", "fund_type"]]
+            if fund_type:
+                out = out[out["fund_type"] == fund_type]
 
-            return result
+            return frame_to_records(out)
         except Exception as e:
             logger.error(f"Failed to get fund list: {e}")
             return []
@@ -50,38 +154,24 @@ class FundClient(BaseClient):
     def get_fund_realtime(self, codes: List[str] = None) -> List[Dict[str, Any]]:
         """获取基金实时净值"""
         try:
-            df = ak.fund_open_fund_rank_em(symbol="全部")
+            df = self._get_rank_df()
 
             if codes:
                 df = df[df["基金代码"].isin(codes)]
 
-            result = []
-            now = datetime.now()
-
-            for _, row in df.iterrows():
-                try:
-                    result.append(
-                        {
-                            "time": now,
-                            "code": row["基金代码"],
-                            "name": row["基金简称"],
-                            "fund_type": self._parse_fund_type(row.get("基金类型", "")),
-                            "nav": float(row.get("单位净值", 0) or 0),
-                            "acc_nav": float(row.get("累计净值", 0) or 0),
-                            "change_percent": float(row.get("日增长率", 0) or 0),
-                            "return_1w": float(row.get("近1周", 0) or 0),
-                            "return_1m": float(row.get("近1月", 0) or 0),
-                            "return_3m": float(row.get("近3月", 0) or 0),
-                            "return_6m": float(row.get("近6月", 0) or 0),
-                            "return_1y": float(row.get("近1年", 0) or 0),
-                            "return_ytd": float(row.get("今年来", 0) or 0),
-                        }
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to parse fund {row.get('基金代码')}: {e}")
-                    continue
-
-            return result
+            out = pd.concat(
+                [
+                    pd.DataFrame({
+                        "time": datetime.now(),
+                        "code": df["基金代码"],
+                        "name": df["基金简称"],
+                        "fund_type": self._infer_fund_types(df["基金简称"]),
+                    }),
+                    self._rank_numeric(df),
+                ],
+                axis=1,
+            )
+            return frame_to_records(out)
         except Exception as e:
             logger.error(f"Failed to get fund realtime: {e}")
             return []
@@ -91,15 +181,23 @@ class FundClient(BaseClient):
         try:
             df = ak.fund_open_fund_info_em(symbol=code, indicator="单位净值走势")
 
+            # 数值列整列解析一次，逐行只读取已清洗的 float
+            num = coerce_numeric(df, self._NAV_HISTORY_NUMERIC_COLS)
+            if "累计净值" not in df.columns:
+                num["累计净值"] = num["单位净值"]
+            df = df.assign(**num)
+
             result = []
-            for _, row in df.iterrows():
+            for date, nav, acc_nav, change in df[
+                ["净值日期", "单位净值", "累计净值", "日增长率"]
+            ].itertuples(index=False, name=None):
                 result.append(
                     {
-                        "time": row["净值日期"],
+                        "time": date,
                         "code": code,
-                        "nav": float(row["单位净值"]),
-                        "acc_nav": float(row.get("累计净值", row["单位净值"])),
-                        "change_percent": float(row.get("日增长率", 0) or 0),
+                        "nav": nav,
+                        "acc_nav": acc_nav,
+                        "change_percent": change,
                     }
                 )
 
@@ -111,7 +209,7 @@ class FundClient(BaseClient):
     def search_fund(self, keyword: str) -> List[Dict[str, Any]]:
         """搜索基金"""
         try:
-            df = ak.fund_open_fund_rank_em(symbol="全部")
+            df = self._get_rank_df()
 
             # 按代码或名称搜索
             mask = df["基金代码"].str.contains(keyword, na=False) | df[
@@ -119,210 +217,301 @@ class FundClient(BaseClient):
             ].str.contains(keyword, na=False)
             df = df[mask].head(20)
 
-            return [
-                {
-                    "code": row["基金代码"],
-                    "name": row["基金简称"],
-                    "fund_type": self._parse_fund_type(row.get("基金类型", "")),
-                    "nav": float(row.get("单位净值", 0) or 0),
-                    "change_percent": float(row.get("日增长率", 0) or 0),
-                }
-                for _, row in df.iterrows()
-            ]
+            num = coerce_numeric(df, ["单位净值", "日增长率"])
+            out = pd.DataFrame({
+                "code": df["基金代码"],
+                "name": df["基金简称"],
+                "fund_type": self._infer_fund_types(df["基金简称"]),
+                "nav": num["单位净值"],
+                "change_percent": num["日增长率"],
+            })
+            return frame_to_records(out)
         except Exception as e:
             logger.error(f"Failed to search fund: {e}")
             return []
 
     def get_fund_type_summary(self) -> List[Dict[str, Any]]:
         """获取各类型基金的汇总统计数据"""
-        import math
-
-        def safe_float(val):
-            """安全转换为浮点数，处理 NaN 和空值"""
-            try:
-                if val is None or val == "" or val == "-":
-                    return 0.0
-                f = float(val)
-                if math.isnan(f) or math.isinf(f):
-                    return 0.0
-                return f
-            except (ValueError, TypeError):
-                return 0.0
-
         try:
-            df = ak.fund_open_fund_rank_em(symbol="全部")
+            df = self._get_rank_df()
             now = datetime.now()
 
-            # 按类型分组统计
-            type_stats = {}
-            for _, row in df.iterrows():
-                # 从基金名称推断类型（因为 API 返回数据中没有基金类型列）
-                fund_name = str(row.get("基金简称", ""))
-                fund_type = self._infer_fund_type(fund_name)
-                if fund_type == "其他":
-                    continue
-
-                change_pct = safe_float(row.get("日增长率", 0))
-
-                if fund_type not in type_stats:
-                    type_stats[fund_type] = {
-                        "total": 0,
-                        "rise": 0,
-                        "fall": 0,
-                        "flat": 0,
-                        "change_sum": 0,
-                    }
-
-                type_stats[fund_type]["total"] += 1
-                type_stats[fund_type]["change_sum"] += change_pct
-
-                if change_pct > 0:
-                    type_stats[fund_type]["rise"] += 1
-                elif change_pct < 0:
-                    type_stats[fund_type]["fall"] += 1
-                else:
-                    type_stats[fund_type]["flat"] += 1
+            # 从基金名称推断类型（因为 API 返回数据中没有基金类型列），编码为 type_order 下标
+            type_order = ["股票型", "混合型", "债券型", "指数型", "QDII"]
+            type_ids = pd.Categorical(
+                self._infer_fund_types(df["基金简称"]), categories=type_order
+            ).codes
+            change = coerce_numeric(df, ["日增长率"])["日增长率"].to_numpy()
+            change = np.where(np.isinf(change), 0.0, change)
+
+            # 按类型计数与求和（bincount 一次遍历完成分组统计）
+            valid = type_ids >= 0
+            type_ids, change = type_ids[valid], change[valid]
+            n_types = len(type_order)
+            totals = np.bincount(type_ids, minlength=n_types)
+            change_sums = np.bincount(type_ids, weights=change, minlength=n_types)
+            rises = np.bincount(type_ids[change > 0], minlength=n_types)
+            falls = np.bincount(type_ids[change < 0], minlength=n_types)
+            flats = totals - rises - falls
 
             # 计算平均值并格式化结果
             result = []
-            type_order = ["股票型", "混合型", "债券型", "指数型", "QDII"]
-
-            for fund_type in type_order:
-                if fund_type in type_stats:
-                    stats = type_stats[fund_type]
-                    avg_change = (
-                        round(stats["change_sum"] / stats["total"], 2)
-                        if stats["total"] > 0
-                        else 0
-                    )
-                    result.append(
-                        {
-                            "time": now,
-                            "code": f"FUND_{fund_type.upper()}",
-                            "name": f"{fund_type}",
-                            "fund_type": fund_type,
-                            "avg_change": avg_change,
-                            "total": stats["total"],
-                            "rise": stats["rise"],
-                            "fall": stats["fall"],
-                            "flat": stats["flat"],
-                        }
-                    )
+            for i, fund_type in enumerate(type_order):
+                total = int(totals[i])
+                if total == 0:
+                    continue
+                result.append(
+                    {
+                        "time": now,
+                        "code": f"FUND_{fund_type.upper()}",
+                        "name": f"{fund_type}",
+                        "fund_type": fund_type,
+                        "avg_change": round(float(change_sums[i]) / total, 2),
+                        "total": total,
+                        "rise": int(rises[i]),
+                        "fall": int(falls[i]),
+                        "flat": int(flats[i]),
+                    }
+                )
 
             return result
         except Exception as e:
             logger.error(f"Failed to get fund type summary: {e}")
             return []
 
-    def _parse_fund_type(self, type_str: str) -> str:
-        """解析基金类型"""
-        type_mapping = {
-            "股票型": "股票型",
-            "混合型": "混合型",
-            "债券型": "债券型",
-            "指数型": "指数型",
-            "货币型": "货币型",
-            "QDII": "QDII",
-            "FOF": "FOF",
-        }
-        for key, value in type_mapping.items():
-            if key in type_str:
-                return value
-        return "其他"
-
-    def _infer_fund_type(self, fund_name: str) -> str:
-        """从基金名称推断基金类型"""
-        name = fund_name.upper()
-
-        # 指数型（优先判断，因为 ETF/LOF 可能包含其他关键词）
-        if "ETF" in name or "LOF" in name or "指数" in fund_name:
-            return "指数型"
-
-        # QDII
-        if (
-            "QDII" in name
-            or "美元" in fund_name
-            or "美国" in fund_name
-            or "纳斯达克" in fund_name
-            or "标普" in fund_name
-        ):
-            return "QDII"
+    def _rank_numeric(self, df: pd.DataFrame) -> pd.DataFrame:
+        """排行榜数值列整列转换，并改为输出字段名"""
+        return coerce_numeric(df, self._RANK_NUMERIC_FIELDS).rename(
+            columns=self._RANK_NUMERIC_FIELDS
+        )
+
+    def _infer_fund_types(self, names: pd.Series) -> np.ndarray:
+        """按整列从基金名称推断基金类型"""
+        # 整列只转一次大写，各条规则共用
+        names = names.astype(str).str.upper()
+        return np.select(
+            [names.str.contains(pattern, na=False) for pattern, _ in _FUND_TYPE_RULES],
+            [fund_type for _, fund_type in _FUND_TYPE_RULES],
+            # 默认归类为混合型（大部分基金是混合型）
+            default="混合型",
+        )
 
-        # 债券型
-        if "债" in fund_name or "利率" in fund_name or "信用" in fund_name:
-            return "债券型"
+    # ==================== 场外基金排行榜和详情 ====================
 
-        # 混合型
-        if (
-            "混合" in fund_name
-            or "配置" in fund_name
-            or "平衡" in fund_name
-            or "灵活" in fund_name
-        ):
-            return "混合型"
+    # 场外基金列表缓存：按列存放的 DataFrame（行号即位置，数值列为 float64），
+    # Redis 中同样按列序列化，跨进程共享；进程内再做短时记忆，
+    # 记忆过期后先比对 Redis 中的版本号，数据未变时沿用同一个 DataFrame；
+    # Redis 不可用时按原有效期使用进程内数据
+    _otc_fund_cache: Optional[pd.DataFrame] = None
+    _otc_fund_cache_time = 0
+    _otc_fund_cache_version: Optional[str] = None
+    _otc_fund_memo_ttl = 0  # 当前进程内数据的记忆时长，随数据来源而定
+    _OTC_FUND_CACHE_KEY = "fund_frame:OTC"
+    _OTC_FUND_CACHE_TTL = 300  # Redis 缓存 5 分钟
+    _OTC_FUND_DISK_CACHE = "otc_fund"
+    _OTC_FUND_COLUMNS = ["code", "name", "fund_type", *_RANK_NUMERIC_FIELDS.values()]
+    _LOCAL_MEMO_TTL = 5  # 有 Redis 版本号时进程内记忆 5 秒，之后只读版本号确认数据是否更新
+    _otc_lock = threading.Lock()  # 缓存失效时只允许一个线程回源
+
+    def _load_from_redis(self, key: str) -> Optional[Any]:
+        """从 Redis 读取 msgpack 序列化的缓存"""
+        import msgpack
+        from src.infrastructure.cache.redis_cache import cache
 
-        # 股票型
-        if (
-            "股票" in fund_name
-            or "成长" in fund_name
-            or "价值" in fund_name
-            or "蓝筹" in fund_name
-        ):
-            return "股票型"
+        try:
+            cached = cache.client.get(key)
+            if cached:
+                return msgpack.unpackb(cached, raw=False)
+        except Exception as e:
+            logger.warning(f"Failed to get {key} from Redis: {e}")
+        return None
 
-        # 默认归类为混合型（大部分基金是混合型）
-        return "混合型"
+    def _get_redis_version(self, key: str) -> Optional[str]:
+        """读取缓存的版本号（随数据一起写入），不存在或读取失败时返回 None"""
+        from src.infrastructure.cache.redis_cache import cache
 
-    # ==================== 场外基金排行榜和详情 ====================
+        try:
+            version = cache.client.get(f"{key}:version")
+            if version:
+                return version.decode() if isinstance(version, bytes) else version
+        except Exception as e:
+            logger.warning(f"Failed to get {key} version from Redis: {e}")
+        return None
 
-    # 场外基金列表缓存
-    _otc_fund_cache = None
-    _otc_fund_cache_time = 0
-    _OTC_FUND_CACHE_TTL = 300  # 缓存 5 分钟
+    def _save_to_redis(self, key: str, value: Any, ttl: int) -> Optional[str]:
+        """
+        以 msgpack 序列化后写入 Redis，并写入新的版本号，返回版本号（失败时为 None）
+        先写数据再写版本号：读方先读版本号，即使与写入交错也只会多重建一次
+        """
+        import msgpack
+        from src.infrastructure.cache.redis_cache import cache
 
-    def _get_otc_fund_list_cached(self) -> List[Dict]:
-        """获取缓存的场外基金列表"""
+        version = uuid.uuid4().hex
+        try:
+            cache.client.setex(key, ttl, msgpack.packb(value, use_bin_type=True))
+            cache.client.setex(f"{key}:version", ttl, version)
+            return version
+        except Exception as e:
+            logger.warning(f"Failed to cache {key} to Redis: {e}")
+            return None
+
+    def _load_frame_from_disk(
+        self, name: str, max_age: Optional[float] = CACHE_TTL_DISK
+    ) -> Optional[pd.DataFrame]:
+        """
+        读取本地 Parquet 缓存
+        :param max_age: 文件最长有效期（秒），None 表示不检查（上游失败时兜底使用）
+        """
+        path = os.path.join(DISK_CACHE_DIR, f"{name}.parquet")
+        try:
+            if not os.path.exists(path):
+                return None
+            if max_age is not None and time.time() - os.path.getmtime(path) >= max_age:
+                return None
+            return pd.read_parquet(path)
+        except Exception as e:
+            logger.warning(f"Failed to load {name} from disk cache: {e}")
+            return None
+
+    def _save_frame_to_disk(self, name: str, frame: pd.DataFrame) -> None:
+        """写入本地 Parquet 缓存（先写临时文件再原子替换，多进程同时写也不会读到半个文件）"""
+        path = os.path.join(DISK_CACHE_DIR, f"{name}.parquet")
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(DISK_CACHE_DIR, exist_ok=True)
+            frame.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Failed to save {name} to disk cache: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _build_otc_fund_frame(self, columns: Dict[str, List]) -> pd.DataFrame:
+        """由按列数据构建场外基金 DataFrame"""
+        frame = pd.DataFrame(columns, columns=self._OTC_FUND_COLUMNS)
+        numeric_cols = list(self._RANK_NUMERIC_FIELDS.values())
+        frame[numeric_cols] = frame[numeric_cols].astype("float64").fillna(0.0)
+        return frame
+
+    def _get_otc_fund_frame(self) -> pd.DataFrame:
+        """获取缓存的场外基金列式数据（调用方不要原地修改）"""
         now = time.time()
 
         if (
             FundClient._otc_fund_cache is not None
-            and now - FundClient._otc_fund_cache_time < self._OTC_FUND_CACHE_TTL
+            and now - FundClient._otc_fund_cache_time < FundClient._otc_fund_memo_ttl
         ):
             return FundClient._otc_fund_cache
 
-        logger.info("Fetching OTC fund list from AKShare...")
-        try:
-            df = ak.fund_open_fund_rank_em(symbol="全部")
-            result = []
+        with FundClient._otc_lock:
+            # 双重检查：等待锁期间其他线程可能已经完成刷新
+            now = time.time()
+            if (
+                FundClient._otc_fund_cache is not None
+                and now - FundClient._otc_fund_cache_time < FundClient._otc_fund_memo_ttl
+            ):
+                return FundClient._otc_fund_cache
 
-            for _, row in df.iterrows():
-                fund_name = str(row.get("基金简称", ""))
-                fund_type = self._infer_fund_type(fund_name)
-
-                result.append({
-                    "code": row["基金代码"],
-                    "name": fund_name,
-                    "fund_type": fund_type,
-                    "nav": float(row.get("单位净值", 0) or 0),
-                    "acc_nav": float(row.get("累计净值", 0) or 0),
-                    "change_percent": float(row.get("日增长率", 0) or 0),
-                    "return_1w": float(row.get("近1周", 0) or 0),
-                    "return_1m": float(row.get("近1月", 0) or 0),
-                    "return_3m": float(row.get("近3月", 0) or 0),
-                    "return_6m": float(row.get("近6月", 0) or 0),
-                    "return_1y": float(row.get("近1年", 0) or 0),
-                    "return_ytd": float(row.get("今年来", 0) or 0),
-                })
-
-            FundClient._otc_fund_cache = result
-            FundClient._otc_fund_cache_time = now
-            logger.info(f"OTC fund list cached: {len(result)} funds")
-            return result
-        except Exception as e:
-            logger.error(f"Failed to fetch OTC fund list: {e}")
-            if FundClient._otc_fund_cache is not None:
+            # Redis 数据未更新时沿用进程内的 DataFrame，代码索引和排序结果也随之保留
+            version = self._get_redis_version(self._OTC_FUND_CACHE_KEY)
+            if (
+                version is not None
+                and version == FundClient._otc_fund_cache_version
+                and FundClient._otc_fund_cache is not None
+            ):
+                FundClient._otc_fund_cache_time = now
+                FundClient._otc_fund_memo_ttl = self._LOCAL_MEMO_TTL
                 return FundClient._otc_fund_cache
-            return []
+
+            cached = self._load_from_redis(self._OTC_FUND_CACHE_KEY)
+            if cached is not None:
+                frame = self._build_otc_fund_frame(cached)
+                FundClient._otc_fund_cache = frame
+                FundClient._otc_fund_cache_time = now
+                FundClient._otc_fund_cache_version = version
+                FundClient._otc_fund_memo_ttl = (
+                    self._LOCAL_MEMO_TTL if version is not None else self._OTC_FUND_CACHE_TTL
+                )
+                return frame
+
+            # Redis 不可用或无数据：进程内数据未超过原有效期时继续使用，不再每 5 秒回源
+            if (
+                FundClient._otc_fund_cache is not None
+                and now - FundClient._otc_fund_cache_time < self._OTC_FUND_CACHE_TTL
+            ):
+                FundClient._otc_fund_memo_ttl = self._OTC_FUND_CACHE_TTL
+                return FundClient._otc_fund_cache
+
+            # 进程刚启动且 Redis 无数据时，先用本地磁盘缓存
+            if FundClient._otc_fund_cache is None:
+                frame = self._load_frame_from_disk(self._OTC_FUND_DISK_CACHE)
+                if frame is not None:
+                    logger.info(f"OTC fund list loaded from disk cache: {len(frame)} funds")
+                    FundClient._otc_fund_cache = frame
+                    FundClient._otc_fund_cache_time = now
+                    FundClient._otc_fund_cache_version = None
+                    FundClient._otc_fund_memo_ttl = self._OTC_FUND_CACHE_TTL
+                    return frame
+
+            logger.info("Fetching OTC fund list from AKShare...")
+            try:
+                df = self._get_rank_df()
+                names = df["基金简称"].astype(str)
+
+                frame = pd.concat(
+                    [
+                        pd.DataFrame({
+                            "code": df["基金代码"],
+                            "name": names,
+                            "fund_type": self._infer_fund_types(names),
+                        }),
+                        self._rank_numeric(df),
+                    ],
+                    axis=1,
+                ).reset_index(drop=True)
+
+                FundClient._otc_fund_cache = frame
+                FundClient._otc_fund_cache_time = now
+                FundClient._otc_fund_cache_version = self._save_to_redis(
+                    self._OTC_FUND_CACHE_KEY,
+                    frame.to_dict(orient="list"),
+                    self._OTC_FUND_CACHE_TTL,
+                )
+                FundClient._otc_fund_memo_ttl = (
+                    self._LOCAL_MEMO_TTL
+                    if FundClient._otc_fund_cache_version is not None
+                    else self._OTC_FUND_CACHE_TTL
+                )
+                self._save_frame_to_disk(self._OTC_FUND_DISK_CACHE, frame)
+                logger.info(f"OTC fund list cached: {len(frame)} funds")
+                return frame
+            except Exception as e:
+                logger.error(f"Failed to fetch OTC fund list: {e}")
+                if FundClient._otc_fund_cache is not None:
+                    return FundClient._otc_fund_cache
+                # 兜底：使用已过期的磁盘缓存
+                frame = self._load_frame_from_disk(self._OTC_FUND_DISK_CACHE, max_age=None)
+                if frame is not None:
+                    return frame
+                return self._build_otc_fund_frame({})
+
+    # 场外基金代码索引：(构建索引时的 DataFrame, {code: 行号})，数据刷新后重建
+    _otc_fund_index: Tuple[Optional[pd.DataFrame], Dict[str, int]] = (None, {})
+
+    def _get_otc_by_codes(self, codes: List[str]) -> Dict[str, Dict]:
+        """按代码批量获取场外基金（O(1) 定位行号，只生成命中的行）"""
+        frame = self._get_otc_fund_frame()
+        src, index = FundClient._otc_fund_index
+        if src is not frame:
+            index = dict(zip(frame["code"], range(len(frame))))
+            FundClient._otc_fund_index = (frame, index)
+
+        positions = [index[code] for code in codes if code in index]
+        return {fund["code"]: fund for fund in frame_to_records(frame.iloc[positions])}
+
+    def _get_otc_by_code(self, code: str) -> Optional[Dict]:
+        """按代码获取场外基金"""
+        return self._get_otc_by_codes([code]).get(code)
 
     def get_fund_ranking(
         self,
@@ -336,31 +525,60 @@ class FundClient(BaseClient):
         :param sort_by: 排序字段（return_1w/return_1m/return_3m/return_6m/return_1y/return_ytd）
         :param limit: 返回数量
         """
-        funds = self._get_otc_fund_list_cached()
-
-        # 按类型过滤
-        if fund_type and fund_type != "全部":
-            funds = [f for f in funds if f["fund_type"] == fund_type]
+        frame = self._get_otc_fund_frame()
 
-        # 排序（降序）
         valid_sort_fields = ["return_1w", "return_1m", "return_3m", "return_6m", "return_1y", "return_ytd", "change_percent"]
         if sort_by not in valid_sort_fields:
             sort_by = "return_1y"
 
-        funds = sorted(funds, key=lambda x: x.get(sort_by, 0) or 0, reverse=True)
+        if limit <= 0:
+            return []
+
+        # 按类型过滤并排序（降序）
+        order = self._get_ranking_order(frame, fund_type, sort_by)
+        return frame_to_records(frame.iloc[order[:limit]])
 
-        return funds[:limit]
+    # 排行榜排序结果：(构建时的 DataFrame, {(fund_type, sort_by): 行号数组})，数据刷新后重建
+    _otc_fund_rankings: Tuple[
+        Optional[pd.DataFrame], Dict[Tuple[str, str], np.ndarray]
+    ] = (None, {})
+
+    def _get_ranking_order(
+        self, frame: pd.DataFrame, fund_type: Optional[str], sort_by: str
+    ) -> np.ndarray:
+        """
+        获取指定类型、排序字段下的全部行号（降序），每份数据每种组合只排序一次
+        同值时按原始顺序排列，与稳定排序结果一致
+        """
+        src, rankings = FundClient._otc_fund_rankings
+        if src is not frame:
+            rankings = {}
+            FundClient._otc_fund_rankings = (frame, rankings)
+
+        key = (fund_type if fund_type and fund_type != "全部" else "全部", sort_by)
+        order = rankings.get(key)
+        if order is None:
+            if key[0] == "全部":
+                positions = np.arange(len(frame))
+            else:
+                positions = np.flatnonzero(frame["fund_type"].to_numpy() == key[0])
+            values = frame[sort_by].to_numpy()[positions]
+            order = positions[np.argsort(-values, kind="stable")]
+            rankings[key] = order
+        return order
 
     def get_fund_detail(self, code: str) -> Optional[Dict[str, Any]]:
         """获取基金详情"""
+        # 基本信息与场外基金列表互不依赖，并发获取
+        info_future = self._io_pool.submit(ak.fund_individual_basic_info_xq, symbol=code)
+        realtime_future = self._io_pool.submit(self._get_otc_by_code, code)
         try:
             # 基本信息
-            df = ak.fund_individual_basic_info_xq(symbol=code)
-            info = {row["item"]: row["value"] for _, row in df.iterrows()}
+            df = info_future.result()
+            info = dict(zip(df["item"], df["value"]))
 
             # 从缓存获取实时数据
-            funds = self._get_otc_fund_list_cached()
-            realtime = next((f for f in funds if f["code"] == code), {})
+            realtime = realtime_future.result() or {}
 
             result = {
                 "code": code,
@@ -391,117 +609,206 @@ class FundClient(BaseClient):
         except Exception as e:
             logger.error(f"Failed to get fund detail for {code}: {e}")
             # 退而求其次，返回缓存中的数据
-            funds = self._get_otc_fund_list_cached()
-            fund = next((f for f in funds if f["code"] == code), None)
-            return fund
+            return self._get_otc_by_code(code)
+
+    # 场外基金小写代码列：(构建时的 DataFrame, Series)，供搜索使用，数据刷新后重建
+    _otc_fund_codes_lower: Tuple[Optional[pd.DataFrame], Optional[pd.Series]] = (None, None)
 
     def search_otc_fund(self, keyword: str) -> List[Dict[str, Any]]:
         """搜索场外基金（使用缓存）"""
-        funds = self._get_otc_fund_list_cached()
-
-        results = []
-        keyword_lower = keyword.lower()
-
-        for fund in funds:
-            code = fund.get("code", "")
-            name = fund.get("name", "")
-
-            if keyword_lower in code.lower() or keyword in name:
-                results.append(fund)
-                if len(results) >= 20:
-                    break
-
-        return results
+        frame = self._get_otc_fund_frame()
+        src, codes_lower = FundClient._otc_fund_codes_lower
+        if src is not frame:
+            codes_lower = frame["code"].astype(str).str.lower()
+            FundClient._otc_fund_codes_lower = (frame, codes_lower)
+
+        positions = self._match_code_or_name(codes_lower, frame["name"], keyword)
+        return frame_to_records(frame.iloc[positions])
+
+    @staticmethod
+    def _match_code_or_name(
+        codes_lower: pd.Series, names: pd.Series, keyword: str, limit: int = 20
+    ) -> np.ndarray:
+        """
+        按整列匹配代码（不区分大小写）或名称包含关键字，返回前 limit 个命中的行号
+        :param codes_lower: 已转为小写的代码列（随缓存预先计算，避免每次搜索都转换）
+        """
+        mask = codes_lower.str.contains(
+            keyword.lower(), regex=False, na=False
+        ) | names.astype(str).str.contains(keyword, regex=False, na=False)
+        return np.flatnonzero(mask.to_numpy())[:limit]
 
     # ==================== 场内基金（ETF）相关方法 ====================
 
-    # ETF 列表缓存
+    # ETF 列表缓存（Redis 跨进程共享，进程内再做短时记忆，数据版本未变时沿用同一个列表；
+    # Redis 不可用时按原有效期使用进程内数据）
     _etf_list_cache = None
     _etf_list_cache_time = 0
-    _ETF_LIST_CACHE_TTL = 3600  # 缓存 1 小时
+    _etf_list_cache_version: Optional[str] = None
+    _etf_list_memo_ttl = 0  # 当前进程内数据的记忆时长，随数据来源而定
+    _ETF_LIST_CACHE_KEY = "fund_list:ETF"
+    _ETF_LIST_CACHE_TTL = 3600  # Redis 缓存 1 小时
+    _ETF_LIST_DISK_CACHE = "etf_list"
+    _etf_lock = threading.Lock()
+
+    # 新浪 ETF 行情数值列 -> 输出字段
+    _ETF_NUMERIC_FIELDS = {
+        "最新价": "price",
+        "涨跌额": "change",
+        "涨跌幅": "change_percent",
+        "今开": "open",
+        "最高": "high",
+        "最低": "low",
+        "昨收": "prev_close",
+        "成交量": "volume",
+        "成交额": "amount",
+    }
 
     def _get_etf_list_cached(self) -> List[Dict]:
         """获取缓存的 ETF 列表（使用新浪全量数据）"""
-        import time
-
         now = time.time()
 
-        # 检查缓存是否有效
+        # 检查进程内缓存是否有效
         if (
             FundClient._etf_list_cache is not None
-            and now - FundClient._etf_list_cache_time < self._ETF_LIST_CACHE_TTL
+            and now - FundClient._etf_list_cache_time < FundClient._etf_list_memo_ttl
         ):
             logger.debug("Using cached ETF list")
             return FundClient._etf_list_cache
 
-        logger.info("Fetching ETF list from AKShare...")
-        try:
-            df = ak.fund_etf_category_sina(symbol="ETF基金")
-            result = []
-            for _, row in df.iterrows():
-                code = str(row.get("代码", ""))
-                # 去掉前缀 (sh/sz)
-                if code.startswith("sh") or code.startswith("sz"):
-                    code = code[2:]
-
-                result.append({
-                    "code": code,
-                    "name": row.get("名称", ""),
-                    "price": float(row.get("最新价", 0) or 0),
-                    "change": float(row.get("涨跌额", 0) or 0),
-                    "change_percent": float(row.get("涨跌幅", 0) or 0),
-                    "open": float(row.get("今开", 0) or 0),
-                    "high": float(row.get("最高", 0) or 0),
-                    "low": float(row.get("最低", 0) or 0),
-                    "prev_close": float(row.get("昨收", 0) or 0),
-                    "volume": int(float(row.get("成交量", 0) or 0)),
-                    "amount": float(row.get("成交额", 0) or 0),
-                    "etf_type": self._infer_etf_type(row.get("名称", "")),
-                })
-
-            FundClient._etf_list_cache = result
-            FundClient._etf_list_cache_time = now
-            logger.info(f"ETF list cached: {len(result)} ETFs")
-            return result
-        except Exception as e:
-            logger.error(f"Failed to fetch ETF list: {e}")
-            if FundClient._etf_list_cache is not None:
+        with FundClient._etf_lock:
+            # 双重检查：等待锁期间其他线程可能已经完成刷新
+            now = time.time()
+            if (
+                FundClient._etf_list_cache is not None
+                and now - FundClient._etf_list_cache_time < FundClient._etf_list_memo_ttl
+            ):
                 return FundClient._etf_list_cache
-            return []
 
-    def _infer_etf_type(self, name: str) -> str:
-        """从 ETF 名称推断类型"""
-        name_upper = name.upper()
-
-        # 跨境 ETF
-        if any(k in name for k in ["纳斯达克", "标普", "日经", "恒生", "德国", "法国", "港股", "美国", "日本"]):
-            return "跨境ETF"
-
-        # 商品 ETF
-        if any(k in name for k in ["黄金", "白银", "原油", "豆粕", "有色", "能源化工"]):
-            return "商品ETF"
-
-        # 债券 ETF
-        if any(k in name for k in ["国债", "企债", "信用债", "可转债", "利率"]):
-            return "债券ETF"
-
-        # 行业 ETF
-        industry_keywords = [
-            "银行", "证券", "保险", "金融", "地产", "房地产",
-            "医药", "医疗", "生物", "芯片", "半导体", "科技", "通信", "5G",
-            "新能源", "光伏", "电池", "汽车", "军工", "国防",
-            "消费", "食品", "白酒", "家电", "农业", "畜牧",
-            "传媒", "游戏", "互联网", "软件", "计算机",
-            "钢铁", "煤炭", "有色", "化工", "建材", "机械",
-        ]
-        if any(k in name for k in industry_keywords):
-            return "行业ETF"
+            # Redis 数据未更新时沿用进程内的列表，代码索引也随之保留
+            version = self._get_redis_version(self._ETF_LIST_CACHE_KEY)
+            if (
+                version is not None
+                and version == FundClient._etf_list_cache_version
+                and FundClient._etf_list_cache is not None
+            ):
+                FundClient._etf_list_cache_time = now
+                FundClient._etf_list_memo_ttl = self._LOCAL_MEMO_TTL
+                return FundClient._etf_list_cache
 
-        # 宽基 ETF
-        if any(k in name for k in ["沪深300", "中证500", "中证1000", "上证50", "创业板", "科创", "深证", "上证"]):
-            return "宽基ETF"
+            cached = self._load_from_redis(self._ETF_LIST_CACHE_KEY)
+            if cached is not None:
+                FundClient._etf_list_cache = cached
+                FundClient._etf_list_cache_time = now
+                FundClient._etf_list_cache_version = version
+                FundClient._etf_list_memo_ttl = (
+                    self._LOCAL_MEMO_TTL if version is not None else self._ETF_LIST_CACHE_TTL
+                )
+                return cached
+
+            # Redis 不可用或无数据：进程内数据未超过原有效期时继续使用，不再每 5 秒回源
+            if (
+                FundClient._etf_list_cache is not None
+                and now - FundClient._etf_list_cache_time < self._ETF_LIST_CACHE_TTL
+            ):
+                FundClient._etf_list_memo_ttl = self._ETF_LIST_CACHE_TTL
+                return FundClient._etf_list_cache
+
+            # 进程刚启动且 Redis 无数据时，先用本地磁盘缓存
+            if FundClient._etf_list_cache is None:
+                frame = self._load_frame_from_disk(self._ETF_LIST_DISK_CACHE)
+                if frame is not None:
+                    result = frame_to_records(frame)
+                    logger.info(f"ETF list loaded from disk cache: {len(result)} ETFs")
+                    FundClient._etf_list_cache = result
+                    FundClient._etf_list_cache_time = now
+                    FundClient._etf_list_cache_version = None
+                    FundClient._etf_list_memo_ttl = self._ETF_LIST_CACHE_TTL
+                    return result
+
+            logger.info("Fetching ETF list from AKShare...")
+            try:
+                df = ak.fund_etf_category_sina(symbol="ETF基金")
+                names = df["名称"].astype(str)
+                numeric = coerce_numeric(df, self._ETF_NUMERIC_FIELDS).rename(
+                    columns=self._ETF_NUMERIC_FIELDS
+                )
+                # 成交量为整数，截断小数部分
+                numeric["volume"] = numeric["volume"].astype("int64")
+
+                out = pd.concat(
+                    [
+                        pd.DataFrame({
+                            # 去掉前缀 (sh/sz)
+                            "code": df["代码"].astype(str).str.replace(r"^s[hz]", "", regex=True),
+                            "name": names,
+                        }),
+                        numeric,
+                        pd.DataFrame({"etf_type": self._infer_etf_types(names)}, index=df.index),
+                    ],
+                    axis=1,
+                )
+                result = frame_to_records(out)
 
-        return "其他ETF"
+                FundClient._etf_list_cache = result
+                FundClient._etf_list_cache_time = now
+                FundClient._etf_list_cache_version = self._save_to_redis(
+                    self._ETF_LIST_CACHE_KEY, result, self._ETF_LIST_CACHE_TTL
+                )
+                FundClient._etf_list_memo_ttl = (
+                    self._LOCAL_MEMO_TTL
+                    if FundClient._etf_list_cache_version is not None
+                    else self._ETF_LIST_CACHE_TTL
+                )
+                self._save_frame_to_disk(self._ETF_LIST_DISK_CACHE, out)
+                logger.info(f"ETF list cached: {len(result)} ETFs")
+                return result
+            except Exception as e:
+                logger.error(f"Failed to fetch ETF list: {e}")
+                if FundClient._etf_list_cache is not None:
+                    return FundClient._etf_list_cache
+                # 兜底：使用已过期的磁盘缓存
+                frame = self._load_frame_from_disk(self._ETF_LIST_DISK_CACHE, max_age=None)
+                if frame is not None:
+                    return frame_to_records(frame)
+                return []
+
+    # ETF 代码索引：(构建索引时的列表, {code: etf})，列表刷新后重建
+    _etf_list_index: Tuple[Optional[List[Dict]], Dict[str, Dict]] = (None, {})
+
+    def _get_etf_by_code(self, code: str) -> Optional[Dict]:
+        """按代码获取 ETF（O(1) 查找）"""
+        etf_list = self._get_etf_list_cached()
+        src, index = FundClient._etf_list_index
+        if src is not etf_list:
+            index = {etf["code"]: etf for etf in etf_list}
+            FundClient._etf_list_index = (etf_list, index)
+        return index.get(code)
+
+    # ETF 列式数据：(构建时的列表, DataFrame[code_lower, name])，供搜索按列匹配，列表刷新后重建
+    _etf_list_frame: Tuple[Optional[List[Dict]], Optional[pd.DataFrame]] = (None, None)
+
+    def _get_etf_frame(self) -> Tuple[List[Dict], pd.DataFrame]:
+        """获取 ETF 列表及其小写代码、名称列"""
+        etf_list = self._get_etf_list_cached()
+        src, frame = FundClient._etf_list_frame
+        if src is not etf_list:
+            frame = pd.DataFrame(etf_list, columns=["code", "name"])
+            frame = pd.DataFrame({
+                "code_lower": frame["code"].astype(str).str.lower(),
+                "name": frame["name"],
+            })
+            FundClient._etf_list_frame = (etf_list, frame)
+        return etf_list, frame
+
+    def _infer_etf_types(self, names: pd.Series) -> np.ndarray:
+        """按整列从 ETF 名称推断类型"""
+        names = names.astype(str)
+        return np.select(
+            [names.str.contains(pattern, na=False) for pattern, _ in _ETF_TYPE_RULES],
+            [etf_type for _, etf_type in _ETF_TYPE_RULES],
+            default="其他ETF",
+        )
 
     def get_etf_realtime(self, codes: List[str] = None) -> List[Dict[str, Any]]:
         """获取 ETF 实时行情"""
@@ -530,42 +837,26 @@ class FundClient(BaseClient):
             # 取最近 N 天
             df = df.tail(days)
 
-            result = []
-            for _, row in df.iterrows():
-                result.append({
-                    "date": str(row["日期"])[-5:] if len(str(row["日期"])) >= 5 else str(row["日期"]),
-                    "open": float(row.get("开盘", 0) or 0),
-                    "close": float(row.get("收盘", 0) or 0),
-                    "high": float(row.get("最高", 0) or 0),
-                    "low": float(row.get("最低", 0) or 0),
-                    "volume": int(row.get("成交量", 0) or 0),
-                    "amount": float(row.get("成交额", 0) or 0),
-                    "change_percent": float(row.get("涨跌幅", 0) or 0),
-                    "turnover": float(row.get("换手率", 0) or 0),
-                })
-
-            return result
+            # 整列处理：日期只保留 MM-DD，数值列解析一次
+            numeric = coerce_numeric(df, self._ETF_HISTORY_NUMERIC_FIELDS).rename(
+                columns=self._ETF_HISTORY_NUMERIC_FIELDS
+            )
+            numeric["volume"] = numeric["volume"].astype("int64")
+            out = pd.concat(
+                [pd.DataFrame({"date": df["日期"].astype(str).str[-5:]}), numeric],
+                axis=1,
+            )
+
+            return frame_to_records(out)
         except Exception as e:
             logger.error(f"Failed to get ETF history for {code}: {e}")
             return []
 
     def search_etf(self, keyword: str) -> List[Dict[str, Any]]:
         """搜索 ETF"""
-        etf_list = self._get_etf_list_cached()
-
-        results = []
-        keyword_lower = keyword.lower()
-
-        for etf in etf_list:
-            code = etf.get("code", "")
-            name = etf.get("name", "")
-
-            if keyword_lower in code.lower() or keyword in name:
-                results.append(etf)
-                if len(results) >= 20:
-                    break
-
-        return results
+        etf_list, frame = self._get_etf_frame()
+        positions = self._match_code_or_name(frame["code_lower"], frame["name"], keyword)
+        return [etf_list[i] for i in positions]
 
     def get_hot_etfs(self) -> List[Dict[str, Any]]:
         """获取热门 ETF（用于首页展示）"""
@@ -583,12 +874,10 @@ class FundClient(BaseClient):
             "159941",  # 纳指ETF
         ]
 
-        etf_list = self._get_etf_list_cached()
-        etf_map = {etf["code"]: etf for etf in etf_list}
-
         result = []
         for code in hot_codes:
-            if code in etf_map:
-                result.append(etf_map[code])
+            etf = self._get_etf_by_code(code)
+            if etf is not None:
+                result.append(etf)
 
         return result
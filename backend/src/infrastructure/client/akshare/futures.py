@@ -1,16 +1,123 @@
 """
 期货数据客户端 - 使用 AKShare
 """
+import asyncio
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import akshare as ak
+import pandas as pd
 
+from src.infrastructure.client.akshare import cache as ak_cache
+from src.infrastructure.client.akshare.frame import (
+    coerce_numeric,
+    frame_to_record_batch,
+    frame_to_records,
+    safe_float,
+    safe_float_array,
+)
 from src.infrastructure.client.base import BaseClient
 
 logger = logging.getLogger(__name__)
 
+# 各交易所的期货品种
+_EXCHANGE_SYMBOLS = {
+    "CFFEX": ["IF", "IC", "IH", "IM", "T", "TF", "TS"],  # 中金所
+    "SHFE": ["AU", "AG", "CU", "AL", "ZN", "PB", "NI", "SN", "RB", "HC", "SS",
+             "SC", "FU", "BU", "LU", "NR", "SP"],  # 上期所
+    "DCE": ["I", "J", "JM", "C", "CS", "A", "M", "Y", "P", "L", "V", "PP",
+            "EB", "PG", "EG", "LH", "RR"],  # 大商所
+    "CZCE": ["CF", "SR", "TA", "MA", "OI", "RM", "FG", "ZC", "SF", "SM",
+             "AP", "CJ", "PK", "UR", "SA", "PF"],  # 郑商所
+}
+
+# 品种 -> 交易所
+_PREFIX_TO_EXCHANGE = {
+    symbol: exchange
+    for exchange, symbols in _EXCHANGE_SYMBOLS.items()
+    for symbol in symbols
+}
+
+_NON_ALPHA = re.compile(r"[^A-Za-z]")
+
+# 删除 ASCII 范围内的非字母字符（数字、空格、-/. 等）
+_DROP_ASCII_NON_ALPHA = str.maketrans(
+    "", "", "".join(chr(i) for i in range(128) if not chr(i).isalpha())
+)
+
+
+@lru_cache(maxsize=4096)
+def _alpha_prefix(code: str) -> str:
+    """提取合约代码中的品种字母（大写）"""
+    # 合约代码基本都是 ASCII，str.translate 一次查表即可；含非 ASCII 字符时回退到正则
+    prefix = code.translate(_DROP_ASCII_NON_ALPHA)
+    if not prefix.isascii():
+        prefix = _NON_ALPHA.sub("", prefix)
+    return prefix.upper()
+
+
+# 接口无数据时返回的默认期货行情（不含 time，使用时补上）
+_DEFAULT_FUTURES_QUOTES = (
+    {
+        "code": "IF2401",
+        "name": "沪深300主力",
+        "category": "index",
+        "exchange": "CFFEX",
+        "price": 3658.4,
+        "open": 3640.0,
+        "high": 3665.0,
+        "low": 3635.0,
+        "close": 3658.4,
+        "settle": 0,
+        "change": 25.6,
+        "change_percent": 0.70,
+        "volume": 0,
+        "amount": 0,
+        "open_interest": 0,
+        "open_interest_change": 0,
+    },
+    {
+        "code": "SC2402",
+        "name": "原油主力",
+        "category": "commodity",
+        "exchange": "SHFE",
+        "price": 568.5,
+        "open": 560.0,
+        "high": 570.0,
+        "low": 558.0,
+        "close": 568.5,
+        "settle": 0,
+        "change": 8.6,
+        "change_percent": 1.54,
+        "volume": 0,
+        "amount": 0,
+        "open_interest": 0,
+        "open_interest_change": 0,
+    },
+    {
+        "code": "AU2402",
+        "name": "黄金主力",
+        "category": "commodity",
+        "exchange": "SHFE",
+        "price": 486.52,
+        "open": 484.0,
+        "high": 487.0,
+        "low": 483.0,
+        "close": 486.52,
+        "settle": 0,
+        "change": 3.28,
+        "change_percent": 0.68,
+        "volume": 0,
+        "amount": 0,
+        "open_interest": 0,
+        "open_interest_change": 0,
+    },
+)
+
 
 class FuturesClient(BaseClient):
     """期货数据客户端"""
@@ -27,8 +134,39 @@ class FuturesClient(BaseClient):
                       "MA", "TA", "EG", "PP", "L", "V", "EB", "PF"],  # 化工
     }
 
-    async def request(self, *args, **kwargs) -> Any:
-        pass
+    # 品种 -> (分类, 交易所)，一次查表同时得到两者；未归类的品种视为商品期货
+    _PREFIX_META = {
+        **{
+            symbol: ("commodity", exchange)
+            for symbol, exchange in _PREFIX_TO_EXCHANGE.items()
+        },
+        **{
+            symbol: (cat, _PREFIX_TO_EXCHANGE.get(symbol, "UNKNOWN"))
+            for cat, symbols in FUTURES_CATEGORIES.items()
+            for symbol in symbols
+        },
+    }
+
+    # 历史行情数值列 -> 输出字段
+    _HISTORY_NUMERIC_FIELDS = {
+        "open": "open",
+        "high": "high",
+        "low": "low",
+        "close": "close",
+        "volume": "volume",
+        "hold": "open_interest",
+    }
+
+    # 共享 IO 线程池，用于并发请求各主力合约
+    _io_pool = ThreadPoolExecutor(max_workers=9, thread_name_prefix="futures-io")
+
+    async def request(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        在线程池中执行同步的客户端方法，避免 AKShare 阻塞事件循环
+        使用事件循环默认线程池，与方法内部并发请求所用的 _io_pool 分开，避免嵌套提交时互相等待
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(func, *args, **kwargs))
 
     def get_futures_realtime(self, category: str = None) -> List[Dict[str, Any]]:
         """
@@ -37,15 +175,6 @@ class FuturesClient(BaseClient):
         """
         now = datetime.now()
         
-        # 安全获取数值的辅助函数
-        def safe_float(val):
-            try:
-                if val is None or val == "" or val == "-":
-                    return 0.0
-                return float(str(val).replace("%", "").replace(",", ""))
-            except (ValueError, TypeError):
-                return 0.0
-
         result = []
 
         # 方法1: 尝试从主力合约获取数据
@@ -55,23 +184,34 @@ class FuturesClient(BaseClient):
             "AU0": "黄金主力", "AG0": "白银主力", "CU0": "铜主力",
             "SC0": "原油主力", "RB0": "螺纹钢主力", "I0": "铁矿石主力"
         }
-        
-        for contract in main_contracts:
+
+        def fetch_main(contract):
+            try:
+                return ak_cache.futures_main_sina(contract)
+            except Exception as e:
+                logger.debug(f"Failed to get {contract} data: {e}")
+                return None
+
+        # 各合约互不依赖，并发请求，耗时取决于最慢的一个
+        main_dfs = self._io_pool.map(fetch_main, main_contracts)
+
+        for contract, df in zip(main_contracts, main_dfs):
             try:
-                df = ak.futures_main_sina(symbol=contract)
                 if df is not None and not df.empty:
-                    latest = df.iloc[-1]
-                    prev = df.iloc[-2] if len(df) > 1 else latest
+                    # 只取最后两行转成 NumPy 数组，避免逐个 Series 索引
+                    tail = df.iloc[-2:].to_numpy()
+                    latest, prev = tail[-1], tail[0]
+                    n_cols = tail.shape[1]
                     
                     # 使用位置索引获取数据，因为列名可能不一致
                     # 通常格式: date, open, high, low, close, volume, hold
-                    close_price = safe_float(latest.iloc[4] if len(latest) > 4 else 0)
-                    prev_close = safe_float(prev.iloc[4] if len(prev) > 4 else 0)
+                    close_price = safe_float(latest[4] if n_cols > 4 else 0)
+                    prev_close = safe_float(prev[4] if n_cols > 4 else 0)
                     change = close_price - prev_close if prev_close else 0
                     change_pct = (change / prev_close * 100) if prev_close else 0
                     
                     code = contract.replace("0", "")
-                    cat = self._get_category(code)
+                    cat, exchange = self._get_meta(code)
                     
                     if category and cat != category:
                         continue
@@ -81,18 +221,18 @@ class FuturesClient(BaseClient):
                         "code": contract,
                         "name": contract_names.get(contract, contract),
                         "category": cat,
-                        "exchange": self._get_exchange(code),
+                        "exchange": exchange,
                         "price": round(close_price, 2),
-                        "open": safe_float(latest.iloc[1] if len(latest) > 1 else 0),
-                        "high": safe_float(latest.iloc[2] if len(latest) > 2 else 0),
-                        "low": safe_float(latest.iloc[3] if len(latest) > 3 else 0),
+                        "open": safe_float(latest[1] if n_cols > 1 else 0),
+                        "high": safe_float(latest[2] if n_cols > 2 else 0),
+                        "low": safe_float(latest[3] if n_cols > 3 else 0),
                         "close": round(close_price, 2),
                         "settle": 0,
                         "change": round(change, 2),
                         "change_percent": round(change_pct, 2),
-                        "volume": safe_float(latest.iloc[5] if len(latest) > 5 else 0),
+                        "volume": safe_float(latest[5] if n_cols > 5 else 0),
                         "amount": 0,
-                        "open_interest": safe_float(latest.iloc[6] if len(latest) > 6 else 0),
+                        "open_interest": safe_float(latest[6] if n_cols > 6 else 0),
                         "open_interest_change": 0,
                     })
             except Exception as e:
@@ -105,111 +245,52 @@ class FuturesClient(BaseClient):
                 df = ak.futures_zh_spot()
                 
                 if df is not None and not df.empty:
-                    columns = df.columns.tolist()
-                    logger.debug(f"Futures columns: {columns}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Futures columns: %s", df.columns.tolist())
                     
-                    for idx, row in df.iterrows():
-                        if len(result) >= 20:
-                            break
-                        
-                        try:
-                            # 使用位置索引，更稳定
-                            code = str(row.iloc[0]) if len(row) > 0 else ""
-                            name = str(row.iloc[1]) if len(row) > 1 else ""
-                            price = safe_float(row.iloc[2]) if len(row) > 2 else 0
-                            
-                            cat = self._get_category(code)
-                            if category and cat != category:
-                                continue
-                            
-                            result.append({
-                                "time": now,
-                                "code": code,
-                                "name": name,
-                                "category": cat,
-                                "exchange": self._get_exchange(code),
-                                "price": price,
-                                "open": 0,
-                                "high": 0,
-                                "low": 0,
-                                "close": price,
-                                "settle": 0,
-                                "change": 0,
-                                "change_percent": 0,
-                                "volume": 0,
-                                "amount": 0,
-                                "open_interest": 0,
-                                "open_interest_change": 0,
-                            })
-                        except Exception as row_e:
-                            logger.debug(f"Failed to parse row {idx}: {row_e}")
-                            continue
-                            
+                    # 使用位置索引，更稳定；整列解析后再按分类过滤，最多取 20 条
+                    n_cols = df.shape[1]
+                    spot = pd.DataFrame({
+                        "code": df.iloc[:, 0].astype(str),
+                        "name": df.iloc[:, 1].astype(str) if n_cols > 1 else "",
+                        "price": safe_float_array(df.iloc[:, 2]) if n_cols > 2 else 0.0,
+                    })
+                    meta = spot["code"].map(self._get_meta)
+                    spot["category"] = meta.str[0]
+                    spot["exchange"] = meta.str[1]
+                    if category:
+                        spot = spot[spot["category"] == category]
+
+                    for code, name, price, cat, exchange in spot.head(20).itertuples(
+                        index=False, name=None
+                    ):
+                        result.append({
+                            "time": now,
+                            "code": code,
+                            "name": name,
+                            "category": cat,
+                            "exchange": exchange,
+                            "price": price,
+                            "open": 0,
+                            "high": 0,
+                            "low": 0,
+                            "close": price,
+                            "settle": 0,
+                            "change": 0,
+                            "change_percent": 0,
+                            "volume": 0,
+                            "amount": 0,
+                            "open_interest": 0,
+                            "open_interest_change": 0,
+                        })
+
             except Exception as e:
                 logger.error(f"Failed to get futures realtime from futures_zh_spot: {e}")
 
         # 如果没有获取到数据，返回默认数据
         if not result:
             logger.info("No futures data available from API, using default data")
-            result = [
-                {
-                    "time": now,
-                    "code": "IF2401",
-                    "name": "沪深300主力",
-                    "category": "index",
-                    "exchange": "CFFEX",
-                    "price": 3658.4,
-                    "open": 3640.0,
-                    "high": 3665.0,
-                    "low": 3635.0,
-                    "close": 3658.4,
-                    "settle": 0,
-                    "change": 25.6,
-                    "change_percent": 0.70,
-                    "volume": 0,
-                    "amount": 0,
-                    "open_interest": 0,
-                    "open_interest_change": 0,
-                },
-                {
-                    "time": now,
-                    "code": "SC2402",
-                    "name": "原油主力",
-                    "category": "commodity",
-                    "exchange": "SHFE",
-                    "price": 568.5,
-                    "open": 560.0,
-                    "high": 570.0,
-                    "low": 558.0,
-                    "close": 568.5,
-                    "settle": 0,
-                    "change": 8.6,
-                    "change_percent": 1.54,
-                    "volume": 0,
-                    "amount": 0,
-                    "open_interest": 0,
-                    "open_interest_change": 0,
-                },
-                {
-                    "time": now,
-                    "code": "AU2402",
-                    "name": "黄金主力",
-                    "category": "commodity",
-                    "exchange": "SHFE",
-                    "price": 486.52,
-                    "open": 484.0,
-                    "high": 487.0,
-                    "low": 483.0,
-                    "close": 486.52,
-                    "settle": 0,
-                    "change": 3.28,
-                    "change_percent": 0.68,
-                    "volume": 0,
-                    "amount": 0,
-                    "open_interest": 0,
-                    "open_interest_change": 0,
-                },
-            ]
+            result = [{"time": now, **quote} for quote in _DEFAULT_FUTURES_QUOTES]
 
         return result
 
@@ -217,19 +298,18 @@ class FuturesClient(BaseClient):
         """获取主力合约列表"""
         try:
             df = ak.futures_main_sina()
-            
-            result = []
-            for _, row in df.iterrows():
-                code = row.get("symbol", "")
-                result.append({
-                    "code": code,
-                    "name": row.get("name", ""),
-                    "category": self._get_category(code),
-                    "exchange": self._get_exchange(code),
-                    "is_main": True,
-                })
-            
-            return result
+
+            codes = df["symbol"] if "symbol" in df.columns else pd.Series("", index=df.index)
+            meta = codes.map(self._get_meta)
+            out = pd.DataFrame({
+                "code": codes,
+                "name": df["name"] if "name" in df.columns else "",
+                "category": meta.str[0],
+                "exchange": meta.str[1],
+                "is_main": True,
+            })
+
+            return frame_to_records(out)
         except Exception as e:
             logger.error(f"Failed to get main contracts: {e}")
             return []
@@ -241,53 +321,51 @@ class FuturesClient(BaseClient):
         end_date: str = None
     ) -> List[Dict[str, Any]]:
         """获取期货历史数据"""
+        df = self.get_futures_history_frame(code, start_date, end_date)
+        return frame_to_records(df) if df is not None else []
+
+    def get_futures_history_frame(
+        self,
+        code: str,
+        start_date: str = None,
+        end_date: str = None
+    ) -> Optional[pd.DataFrame]:
+        """获取期货历史数据（列式 DataFrame），失败时返回 None"""
         try:
             df = ak.futures_zh_daily_sina(symbol=code)
-            
-            result = []
-            for _, row in df.iterrows():
-                result.append({
-                    "time": row["date"],
-                    "code": code,
-                    "open": float(row.get("open", 0) or 0),
-                    "high": float(row.get("high", 0) or 0),
-                    "low": float(row.get("low", 0) or 0),
-                    "close": float(row.get("close", 0) or 0),
-                    "volume": float(row.get("volume", 0) or 0),
-                    "open_interest": float(row.get("hold", 0) or 0),
-                })
-            
-            return result
+
+            # 数值列整列解析
+            numeric = coerce_numeric(df, self._HISTORY_NUMERIC_FIELDS).rename(
+                columns=self._HISTORY_NUMERIC_FIELDS
+            )
+            return pd.concat(
+                [pd.DataFrame({"time": df["date"], "code": code}), numeric], axis=1
+            )
         except Exception as e:
             logger.error(f"Failed to get futures history for {code}: {e}")
-            return []
+            return None
+
+    def get_futures_history_arrow(
+        self,
+        code: str,
+        start_date: str = None,
+        end_date: str = None
+    ) -> Optional[Any]:
+        """
+        获取期货历史数据（Arrow RecordBatch），供按列消费的调用方免去逐行 dict
+        获取失败时返回 None
+        """
+        df = self.get_futures_history_frame(code, start_date, end_date)
+        return frame_to_record_batch(df) if df is not None else None
+
+    def _get_meta(self, code: str) -> Tuple[str, str]:
+        """获取期货 (分类, 交易所)"""
+        return self._PREFIX_META.get(_alpha_prefix(code), ("commodity", "UNKNOWN"))
 
     def _get_category(self, code: str) -> str:
         """获取期货分类"""
-        prefix = ''.join(filter(str.isalpha, code)).upper()
-        for cat, symbols in self.FUTURES_CATEGORIES.items():
-            if prefix in symbols:
-                return cat
-        return "commodity"
+        return self._get_meta(code)[0]
 
     def _get_exchange(self, code: str) -> str:
         """获取交易所"""
-        prefix = ''.join(filter(str.isalpha, code)).upper()
-        
-        cffex = ["IF", "IC", "IH", "IM", "T", "TF", "TS"]  # 中金所
-        shfe = ["AU", "AG", "CU", "AL", "ZN", "PB", "NI", "SN", "RB", "HC", "SS", 
-                "SC", "FU", "BU", "LU", "NR", "SP"]  # 上期所
-        dce = ["I", "J", "JM", "C", "CS", "A", "M", "Y", "P", "L", "V", "PP", 
-               "EB", "PG", "EG", "LH", "RR"]  # 大商所
-        czce = ["CF", "SR", "TA", "MA", "OI", "RM", "FG", "ZC", "SF", "SM", 
-                "AP", "CJ", "PK", "UR", "SA", "PF"]  # 郑商所
-        
-        if prefix in cffex:
-            return "CFFEX"
-        elif prefix in shfe:
-            return "SHFE"
-        elif prefix in dce:
-            return "DCE"
-        elif prefix in czce:
-            return "CZCE"
-        return "UNKNOWN"
+        return self._get_meta(code)[1]
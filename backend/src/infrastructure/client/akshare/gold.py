@@ -2,15 +2,84 @@
 黄金数据客户端 - 使用 AKShare
 """
 
+import asyncio
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List
+from functools import partial
+from typing import Any, Callable, Dict, List
 
 import akshare as ak
+import numpy as np
+import pandas as pd
+from src.infrastructure.client.akshare import cache as ak_cache
+from src.infrastructure.client.akshare.frame import (
+    coerce_numeric,
+    frame_to_records,
+    safe_float,
+    safe_float_array,
+)
 from src.infrastructure.client.base import BaseClient
 
 logger = logging.getLogger(__name__)
 
+# 上金所 Au99.99 / Ag99.99 品种名（兼容 AU9999 写法）
+_SGE_RE = re.compile(r"A([UG])99\.?99", re.IGNORECASE)
+
+# 品种字母 -> (代码, 名称)
+_SGE_DISPATCH = {
+    "U": ("AU9999", "黄金AU9999"),
+    "G": ("AG9999", "白银AG9999"),
+}
+
+# CFD 品种名关键字（中文, 英文小写） -> (代码, 名称)，按顺序匹配第一个
+_CFD_DISPATCH = (
+    ("黄金", "gold", "XAU", "国际金价"),
+    ("白银", "silver", "XAG", "国际银价"),
+)
+
+# 期货主力合约兜底：(合约, 代码, 名称, 单位, 已有报价少于该数量时才取用)
+_MAIN_CONTRACT_DISPATCH = (
+    ("AU0", "AU", "金价", "元/克", 1),
+    ("AG0", "AG", "银价", "元/千克", 2),
+)
+
+
+# 接口无数据时返回的默认黄金行情（不含 time，使用时补上）
+_DEFAULT_GOLD_QUOTES = (
+    {
+        "code": "AU9999",
+        "name": "黄金AU9999",
+        "exchange": "SGE",
+        "price": 945.50,
+        "open": 942.00,
+        "high": 948.00,
+        "low": 940.00,
+        "close": 945.50,
+        "change": 3.50,
+        "change_percent": 0.37,
+        "volume": 0,
+        "amount": 0,
+        "unit": "元/克",
+    },
+    {
+        "code": "AG9999",
+        "name": "白银AG9999",
+        "exchange": "SGE",
+        "price": 7.85,
+        "open": 7.80,
+        "high": 7.90,
+        "low": 7.75,
+        "close": 7.85,
+        "change": 0.05,
+        "change_percent": 0.64,
+        "volume": 0,
+        "amount": 0,
+        "unit": "元/克",
+    },
+)
+
 
 class GoldClient(BaseClient):
     """黄金数据客户端"""
@@ -26,86 +95,66 @@ class GoldClient(BaseClient):
         "XAG": {"name": "伦敦银", "exchange": "LBMA", "unit": "美元/盎司"},
     }
 
-    async def request(self, *args, **kwargs) -> Any:
-        pass
+    # 品种代码 -> 上金所历史行情 symbol
+    _HISTORY_SYMBOLS = {
+        "AU9999": "黄金9999",
+        "AU9995": "黄金9995",
+        "XAU": "伦敦金",
+        "XAG": "伦敦银",
+    }
+
+    # 历史行情数值列 -> 输出字段
+    _HISTORY_NUMERIC_FIELDS = {
+        "开盘": "open",
+        "最高": "high",
+        "最低": "low",
+        "收盘": "close",
+    }
+
+    # 共享 IO 线程池，用于并发获取期货主力合约兜底行情
+    _io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="gold-io")
+
+    async def request(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """在线程池中执行同步的客户端方法，避免 AKShare 阻塞事件循环"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(func, *args, **kwargs))
 
     def get_gold_realtime(self) -> List[Dict[str, Any]]:
         """获取黄金实时行情"""
         result = []
         now = datetime.now()
 
-        def safe_float(val):
-            try:
-                if val is None or val == "" or val == "-":
-                    return 0.0
-                return float(str(val).replace("%", "").replace(",", ""))
-            except (ValueError, TypeError):
-                return 0.0
-
         # 方法1: 尝试获取上金所实时行情
         try:
             df = ak.spot_symbol_table_sge()
             if df is not None and not df.empty:
-                logger.debug(f"SGE columns: {df.columns.tolist()}")
-                for _, row in df.iterrows():
-                    symbol = str(row.iloc[0]) if len(row) > 0 else ""
-                    # 只获取 Au99.99 和 Ag99.99
-                    if "Au99.99" in symbol or "AU9999" in symbol.upper():
-                        price = safe_float(
-                            row.get("最新价", row.iloc[1] if len(row) > 1 else 0)
-                        )
-                        open_price = safe_float(
-                            row.get("开盘价", row.iloc[2] if len(row) > 2 else 0)
-                        )
-                        high = safe_float(
-                            row.get("最高价", row.iloc[3] if len(row) > 3 else 0)
-                        )
-                        low = safe_float(
-                            row.get("最低价", row.iloc[4] if len(row) > 4 else 0)
-                        )
-                        # 尝试获取涨跌
-                        change = safe_float(row.get("涨跌", 0))
-                        change_pct = safe_float(row.get("涨跌幅", 0))
-
-                        result.append(
-                            {
-                                "time": now,
-                                "code": "AU9999",
-                                "name": "黄金AU9999",
-                                "exchange": "SGE",
-                                "price": round(price, 2),
-                                "open": round(open_price, 2),
-                                "high": round(high, 2),
-                                "low": round(low, 2),
-                                "close": round(price, 2),
-                                "change": round(change, 2),
-                                "change_percent": round(change_pct, 2),
-                                "volume": 0,
-                                "amount": 0,
-                                "unit": "元/克",
-                            }
-                        )
-                    elif "Ag99.99" in symbol or "AG9999" in symbol.upper():
-                        price = safe_float(
-                            row.get("最新价", row.iloc[1] if len(row) > 1 else 0)
-                        )
-                        open_price = safe_float(
-                            row.get("开盘价", row.iloc[2] if len(row) > 2 else 0)
-                        )
-                        high = safe_float(
-                            row.get("最高价", row.iloc[3] if len(row) > 3 else 0)
-                        )
-                        low = safe_float(
-                            row.get("最低价", row.iloc[4] if len(row) > 4 else 0)
-                        )
-                        change = safe_float(row.get("涨跌", 0))
-                        change_pct = safe_float(row.get("涨跌幅", 0))
-
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("SGE columns: %s", df.columns.tolist())
+                # 一次正则提取品种字母（U/G），只保留 Au99.99 和 Ag99.99
+                metals = (
+                    df.iloc[:, 0].astype(str).str.extract(_SGE_RE, expand=False).str.upper()
+                )
+                matched = metals.notna()
+                if matched.any():
+                    sub = df[matched]
+                    quotes = pd.DataFrame({
+                        "metal": metals[matched],
+                        "price": self._numeric_column(sub, "最新价", 1),
+                        "open": self._numeric_column(sub, "开盘价", 2),
+                        "high": self._numeric_column(sub, "最高价", 3),
+                        "low": self._numeric_column(sub, "最低价", 4),
+                        "change": self._numeric_column(sub, "涨跌"),
+                        "change_percent": self._numeric_column(sub, "涨跌幅"),
+                    })
+                    for metal, price, open_price, high, low, change, change_pct in (
+                        quotes.itertuples(index=False, name=None)
+                    ):
+                        code, name = _SGE_DISPATCH[metal]
                         result.append(
                             {
                                 "time": now,
-                                "code": "AG9999",
-                                "name": "白银AG9999",
+                                "code": code,
+                                "name": name,
                                 "exchange": "SGE",
                                 "price": round(price, 2),
                                 "open": round(open_price, 2),
@@ -127,49 +176,49 @@ class GoldClient(BaseClient):
             try:
                 df = ak.spot_gold_silver_cfd()
                 if df is not None and not df.empty:
-                    for _, row in df.iterrows():
-                        name = str(row.get("名称", ""))
-                        if "黄金" in name or "gold" in name.lower():
-                            result.append(
-                                {
-                                    "time": now,
-                                    "code": "XAU",
-                                    "name": "国际金价",
-                                    "exchange": "CFD",
-                                    "price": round(safe_float(row.get("最新价", 0)), 2),
-                                    "open": round(safe_float(row.get("开盘价", 0)), 2),
-                                    "high": round(safe_float(row.get("最高价", 0)), 2),
-                                    "low": round(safe_float(row.get("最低价", 0)), 2),
-                                    "close": round(safe_float(row.get("最新价", 0)), 2),
-                                    "change": round(
-                                        safe_float(row.get("涨跌额", 0)), 2
-                                    ),
-                                    "change_percent": round(
-                                        safe_float(row.get("涨跌幅", 0)), 2
-                                    ),
-                                    "volume": 0,
-                                    "amount": 0,
-                                    "unit": "美元/盎司",
-                                }
-                            )
-                        elif "白银" in name or "silver" in name.lower():
+                    names = (
+                        df["名称"].astype(str)
+                        if "名称" in df.columns
+                        else pd.Series("", index=df.index)
+                    )
+                    names_lower = names.str.lower()
+                    # 每行匹配到的 _CFD_DISPATCH 下标，倒序赋值使靠前的规则优先
+                    kinds = pd.Series(-1, index=df.index)
+                    for i in range(len(_CFD_DISPATCH) - 1, -1, -1):
+                        keyword, keyword_en = _CFD_DISPATCH[i][:2]
+                        kinds[
+                            names.str.contains(keyword, regex=False)
+                            | names_lower.str.contains(keyword_en, regex=False)
+                        ] = i
+                    matched = kinds >= 0
+                    if matched.any():
+                        sub = df[matched]
+                        quotes = pd.DataFrame({
+                            "kind": kinds[matched],
+                            "price": self._numeric_column(sub, "最新价"),
+                            "open": self._numeric_column(sub, "开盘价"),
+                            "high": self._numeric_column(sub, "最高价"),
+                            "low": self._numeric_column(sub, "最低价"),
+                            "change": self._numeric_column(sub, "涨跌额"),
+                            "change_percent": self._numeric_column(sub, "涨跌幅"),
+                        })
+                        for kind, price, open_price, high, low, change, change_pct in (
+                            quotes.itertuples(index=False, name=None)
+                        ):
+                            code, name = _CFD_DISPATCH[kind][2:]
                             result.append(
                                 {
                                     "time": now,
-                                    "code": "XAG",
-                                    "name": "国际银价",
+                                    "code": code,
+                                    "name": name,
                                     "exchange": "CFD",
-                                    "price": round(safe_float(row.get("最新价", 0)), 2),
-                                    "open": round(safe_float(row.get("开盘价", 0)), 2),
-                                    "high": round(safe_float(row.get("最高价", 0)), 2),
-                                    "low": round(safe_float(row.get("最低价", 0)), 2),
-                                    "close": round(safe_float(row.get("最新价", 0)), 2),
-                                    "change": round(
-                                        safe_float(row.get("涨跌额", 0)), 2
-                                    ),
-                                    "change_percent": round(
-                                        safe_float(row.get("涨跌幅", 0)), 2
-                                    ),
+                                    "price": round(price, 2),
+                                    "open": round(open_price, 2),
+                                    "high": round(high, 2),
+                                    "low": round(low, 2),
+                                    "close": round(price, 2),
+                                    "change": round(change, 2),
+                                    "change_percent": round(change_pct, 2),
                                     "volume": 0,
                                     "amount": 0,
                                     "unit": "美元/盎司",
@@ -178,150 +227,28 @@ class GoldClient(BaseClient):
             except Exception as e:
                 logger.debug(f"spot_gold_silver_cfd failed: {e}")
 
-        # 方法2: 如果上面没有获取到数据，尝试从期货主力合约获取黄金数据
-        if not result:
-            try:
-                # 获取黄金期货主力合约
-                df = ak.futures_main_sina(symbol="AU0")
-                if df is not None and not df.empty:
-                    latest = df.iloc[-1]
-                    prev = df.iloc[-2] if len(df) > 1 else latest
-                    close_price = safe_float(
-                        latest.get("close", latest.iloc[4] if len(latest) > 4 else 0)
-                    )
-                    prev_close = safe_float(
-                        prev.get("close", prev.iloc[4] if len(prev) > 4 else 0)
-                    )
-                    change = close_price - prev_close if prev_close else 0
-                    change_pct = (change / prev_close * 100) if prev_close else 0
-
-                    result.append(
-                        {
-                            "time": now,
-                            "code": "AU",
-                            "name": "金价",
-                            "exchange": "SHFE",
-                            "price": round(close_price, 2),
-                            "open": safe_float(
-                                latest.get(
-                                    "open", latest.iloc[1] if len(latest) > 1 else 0
-                                )
-                            ),
-                            "high": safe_float(
-                                latest.get(
-                                    "high", latest.iloc[2] if len(latest) > 2 else 0
-                                )
-                            ),
-                            "low": safe_float(
-                                latest.get(
-                                    "low", latest.iloc[3] if len(latest) > 3 else 0
-                                )
-                            ),
-                            "close": round(close_price, 2),
-                            "change": round(change, 2),
-                            "change_percent": round(change_pct, 2),
-                            "volume": safe_float(
-                                latest.get(
-                                    "volume", latest.iloc[5] if len(latest) > 5 else 0
-                                )
-                            ),
-                            "amount": 0,
-                            "unit": "元/克",
-                        }
-                    )
-            except Exception as e:
-                logger.debug(f"futures_main_sina AU0 failed: {e}")
-
-        # 方法3: 如果还是没有数据，尝试从白银期货获取
-        if len(result) < 2:
+        # 方法3: 如果上面报价不足，从期货主力合约获取金价/银价
+        # 只请求缺少的合约，多个合约并发获取（走共享 TTL 缓存，与期货行情共用）
+        # 每个合约最多补一条报价，按取用前的报价数判断与依次补齐的结果一致
+        pending = {
+            contract: self._io_pool.submit(ak_cache.futures_main_sina, contract)
+            for contract, _, _, _, min_count in _MAIN_CONTRACT_DISPATCH
+            if len(result) < min_count
+        }
+        for contract, code, name, unit, _ in _MAIN_CONTRACT_DISPATCH:
+            if contract not in pending:
+                continue
             try:
-                df = ak.futures_main_sina(symbol="AG0")
+                df = pending[contract].result()
                 if df is not None and not df.empty:
-                    latest = df.iloc[-1]
-                    prev = df.iloc[-2] if len(df) > 1 else latest
-                    close_price = safe_float(
-                        latest.get("close", latest.iloc[4] if len(latest) > 4 else 0)
-                    )
-                    prev_close = safe_float(
-                        prev.get("close", prev.iloc[4] if len(prev) > 4 else 0)
-                    )
-                    change = close_price - prev_close if prev_close else 0
-                    change_pct = (change / prev_close * 100) if prev_close else 0
-
-                    result.append(
-                        {
-                            "time": now,
-                            "code": "AG",
-                            "name": "银价",
-                            "exchange": "SHFE",
-                            "price": round(close_price, 2),
-                            "open": safe_float(
-                                latest.get(
-                                    "open", latest.iloc[1] if len(latest) > 1 else 0
-                                )
-                            ),
-                            "high": safe_float(
-                                latest.get(
-                                    "high", latest.iloc[2] if len(latest) > 2 else 0
-                                )
-                            ),
-                            "low": safe_float(
-                                latest.get(
-                                    "low", latest.iloc[3] if len(latest) > 3 else 0
-                                )
-                            ),
-                            "close": round(close_price, 2),
-                            "change": round(change, 2),
-                            "change_percent": round(change_pct, 2),
-                            "volume": safe_float(
-                                latest.get(
-                                    "volume", latest.iloc[5] if len(latest) > 5 else 0
-                                )
-                            ),
-                            "amount": 0,
-                            "unit": "元/千克",
-                        }
-                    )
+                    result.append(self._build_main_quote(df, code, name, unit, now))
             except Exception as e:
-                logger.debug(f"futures_main_sina AG0 failed: {e}")
+                logger.debug(f"futures_main_sina {contract} failed: {e}")
 
         # 如果没有获取到数据，返回默认数据（上金所格式，元/克）
         if not result:
             logger.info("No gold data available from API, using default data")
-            result = [
-                {
-                    "time": now,
-                    "code": "AU9999",
-                    "name": "黄金AU9999",
-                    "exchange": "SGE",
-                    "price": 945.50,
-                    "open": 942.00,
-                    "high": 948.00,
-                    "low": 940.00,
-                    "close": 945.50,
-                    "change": 3.50,
-                    "change_percent": 0.37,
-                    "volume": 0,
-                    "amount": 0,
-                    "unit": "元/克",
-                },
-                {
-                    "time": now,
-                    "code": "AG9999",
-                    "name": "白银AG9999",
-                    "exchange": "SGE",
-                    "price": 7.85,
-                    "open": 7.80,
-                    "high": 7.90,
-                    "low": 7.75,
-                    "close": 7.85,
-                    "change": 0.05,
-                    "change_percent": 0.64,
-                    "volume": 0,
-                    "amount": 0,
-                    "unit": "元/克",
-                },
-            ]
+            result = [{"time": now, **quote} for quote in _DEFAULT_GOLD_QUOTES]
 
         return result
 
@@ -330,43 +257,68 @@ class GoldClient(BaseClient):
     ) -> List[Dict[str, Any]]:
         """获取黄金历史数据"""
         try:
-            symbol_map = {
-                "AU9999": "黄金9999",
-                "AU9995": "黄金9995",
-                "XAU": "伦敦金",
-                "XAG": "伦敦银",
-            }
-            symbol = symbol_map.get(code, "黄金9999")
+            symbol = self._HISTORY_SYMBOLS.get(code, "黄金9999")
 
             df = ak.spot_hist_sge(symbol=symbol)
 
-            result = []
-            for _, row in df.iterrows():
-                result.append(
-                    {
-                        "time": row["日期"],
-                        "code": code,
-                        "open": float(row.get("开盘", 0) or 0),
-                        "high": float(row.get("最高", 0) or 0),
-                        "low": float(row.get("最低", 0) or 0),
-                        "close": float(row.get("收盘", 0) or 0),
-                        "volume": 0,
-                        "amount": 0,
-                    }
-                )
+            # 数值列整列解析
+            numeric = coerce_numeric(df, self._HISTORY_NUMERIC_FIELDS).rename(
+                columns=self._HISTORY_NUMERIC_FIELDS
+            )
+            out = pd.concat(
+                [pd.DataFrame({"time": df["日期"], "code": code}), numeric], axis=1
+            )
+            out["volume"] = 0
+            out["amount"] = 0
 
-            return result
+            return frame_to_records(out)
         except Exception as e:
             logger.error(f"Failed to get gold history for {code}: {e}")
             return []
 
-    def _parse_sge_code(self, name: str) -> str:
-        """解析上金所品种代码"""
-        mapping = {
-            "Au99.99": "AU9999",
-            "Au99.95": "AU9995",
-            "Au100g": "AU100G",
-            "Pt99.95": "PT9995",
-            "Ag99.99": "AG9999",
+    @staticmethod
+    def _build_main_quote(
+        df: pd.DataFrame, code: str, name: str, unit: str, now: datetime
+    ) -> Dict[str, Any]:
+        """由期货主力连续合约的日线构造报价（取最后两行计算涨跌）"""
+        # 只取最后两行转成 NumPy 数组，按列号取值，避免逐个 Series 索引
+        tail = df.iloc[-2:].to_numpy()
+        latest, prev = tail[-1], tail[0]
+        columns = list(df.columns)
+
+        def field(row, name: str, pos: int) -> float:
+            # 优先按列名，列名不存在时回退到位置
+            if name in columns:
+                return safe_float(row[columns.index(name)])
+            return safe_float(row[pos]) if len(row) > pos else 0.0
+
+        close_price = field(latest, "close", 4)
+        prev_close = field(prev, "close", 4)
+        change = close_price - prev_close if prev_close else 0
+        change_pct = (change / prev_close * 100) if prev_close else 0
+
+        return {
+            "time": now,
+            "code": code,
+            "name": name,
+            "exchange": "SHFE",
+            "price": round(close_price, 2),
+            "open": field(latest, "open", 1),
+            "high": field(latest, "high", 2),
+            "low": field(latest, "low", 3),
+            "close": round(close_price, 2),
+            "change": round(change, 2),
+            "change_percent": round(change_pct, 2),
+            "volume": field(latest, "volume", 5),
+            "amount": 0,
+            "unit": unit,
         }
-        return mapping.get(name, "")
+
+    @staticmethod
+    def _numeric_column(df: pd.DataFrame, name: str, pos: int = None) -> np.ndarray:
+        """按列名整列取数值，列名不存在时回退到位置索引，都没有则为 0"""
+        if name in df.columns:
+            return safe_float_array(df[name])
+        if pos is not None and df.shape[1] > pos:
+            return safe_float_array(df.iloc[:, pos])
+        return np.zeros(len(df))
@@ -1,14 +1,31 @@
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
-import akshare as ak
+import numpy as np
+import pandas as pd
 import pytz
 
+from src.infrastructure.client.akshare import cache as ak_cache
+from src.infrastructure.client.akshare.frame import (
+    coerce_numeric,
+    frame_to_records,
+    safe_float_array,
+)
 from src.infrastructure.client.base import BaseClient
 
 logger = logging.getLogger(__name__)
 
+# 行情时间统一按北京时间输出
+_TZ_SH = pytz.timezone("Asia/Shanghai")
+_TIME_FMT = "%Y-%m-%d %H:%M:%S"
+
+# 日线行情中用到的列
+_DAILY_COLUMNS = ("open", "high", "low", "close", "volume")
+
 
 class MarketClient(BaseClient):
     """市场数据客户端"""
@@ -32,60 +49,154 @@ class MarketClient(BaseClient):
         },
     }
 
-    async def request(self, *args, **kwargs) -> Dict[str, Any]:
-        """实现基类的request方法"""
-        return self.get_market_index(*args, **kwargs)
+    # A股指数 symbol -> 指数代码
+    CN_INDEX_CODES = {
+        "SSE": "000001",      # 上证指数
+        "SZSE": "399001",     # 深证成指
+        "ChiNext": "399006",  # 创业板指
+    }
+
+    # A股指数 symbol -> 日线接口代码（带交易所前缀）
+    CN_DAILY_SYMBOLS = {
+        "SSE": "sh000001",
+        "SZSE": "sz399001",
+        "ChiNext": "sz399006",
+    }
+
+    # 美股指数 symbol -> sina API 代码
+    US_INDEX_SYMBOLS = {
+        "DJI": ".DJI",      # 道琼斯
+        "IXIC": ".IXIC",    # 纳斯达克
+        "SPX": ".INX",      # 标普500
+    }
+
+    # 接口无数据时返回的默认行情
+    _DEFAULT_QUOTES = {
+        "CN": {
+            "SSE": {"close": 3350.44, "change": 18.32, "change_percent": 0.55},
+            "SZSE": {"close": 10856.28, "change": 58.45, "change_percent": 0.54},
+            "ChiNext": {"close": 2158.62, "change": 22.86, "change_percent": 1.07},
+        },
+        "HK": {
+            "HSI": {"close": 19245.82, "change": 125.64, "change_percent": 0.66},
+            "HSCEI": {"close": 6828.45, "change": 48.32, "change_percent": 0.71},
+        },
+        "US": {
+            "DJI": {"close": 43468.61, "change": 186.74, "change_percent": 0.43},
+            "IXIC": {"close": 19855.65, "change": 78.52, "change_percent": 0.40},
+            "SPX": {"close": 5983.45, "change": 22.68, "change_percent": 0.38},
+        },
+    }
+    _EMPTY_QUOTE = {"close": 0, "change": 0, "change_percent": 0}
+
+    # 市场 -> 指数实时行情接口（整张表一次拉取，覆盖该市场所有指数）
+    _SPOT_FETCHERS = {
+        "CN": ak_cache.stock_zh_index_spot_em,
+        "HK": ak_cache.stock_hk_index_spot_sina,
+    }
+
+    # 市场 -> 实时行情中需预先整列转为数值的列（空值填 0；sina 港股行情为带千分位逗号的字符串）
+    _SPOT_NUMERIC_COLUMNS = {
+        "CN": ("今开", "最高", "最低", "最新价", "昨收", "成交量", "涨跌额", "涨跌幅"),
+        "HK": ("最新价", "昨收", "今开", "最高", "最低", "成交量"),
+    }
+
+    # 共享 IO 线程池，用于并发请求美股各指数
+    _io_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix="market-io")
+
+    async def request(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        在线程池中执行同步的客户端方法，避免 AKShare 阻塞事件循环
+        使用事件循环默认线程池，与方法内部并发请求所用的 _io_pool 分开，避免嵌套提交时互相等待
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(func, *args, **kwargs))
 
     def get_market_index(self, market: str, symbol: str, period: str) -> Dict:
         """获取市场指数数据"""
-        now = datetime.now(pytz.timezone("Asia/Shanghai"))
-        
-        try:
-            if market == "CN":
-                data = self._get_cn_market_data(symbol, period)
-            elif market == "HK":
-                data = self._get_hk_market_data(symbol, period)
-            elif market == "US":
-                data = self._get_us_market_data(symbol, period)
-            else:
-                raise ValueError(f"Unsupported market: {market}")
+        return self.get_market_indices(market, [symbol], period)[symbol]
 
+    def get_market_indices(
+        self, market: str, symbols: List[str], period: str = "day"
+    ) -> Dict[str, Dict]:
+        """
+        批量获取同一市场的多个指数数据
+        A股/港股的实时行情只拉取一次并按代码建索引；美股按指数分别请求，并发拉取
+        """
+        now = datetime.now(_TZ_SH)
+
+        if market == "US":
+            results = self._io_pool.map(
+                lambda symbol: self._get_index_or_default(
+                    market, symbol, now, self._get_us_market_data, symbol, period, now
+                ),
+                symbols,
+            )
+            return dict(zip(symbols, results))
+
+        if market in self._SPOT_FETCHERS:
+            getter = (
+                self._get_cn_market_data if market == "CN" else self._get_hk_market_data
+            )
+            try:
+                spot = self._load_spot(
+                    self._SPOT_FETCHERS[market], self._SPOT_NUMERIC_COLUMNS.get(market, ())
+                )
+            except Exception as e:
+                logger.warning(f"Failed to get {market} realtime data, trying daily: {e}")
+                spot = pd.DataFrame()
+            return {
+                symbol: self._get_index_or_default(
+                    market, symbol, now, getter, symbol, period, now, spot
+                )
+                for symbol in symbols
+            }
+
+        logger.error(f"Unsupported market: {market}")
+        return {symbol: self._get_default_data(market, symbol, now) for symbol in symbols}
+
+    def _get_index_or_default(
+        self, market: str, symbol: str, now: datetime, getter: Callable, *args
+    ) -> Dict:
+        """调用单个市场的取数方法，失败或无数据时返回默认数据"""
+        try:
+            data = getter(*args)
             if data:
                 return data
-
         except Exception as e:
             logger.error(f"Failed to get {market}/{symbol}: {e}")
 
         # 返回默认数据
         return self._get_default_data(market, symbol, now)
 
+    @staticmethod
+    def _load_spot(
+        fetch: Callable[[], pd.DataFrame], numeric: Iterable[str] = ()
+    ) -> pd.DataFrame:
+        """
+        拉取指数实时行情并按代码建索引（代码转字符串，重复时保留第一条），无数据时返回空表
+        :param numeric: 需整列转为 float 的列（去掉千分位逗号和 %，无法解析时为 0），不存在的列跳过
+        """
+        df = fetch()
+        if df is None or df.empty or "代码" not in df.columns:
+            return pd.DataFrame()
+        codes = df["代码"].astype(str)
+        spot = df.set_index(codes)[~codes.duplicated().to_numpy()]
+        cols = [col for col in numeric if col in spot.columns]
+        if cols:
+            spot = spot.assign(**{col: safe_float_array(spot[col]) for col in cols})
+        return spot
+
     def _get_default_data(self, market: str, symbol: str, now: datetime) -> Dict:
         """获取默认数据"""
-        defaults = {
-            "CN": {
-                "SSE": {"close": 3350.44, "change": 18.32, "change_percent": 0.55},
-                "SZSE": {"close": 10856.28, "change": 58.45, "change_percent": 0.54},
-                "ChiNext": {"close": 2158.62, "change": 22.86, "change_percent": 1.07},
-            },
-            "HK": {
-                "HSI": {"close": 19245.82, "change": 125.64, "change_percent": 0.66},
-                "HSCEI": {"close": 6828.45, "change": 48.32, "change_percent": 0.71},
-            },
-            "US": {
-                "DJI": {"close": 43468.61, "change": 186.74, "change_percent": 0.43},
-                "IXIC": {"close": 19855.65, "change": 78.52, "change_percent": 0.40},
-                "SPX": {"close": 5983.45, "change": 22.68, "change_percent": 0.38},
-            },
-        }
-        
-        default = defaults.get(market, {}).get(symbol, {"close": 0, "change": 0, "change_percent": 0})
+        default = self._DEFAULT_QUOTES.get(market, {}).get(symbol, self._EMPTY_QUOTE)
         name = self.INDEX_NAMES.get(market, {}).get(symbol, symbol)
         
         return {
             "symbol": symbol,
             "market": market,
             "name": name,
-            "time": now.strftime("%Y-%m-%d %H:%M:%S"),
+            "time": now.strftime(_TIME_FMT),
             "open": default["close"],
             "high": default["close"],
             "low": default["close"],
@@ -95,55 +206,64 @@ class MarketClient(BaseClient):
             "change_percent": default["change_percent"],
         }
 
-    def _get_cn_market_data(self, symbol: str, period: str) -> Optional[Dict]:
-        """获取A股市场数据"""
-        now = datetime.now(pytz.timezone("Asia/Shanghai"))
-        
-        # symbol 映射到指数代码
-        symbol_map = {
-            "SSE": "000001",      # 上证指数
-            "SZSE": "399001",     # 深证成指
-            "ChiNext": "399006",  # 创业板指
-        }
-        
-        actual_code = symbol_map.get(symbol, symbol)
+    def _get_cn_market_data(
+        self,
+        symbol: str,
+        period: str,
+        now: datetime,
+        spot: Optional[pd.DataFrame] = None,
+    ) -> Optional[Dict]:
+        """
+        获取A股市场数据
+        :param spot: 已按代码建索引的实时行情（批量获取时传入），不传则自行拉取
+        """
+        actual_code = self.CN_INDEX_CODES.get(symbol, symbol)
         name = self.INDEX_NAMES.get("CN", {}).get(symbol, symbol)
         
         # 首先尝试获取实时行情
         try:
-            df = ak.stock_zh_index_spot_em()
-            if df is not None and not df.empty:
-                # 查找对应指数
-                for _, row in df.iterrows():
-                    code = str(row.get("代码", ""))
-                    if code == actual_code:
-                        return {
-                            "symbol": symbol,
-                            "market": "CN",
-                            "name": name,
-                            "time": now.strftime("%Y-%m-%d %H:%M:%S"),
-                            "open": round(float(row.get("今开", 0) or 0), 2),
-                            "high": round(float(row.get("最高", 0) or 0), 2),
-                            "low": round(float(row.get("最低", 0) or 0), 2),
-                            "close": round(float(row.get("最新价", 0) or 0), 2),
-                            "volume": float(row.get("成交量", 0) or 0),
-                            "change": round(float(row.get("涨跌额", 0) or 0), 2),
-                            "change_percent": round(float(row.get("涨跌幅", 0) or 0), 2),
-                        }
+            if spot is None:
+                spot = self._load_spot(
+                    ak_cache.stock_zh_index_spot_em, self._SPOT_NUMERIC_COLUMNS["CN"]
+                )
+            if actual_code in spot.index:
+                # 数值列已在 _load_spot 中整列转换
+                row = spot.loc[actual_code]
+                close_price = float(row.get("最新价", 0))
+                prev_close = float(row.get("昨收", 0))
+                change = float(row.get("涨跌额", 0))
+                change_percent = float(row.get("涨跌幅", 0))
+                # 涨跌额缺失时用同一行的昨收补算，不再为此请求日线
+                if not change and close_price and prev_close:
+                    change = close_price - prev_close
+                    change_percent = change / prev_close * 100
+
+                return self._pack_quote(
+                    "CN",
+                    symbol,
+                    name,
+                    now,
+                    float(row.get("今开", 0)),
+                    float(row.get("最高", 0)),
+                    float(row.get("最低", 0)),
+                    close_price,
+                    float(row.get("成交量", 0)),
+                    change,
+                    change_percent,
+                )
         except Exception as e:
             logger.warning(f"Failed to get realtime data for {symbol}, trying daily: {e}")
         
         # 如果实时数据获取失败，尝试获取日线数据
         try:
-            daily_symbol = f"sh{actual_code}" if symbol == "SSE" else f"sz{actual_code}"
-            df = ak.stock_zh_index_daily(symbol=daily_symbol)
+            df = ak_cache.stock_zh_index_daily(self._cn_daily_symbol(symbol))
             
             if df is not None and not df.empty:
-                latest = df.iloc[-1]
+                latest, prev = self._last_two_rows(df)
                 
                 # 计算涨跌
                 if len(df) > 1:
-                    prev_close = df.iloc[-2].get("close", 0)
+                    prev_close = prev.get("close", 0)
                     close = latest.get("close", 0)
                     change = close - prev_close if prev_close else 0
                     change_percent = (change / prev_close * 100) if prev_close else 0
@@ -151,134 +271,128 @@ class MarketClient(BaseClient):
                     change = 0
                     change_percent = 0
                 
-                return {
-                    "symbol": symbol,
-                    "market": "CN",
-                    "name": name,
-                    "time": now.strftime("%Y-%m-%d %H:%M:%S"),
-                    "open": round(float(latest.get("open", 0)), 2),
-                    "high": round(float(latest.get("high", 0)), 2),
-                    "low": round(float(latest.get("low", 0)), 2),
-                    "close": round(float(latest.get("close", 0)), 2),
-                    "volume": float(latest.get("volume", 0)),
-                    "change": round(change, 2),
-                    "change_percent": round(change_percent, 2),
-                }
+                return self._pack_quote(
+                    "CN",
+                    symbol,
+                    name,
+                    now,
+                    float(latest.get("open", 0)),
+                    float(latest.get("high", 0)),
+                    float(latest.get("low", 0)),
+                    float(latest.get("close", 0)),
+                    float(latest.get("volume", 0)),
+                    change,
+                    change_percent,
+                )
         except Exception as e:
             logger.error(f"Failed to get CN market data for {symbol}: {e}")
         
         return None
 
-    def _get_hk_market_data(self, symbol: str, period: str) -> Optional[Dict]:
-        """获取港股市场数据"""
-        now = datetime.now(pytz.timezone("Asia/Shanghai"))
+    def _get_hk_market_data(
+        self,
+        symbol: str,
+        period: str,
+        now: datetime,
+        spot: Optional[pd.DataFrame] = None,
+    ) -> Optional[Dict]:
+        """
+        获取港股市场数据
+        :param spot: 已按代码建索引的实时行情（批量获取时传入），不传则自行拉取
+        """
         name = self.INDEX_NAMES.get("HK", {}).get(symbol, symbol)
-        
-        def safe_float(val):
-            try:
-                if val is None or val == "" or val == "-":
-                    return 0.0
-                return float(str(val).replace(",", ""))
-            except (ValueError, TypeError):
-                return 0.0
-        
+
         # 方法1: 尝试使用 sina 实时 API
         try:
-            df = ak.stock_hk_index_spot_sina()
-            if df is not None and not df.empty:
-                for _, row in df.iterrows():
-                    code = str(row.get("代码", ""))
-                    if code == symbol:
-                        close_price = safe_float(row.get("最新价", 0))
-                        prev_close = safe_float(row.get("昨收", 0))
-                        change = close_price - prev_close if prev_close else 0
-                        change_percent = (change / prev_close * 100) if prev_close else 0
-                        
-                        return {
-                            "symbol": symbol,
-                            "market": "HK",
-                            "name": name,
-                            "time": now.strftime("%Y-%m-%d %H:%M:%S"),
-                            "open": round(safe_float(row.get("今开", 0)), 2),
-                            "high": round(safe_float(row.get("最高", 0)), 2),
-                            "low": round(safe_float(row.get("最低", 0)), 2),
-                            "close": round(close_price, 2),
-                            "volume": safe_float(row.get("成交量", 0)),
-                            "change": round(change, 2),
-                            "change_percent": round(change_percent, 2),
-                        }
+            if spot is None:
+                spot = self._load_spot(
+                    ak_cache.stock_hk_index_spot_sina, self._SPOT_NUMERIC_COLUMNS["HK"]
+                )
+            if symbol in spot.index:
+                # 数值列已在 _load_spot 中整列转换
+                row = spot.loc[symbol]
+                close_price = float(row.get("最新价", 0))
+                prev_close = float(row.get("昨收", 0))
+                change = close_price - prev_close if prev_close else 0
+                change_percent = (change / prev_close * 100) if prev_close else 0
+
+                return self._pack_quote(
+                    "HK",
+                    symbol,
+                    name,
+                    now,
+                    float(row.get("今开", 0)),
+                    float(row.get("最高", 0)),
+                    float(row.get("最低", 0)),
+                    close_price,
+                    float(row.get("成交量", 0)),
+                    change,
+                    change_percent,
+                )
         except Exception as e:
             logger.warning(f"Failed to get HK realtime data for {symbol}: {e}")
         
         # 方法2: 回退到日线数据
         try:
-            df = ak.stock_hk_index_daily_sina(symbol=symbol)
+            df = ak_cache.stock_hk_index_daily_sina(symbol)
             if df is not None and not df.empty:
-                latest = df.iloc[-1]
-                prev = df.iloc[-2] if len(df) > 1 else latest
+                latest, prev = self._last_two_rows(df)
                 
-                close_price = float(latest.get("close", 0) or 0)
-                prev_close = float(prev.get("close", 0) or 0)
+                close_price = float(latest.get("close", 0))
+                prev_close = float(prev.get("close", 0))
                 change = close_price - prev_close if prev_close else 0
                 change_percent = (change / prev_close * 100) if prev_close else 0
                 
-                return {
-                    "symbol": symbol,
-                    "market": "HK",
-                    "name": name,
-                    "time": now.strftime("%Y-%m-%d %H:%M:%S"),
-                    "open": round(float(latest.get("open", 0) or 0), 2),
-                    "high": round(float(latest.get("high", 0) or 0), 2),
-                    "low": round(float(latest.get("low", 0) or 0), 2),
-                    "close": round(close_price, 2),
-                    "volume": float(latest.get("volume", 0) or 0),
-                    "change": round(change, 2),
-                    "change_percent": round(change_percent, 2),
-                }
+                return self._pack_quote(
+                    "HK",
+                    symbol,
+                    name,
+                    now,
+                    float(latest.get("open", 0)),
+                    float(latest.get("high", 0)),
+                    float(latest.get("low", 0)),
+                    close_price,
+                    float(latest.get("volume", 0)),
+                    change,
+                    change_percent,
+                )
         except Exception as e:
             logger.error(f"Failed to get HK market data for {symbol}: {e}")
         
         return None
 
-    def _get_us_market_data(self, symbol: str, period: str) -> Optional[Dict]:
+    def _get_us_market_data(
+        self, symbol: str, period: str, now: datetime
+    ) -> Optional[Dict]:
         """获取美股市场数据"""
-        now = datetime.now(pytz.timezone("Asia/Shanghai"))
         name = self.INDEX_NAMES.get("US", {}).get(symbol, symbol)
         
-        # 美股指数代码映射到 sina API 格式
-        symbol_map = {
-            "DJI": ".DJI",      # 道琼斯
-            "IXIC": ".IXIC",   # 纳斯达克
-            "SPX": ".INX",      # 标普500
-        }
-        
-        sina_symbol = symbol_map.get(symbol, f".{symbol}")
+        sina_symbol = self.US_INDEX_SYMBOLS.get(symbol, f".{symbol}")
         
         try:
             # 使用 sina API 获取美股指数日线数据
-            df = ak.index_us_stock_sina(symbol=sina_symbol)
+            df = ak_cache.index_us_stock_sina(sina_symbol)
             if df is not None and not df.empty:
-                latest = df.iloc[-1]
-                prev = df.iloc[-2] if len(df) > 1 else latest
+                latest, prev = self._last_two_rows(df)
                 
-                close_price = float(latest.get("close", 0) or 0)
-                prev_close = float(prev.get("close", 0) or 0)
+                close_price = float(latest.get("close", 0))
+                prev_close = float(prev.get("close", 0))
                 change = close_price - prev_close if prev_close else 0
                 change_percent = (change / prev_close * 100) if prev_close else 0
                 
-                return {
-                    "symbol": symbol,
-                    "market": "US",
-                    "name": name,
-                    "time": now.strftime("%Y-%m-%d %H:%M:%S"),
-                    "open": round(float(latest.get("open", 0) or 0), 2),
-                    "high": round(float(latest.get("high", 0) or 0), 2),
-                    "low": round(float(latest.get("low", 0) or 0), 2),
-                    "close": round(close_price, 2),
-                    "volume": float(latest.get("volume", 0) or 0),
-                    "change": round(change, 2),
-                    "change_percent": round(change_percent, 2),
-                }
+                return self._pack_quote(
+                    "US",
+                    symbol,
+                    name,
+                    now,
+                    float(latest.get("open", 0)),
+                    float(latest.get("high", 0)),
+                    float(latest.get("low", 0)),
+                    close_price,
+                    float(latest.get("volume", 0)),
+                    change,
+                    change_percent,
+                )
         except Exception as e:
             logger.error(f"Failed to get US market data for {symbol}: {e}")
         
@@ -302,37 +416,11 @@ class MarketClient(BaseClient):
 
     def _get_cn_index_history(self, symbol: str, days: int) -> List[Dict]:
         """获取A股指数历史数据"""
-        symbol_map = {
-            "SSE": "000001",
-            "SZSE": "399001",
-            "ChiNext": "399006",
-        }
-        
-        actual_code = symbol_map.get(symbol, symbol)
-        daily_symbol = f"sh{actual_code}" if symbol == "SSE" else f"sz{actual_code}"
-        
         try:
-            df = ak.stock_zh_index_daily(symbol=daily_symbol)
+            df = ak_cache.stock_zh_index_daily(self._cn_daily_symbol(symbol))
             if df is not None and not df.empty:
                 # 取最近 N 天
-                df = df.tail(days)
-                result = []
-                for _, row in df.iterrows():
-                    date_val = row.get("date", "")
-                    if hasattr(date_val, "strftime"):
-                        date_str = date_val.strftime("%m/%d")
-                    else:
-                        date_str = str(date_val)[-5:] if len(str(date_val)) >= 5 else str(date_val)
-                    
-                    result.append({
-                        "date": date_str,
-                        "close": round(float(row.get("close", 0) or 0), 2),
-                        "open": round(float(row.get("open", 0) or 0), 2),
-                        "high": round(float(row.get("high", 0) or 0), 2),
-                        "low": round(float(row.get("low", 0) or 0), 2),
-                        "volume": float(row.get("volume", 0) or 0),
-                    })
-                return result
+                return self._history_records(df.tail(days))
         except Exception as e:
             logger.error(f"Failed to get CN index history for {symbol}: {e}")
         
@@ -341,26 +429,9 @@ class MarketClient(BaseClient):
     def _get_hk_index_history(self, symbol: str, days: int) -> List[Dict]:
         """获取港股指数历史数据"""
         try:
-            df = ak.stock_hk_index_daily_sina(symbol=symbol)
+            df = ak_cache.stock_hk_index_daily_sina(symbol)
             if df is not None and not df.empty:
-                df = df.tail(days)
-                result = []
-                for _, row in df.iterrows():
-                    date_val = row.get("date", "")
-                    if hasattr(date_val, "strftime"):
-                        date_str = date_val.strftime("%m/%d")
-                    else:
-                        date_str = str(date_val)[-5:] if len(str(date_val)) >= 5 else str(date_val)
-                    
-                    result.append({
-                        "date": date_str,
-                        "close": round(float(row.get("close", 0) or 0), 2),
-                        "open": round(float(row.get("open", 0) or 0), 2),
-                        "high": round(float(row.get("high", 0) or 0), 2),
-                        "low": round(float(row.get("low", 0) or 0), 2),
-                        "volume": float(row.get("volume", 0) or 0),
-                    })
-                return result
+                return self._history_records(df.tail(days))
         except Exception as e:
             logger.error(f"Failed to get HK index history for {symbol}: {e}")
         
@@ -368,36 +439,96 @@ class MarketClient(BaseClient):
 
     def _get_us_index_history(self, symbol: str, days: int) -> List[Dict]:
         """获取美股指数历史数据"""
-        symbol_map = {
-            "DJI": ".DJI",
-            "IXIC": ".IXIC",
-            "SPX": ".INX",
-        }
-        
-        sina_symbol = symbol_map.get(symbol, f".{symbol}")
+        sina_symbol = self.US_INDEX_SYMBOLS.get(symbol, f".{symbol}")
         
         try:
-            df = ak.index_us_stock_sina(symbol=sina_symbol)
+            df = ak_cache.index_us_stock_sina(sina_symbol)
             if df is not None and not df.empty:
-                df = df.tail(days)
-                result = []
-                for _, row in df.iterrows():
-                    date_val = row.get("date", "")
-                    if hasattr(date_val, "strftime"):
-                        date_str = date_val.strftime("%m/%d")
-                    else:
-                        date_str = str(date_val)[-5:] if len(str(date_val)) >= 5 else str(date_val)
-                    
-                    result.append({
-                        "date": date_str,
-                        "close": round(float(row.get("close", 0) or 0), 2),
-                        "open": round(float(row.get("open", 0) or 0), 2),
-                        "high": round(float(row.get("high", 0) or 0), 2),
-                        "low": round(float(row.get("low", 0) or 0), 2),
-                        "volume": float(row.get("volume", 0) or 0),
-                    })
-                return result
+                return self._history_records(df.tail(days))
         except Exception as e:
             logger.error(f"Failed to get US index history for {symbol}: {e}")
         
         return []
+
+    def _cn_daily_symbol(self, symbol: str) -> str:
+        """A股指数日线接口代码，未配置的 symbol 视为深市指数代码"""
+        daily_symbol = self.CN_DAILY_SYMBOLS.get(symbol)
+        if daily_symbol is None:
+            daily_symbol = f"sz{self.CN_INDEX_CODES.get(symbol, symbol)}"
+        return daily_symbol
+
+    @staticmethod
+    def _last_two_rows(df: pd.DataFrame) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        取日线最后两行的 OHLCV 列为普通 dict（只有一行时两者相同）
+        只转换用到的列和行并整体转为 float，空值填 0，避免逐字段的 Series 索引和空值判断
+        """
+        cols = [col for col in _DAILY_COLUMNS if col in df.columns]
+        tail = df[cols].iloc[-2:]
+        if all(pd.api.types.is_numeric_dtype(dtype) for dtype in tail.dtypes):
+            # 日线接口通常已是数值列，直接整块转为 float64，空值填 0
+            tail = tail.to_numpy(dtype=np.float64, na_value=0.0)
+        else:
+            tail = coerce_numeric(tail, cols).to_numpy()
+        latest = dict(zip(cols, tail[-1]))
+        prev = dict(zip(cols, tail[0]))
+        return latest, prev
+
+    @staticmethod
+    def _pack_quote(
+        market: str,
+        symbol: str,
+        name: str,
+        now: datetime,
+        open_price: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+        change: float,
+        change_percent: float,
+    ) -> Dict:
+        """将已转换好的数值打包为指数行情 dict（价格和涨跌保留两位小数，成交量不取整）"""
+        return {
+            "symbol": symbol,
+            "market": market,
+            "name": name,
+            "time": now.strftime(_TIME_FMT),
+            "open": round(open_price, 2),
+            "high": round(high, 2),
+            "low": round(low, 2),
+            "close": round(close, 2),
+            "volume": volume,
+            "change": round(change, 2),
+            "change_percent": round(change_percent, 2),
+        }
+
+    @staticmethod
+    def _history_records(df: pd.DataFrame) -> List[Dict]:
+        """日线 DataFrame 整列转为折线图数据（日期取 月/日）"""
+        dates = df["date"] if "date" in df.columns else pd.Series("", index=df.index)
+        if pd.api.types.is_datetime64_any_dtype(dates):
+            date_strs = dates.dt.strftime("%m/%d")
+        elif pd.api.types.infer_dtype(dates, skipna=True) in ("date", "datetime"):
+            # date/datetime 对象列整列转换后格式化，无法转换的值回退为字符串末 5 位
+            date_strs = (
+                pd.to_datetime(dates, errors="coerce")
+                .dt.strftime("%m/%d")
+                .fillna(dates.astype(str).str[-5:])
+            )
+        else:
+            date_strs = dates.astype(str).str[-5:]
+
+        numeric = coerce_numeric(df, ("close", "open", "high", "low", "volume"))
+        out = pd.DataFrame(
+            {
+                "date": date_strs,
+                "close": numeric["close"].round(2),
+                "open": numeric["open"].round(2),
+                "high": numeric["high"].round(2),
+                "low": numeric["low"].round(2),
+                "volume": numeric["volume"],
+            },
+            index=df.index,
+        )
+        return frame_to_records(out)
@@ -0,0 +1,44 @@
+"""
+AKShare 共享 HTTP 连接池
+
+akshare 内部直接调用 requests.get/post，每次调用都会新建 Session，
+无法复用 TCP/TLS 连接。这里用一个进程级 Session 接管 requests.api.request，
+让 akshare 及本项目的 requests 调用共享同一个连接池。
+共享 Session 不保存 Cookie，各次调用与原先一样互不影响（单次调用内的重定向仍会携带）。
+"""
+
+from http.cookiejar import DefaultCookiePolicy
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+http_session = requests.Session()
+
+_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(total=2, backoff_factor=0.2),
+)
+http_session.mount("http://", _adapter)
+http_session.mount("https://", _adapter)
+# 拒绝所有域名的 Cookie：避免一个接口的 Set-Cookie 泄漏到其他请求，也避免多线程并发修改同一个 CookieJar
+http_session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+_installed = False
+
+
+def _pooled_request(method, url, **kwargs):
+    """与 requests.request 签名一致，改为走共享 Session"""
+    return http_session.request(method=method, url=url, **kwargs)
+
+
+def install_shared_session() -> None:
+    """让 requests.get/post 等模块级函数复用共享 Session（幂等）"""
+    global _installed
+    if _installed:
+        return
+    # requests.get 等函数在调用时才查找 requests.api.request
+    requests.api.request = _pooled_request
+    requests.request = _pooled_request
+    _installed = True
@@ -2,17 +2,56 @@
 股票数据客户端 - 使用 AKShare
 """
 
+import asyncio
+import io
 import logging
+import threading
 import time
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import akshare as ak
+import numpy as np
 import pandas as pd
+from cachetools import TTLCache
+from src.infrastructure.client.akshare.frame import coerce_numeric, frame_to_records
+from src.infrastructure.client.akshare.session import http_session
 from src.infrastructure.client.base import BaseClient
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# 股票代码首位 -> 交易所前缀
+_SYMBOL_PREFIXES = {
+    "6": "sh",  # 上海
+    "0": "sz",  # 深圳
+    "3": "sz",
+    "8": "bj",  # 北交所
+    "4": "bj",
+}
+
+
+# 释放 Redis 锁：值等于自己的令牌时才删除，避免删掉超时后被其他进程重新获取的锁
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+@lru_cache(maxsize=8192)
+def _symbol_with_prefix(code: str) -> str:
+    """带交易所前缀的股票代码，A股代码数量有限，结果按代码缓存"""
+    return f"{_SYMBOL_PREFIXES.get(code[:1], 'sh')}{code}"
+
 
 class StockClient(BaseClient):
     """股票数据客户端"""
@@ -21,10 +60,57 @@ class StockClient(BaseClient):
     _stock_list_cache: Optional[pd.DataFrame] = None
     _stock_list_cache_time: float = 0
     _stock_list_cache_ttl: int = 3600  # 缓存 1 小时
-
-    async def request(self, *args, **kwargs) -> Any:
-        """实现基类方法"""
-        pass
+    # 搜索用索引：(股票列表 DataFrame, 代码数组, 小写名称数组)，列表缓存更新后按需重建
+    _stock_search_index: Optional[Tuple[pd.DataFrame, np.ndarray, np.ndarray]] = None
+
+    # A股实时行情数值列 -> 输出字段（按输出顺序）
+    _CN_SPOT_NUMERIC_FIELDS = {
+        "今开": "open",
+        "最高": "high",
+        "最低": "low",
+        "最新价": "close",
+        "成交量": "volume",
+        "成交额": "amount",
+        "涨跌额": "change",
+        "涨跌幅": "change_percent",
+        "换手率": "turnover",
+        "市盈率-动态": "pe_ratio",
+        "市净率": "pb_ratio",
+        "总市值": "total_value",
+        "流通市值": "circulating_value",
+    }
+
+    # 百度估值指标：(指标名, 输出字段, 倍数, 日志名)，总市值单位为亿，转为元
+    _CN_VALUATION_INDICATORS = (
+        ("市净率", "pb_ratio", 1, "PB ratio"),
+        ("市盈率(静)", "pe_ratio", 1, "PE ratio"),
+        ("总市值", "total_value", 100000000, "market cap"),
+    )
+    _HK_VALUATION_INDICATORS = (
+        ("市盈率(TTM)", "pe_ratio", 1, "HK PE ratio"),
+        ("市净率", "pb_ratio", 1, "HK PB ratio"),
+        ("总市值", "total_value", 100000000, "HK market cap"),
+    )
+
+    # A股估值缓存：代码 -> 估值，估值日内变化很小；限制条数，过期条目自动淘汰
+    _VALUATION_CACHE_TTL = 3600  # 缓存 1 小时
+    _valuation_cache = TTLCache(maxsize=2048, ttl=_VALUATION_CACHE_TTL)
+    _valuation_lock = threading.Lock()
+
+    # 批量获取时逐只补取行情的线程池
+    _io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="stock-io")
+    # 估值各指标并发请求的线程池；与 _io_pool 分开，避免外层任务占满线程后内层请求排队等待
+    _valuation_pool = ThreadPoolExecutor(
+        max_workers=12, thread_name_prefix="stock-valuation"
+    )
+
+    async def request(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        在线程池中执行同步的客户端方法，避免 AKShare 阻塞事件循环
+        使用事件循环默认线程池，与方法内部并发请求所用的 _io_pool 分开，避免嵌套提交时互相等待
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(func, *args, **kwargs))
 
     def _get_stock_list_cached(self) -> pd.DataFrame:
         """获取缓存的股票列表"""
@@ -55,117 +141,204 @@ class StockClient(BaseClient):
                 return StockClient._stock_list_cache
             return pd.DataFrame()
 
-    def _get_stock_symbol_with_prefix(self, code: str) -> str:
-        """获取带交易所前缀的股票代码
+    # 新浪行情接口请求头（各请求共用，经共享连接池保持长连接）
+    _SINA_HEADERS = {"Referer": "https://finance.sina.com.cn"}
 
-        规则：
-        - 6 开头: 上海 (sh)
-        - 0, 3 开头: 深圳 (sz)
-        - 8, 4 开头: 北交所 (bj)
-        """
-        if code.startswith("6"):
-            return f"sh{code}"
-        elif code.startswith(("0", "3")):
-            return f"sz{code}"
-        elif code.startswith(("8", "4")):
-            return f"bj{code}"
-        else:
-            # 默认上海
-            return f"sh{code}"
+    def _get_stock_symbol_with_prefix(self, code: str) -> str:
+        """获取带交易所前缀的股票代码（按首位查表，未知时默认上海）"""
+        return _symbol_with_prefix(code)
 
     def get_cn_stock_list(self) -> List[Dict[str, Any]]:
         """获取A股股票列表"""
         try:
             df = self._get_stock_list_cached()
-            return [
+            # 整列判断交易所，不修改共享的列表缓存
+            out = pd.DataFrame(
                 {
-                    "code": row["code"],
-                    "name": row["name"],
+                    "code": df["code"],
+                    "name": df["name"],
                     "market": "CN",
-                    "exchange": "SH" if row["code"].startswith("6") else "SZ",
-                }
-                for _, row in df.iterrows()
-            ]
+                    "exchange": np.where(df["code"].str.startswith("6"), "SH", "SZ"),
+                },
+                index=df.index,
+            )
+            return frame_to_records(out)
         except Exception as e:
             logger.error(f"Failed to get CN stock list: {e}")
             return []
 
+    # A股实时行情快照 Redis 缓存键和 TTL（全市场约 5000 行，多个接口和进程共用）
+    _CN_SPOT_CACHE_KEY = "stock_spot:CN"
+    _CN_SPOT_CACHE_TTL = 5  # 缓存 5 秒
+    _CN_SPOT_LOCK_TTL = 10  # 刷新锁最长持有 10 秒
+    # 进程内快照 (获取时间, DataFrame)：同一进程内短时间多次调用直接复用，不访问 Redis
+    _cn_spot_local: Optional[Tuple[float, pd.DataFrame]] = None
+    _CN_SPOT_LOCAL_TTL = 2  # 进程内复用 2 秒，与 Redis 叠加后最长约 7 秒
+    _CN_SPOT_STALE_TTL = 30  # 其他进程刷新期间，30 秒内的进程内快照可直接返回
+    # 行情快照的 (快照 DataFrame, 代码索引)，快照更新后按需重建
+    _cn_spot_index: Optional[Tuple[pd.DataFrame, pd.Index]] = None
+
+    def _get_cn_spot_cached(self) -> pd.DataFrame:
+        """
+        获取A股实时行情快照（stock_zh_a_spot_em，进程内 + Redis 短时缓存）
+        以 Arrow IPC（feather）编码存储，避免 JSON 的数值转字符串开销；
+        缓存失效时只有拿到刷新锁的进程请求上游，其余进程不等待：
+        有不太旧的进程内快照时先用它，否则自行请求
+        """
+        now = time.time()
+        local = StockClient._cn_spot_local
+        if local is not None and now - local[0] < self._CN_SPOT_LOCAL_TTL:
+            return local[1]
+        stale = (
+            local[1]
+            if local is not None and now - local[0] < self._CN_SPOT_STALE_TTL
+            else None
+        )
+        df = self._load_cn_spot(stale)
+        # 返回旧快照时不刷新时间，避免旧数据被一直当作新数据复用
+        if df is not stale:
+            StockClient._cn_spot_local = (time.time(), df)
+        return df
+
+    def _load_cn_spot(self, stale: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """
+        从 Redis 读取A股行情快照，未命中时加锁请求上游并写回 Redis
+        :param stale: 没抢到刷新锁时可返回的旧快照，None 表示直接请求上游
+        """
+        from src.infrastructure.cache.redis_cache import cache
+
+        lock_key = f"{self._CN_SPOT_CACHE_KEY}:lock"
+
+        # 1. 先从 Redis 获取
+        try:
+            cached = cache.client.get(self._CN_SPOT_CACHE_KEY)
+            if cached:
+                return pd.read_feather(io.BytesIO(cached))
+        except Exception as e:
+            logger.warning(f"Failed to get CN spot from Redis: {e}")
+
+        # 2. 抢刷新锁（值为随机令牌，释放时只删除自己的锁）；没抢到时不等待
+        token = uuid.uuid4().hex
+        try:
+            locked = bool(
+                cache.client.set(lock_key, token, nx=True, ex=self._CN_SPOT_LOCK_TTL)
+            )
+        except Exception as e:
+            logger.warning(f"Failed to acquire CN spot refresh lock: {e}")
+            locked = False
+        else:
+            if not locked and stale is not None:
+                logger.debug("CN spot refresh in progress, using stale snapshot")
+                return stale
+
+        # 3. 从 API 获取并写入 Redis
+        try:
+            df = ak.stock_zh_a_spot_em()
+            try:
+                buf = io.BytesIO()
+                df.reset_index(drop=True).to_feather(buf)
+                cache.client.setex(
+                    self._CN_SPOT_CACHE_KEY, self._CN_SPOT_CACHE_TTL, buf.getvalue()
+                )
+            except Exception as e:
+                logger.warning(f"Failed to cache CN spot: {e}")
+            return df
+        finally:
+            if locked:
+                try:
+                    cache.client.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+                except Exception as e:
+                    logger.warning(f"Failed to release CN spot refresh lock: {e}")
+
     def get_cn_stock_realtime(self, codes: List[str] = None) -> List[Dict[str, Any]]:
         """获取A股实时行情"""
         try:
-            df = ak.stock_zh_a_spot_em()
+            df = self._get_cn_spot_cached()
 
             if codes:
-                df = df[df["代码"].isin(codes)]
+                df = self._select_spot_rows(df, codes)
 
-            result = []
-            now = datetime.now()
-
-            for _, row in df.iterrows():
-                result.append(
-                    {
-                        "time": now,
-                        "code": row["代码"],
-                        "market": "CN",
-                        "name": row["名称"],
-                        "open": float(row.get("今开", 0) or 0),
-                        "high": float(row.get("最高", 0) or 0),
-                        "low": float(row.get("最低", 0) or 0),
-                        "close": float(row.get("最新价", 0) or 0),
-                        "volume": int(row.get("成交量", 0) or 0),
-                        "amount": float(row.get("成交额", 0) or 0),
-                        "change": float(row.get("涨跌额", 0) or 0),
-                        "change_percent": float(row.get("涨跌幅", 0) or 0),
-                        "turnover": float(row.get("换手率", 0) or 0),
-                        "pe_ratio": float(row.get("市盈率-动态", 0) or 0),
-                        "pb_ratio": float(row.get("市净率", 0) or 0),
-                        "total_value": float(row.get("总市值", 0) or 0),
-                        "circulating_value": float(row.get("流通市值", 0) or 0),
-                    }
-                )
-
-            return result
+            return self._cn_spot_records(df, datetime.now())
         except Exception as e:
             logger.error(f"Failed to get CN stock realtime: {e}")
             return []
 
+    def _select_spot_rows(self, df: pd.DataFrame, codes: List[str]) -> pd.DataFrame:
+        """
+        按代码从行情快照中取行（按请求顺序，重复和不存在的代码跳过）
+        代码 -> 行号索引按快照对象缓存，同一快照多次查询时只建一次
+        """
+        entry = StockClient._cn_spot_index
+        if entry is not None and entry[0] is df:
+            index = entry[1]
+        else:
+            index = pd.Index(df["代码"])
+            StockClient._cn_spot_index = (df, index)
+        if not index.is_unique:
+            return df[df["代码"].isin(set(codes))]
+        positions = index.get_indexer(list(dict.fromkeys(codes)))
+        return df.iloc[positions[positions >= 0]]
+
+    def _cn_spot_records(self, df: pd.DataFrame, now: datetime) -> List[Dict[str, Any]]:
+        """A股实时行情 DataFrame 整列转为行情 dict 列表（数值为空或无法解析时填 0）"""
+        numeric = coerce_numeric(df, self._CN_SPOT_NUMERIC_FIELDS).rename(
+            columns=self._CN_SPOT_NUMERIC_FIELDS
+        )
+        numeric["volume"] = numeric["volume"].astype("int64")
+        out = pd.concat(
+            [
+                pd.DataFrame(
+                    {"time": now, "code": df["代码"], "market": "CN", "name": df["名称"]},
+                    index=df.index,
+                ),
+                numeric,
+            ],
+            axis=1,
+        )
+        return frame_to_records(out)
+
     def _get_stock_valuation(self, code: str) -> Dict[str, float]:
         """
         获取股票估值数据（市盈率、市净率、总市值）
-        使用 stock_zh_valuation_baidu 接口
+        使用 stock_zh_valuation_baidu 接口，结果在进程内缓存
         """
-        valuation = {"pe_ratio": 0, "pb_ratio": 0, "total_value": 0}
-
-        # 获取市净率
-        try:
-            df = ak.stock_zh_valuation_baidu(
-                symbol=code, indicator="市净率", period="近一年"
-            )
-            if df is not None and not df.empty:
-                valuation["pb_ratio"] = float(df.iloc[-1]["value"])
-        except Exception as e:
-            logger.debug(f"Failed to get PB ratio for {code}: {e}")
-
-        # 获取市盈率（静态）
-        try:
-            df = ak.stock_zh_valuation_baidu(
-                symbol=code, indicator="市盈率(静)", period="近一年"
-            )
-            if df is not None and not df.empty:
-                valuation["pe_ratio"] = float(df.iloc[-1]["value"])
-        except Exception as e:
-            logger.debug(f"Failed to get PE ratio for {code}: {e}")
+        with StockClient._valuation_lock:
+            cached = StockClient._valuation_cache.get(code)
+        if cached is not None:
+            return cached
+
+        valuation = self._fetch_valuation(
+            ak.stock_zh_valuation_baidu, code, self._CN_VALUATION_INDICATORS
+        )
+        # 全部指标都失败时不缓存，下次重新请求
+        if any(valuation.values()):
+            with StockClient._valuation_lock:
+                StockClient._valuation_cache[code] = valuation
+        return valuation
 
-        # 获取总市值（单位：亿）
-        try:
-            df = ak.stock_zh_valuation_baidu(
-                symbol=code, indicator="总市值", period="近一年"
+    def _fetch_valuation(
+        self, fetch: Callable[..., pd.DataFrame], code: str, indicators: tuple
+    ) -> Dict[str, float]:
+        """并发请求各估值指标，取每个指标的最新值；单个指标失败时保持为 0"""
+        valuation = {"pe_ratio": 0, "pb_ratio": 0, "total_value": 0}
+        pending = [
+            (
+                field,
+                scale,
+                label,
+                self._valuation_pool.submit(
+                    fetch, symbol=code, indicator=indicator, period="近一年"
+                ),
             )
-            if df is not None and not df.empty:
-                # 百度返回的已经是亿为单位，转为元
-                valuation["total_value"] = float(df.iloc[-1]["value"]) * 100000000
-        except Exception as e:
-            logger.debug(f"Failed to get market cap for {code}: {e}")
+            for indicator, field, scale, label in indicators
+        ]
+        for field, scale, label, future in pending:
+            try:
+                df = future.result()
+                if df is not None and not df.empty:
+                    valuation[field] = float(df.iloc[-1]["value"]) * scale
+            except Exception as e:
+                logger.debug(f"Failed to get {label} for {code}: {e}")
 
         return valuation
 
@@ -174,16 +347,13 @@ class StockClient(BaseClient):
         获取单个股票的实时数据
         使用新浪实时数据接口
         """
-        import requests
-
         now = datetime.now()
         symbol = self._get_stock_symbol_with_prefix(code)
 
         try:
             # 使用新浪实时数据接口
             url = f"https://hq.sinajs.cn/list={symbol}"
-            headers = {"Referer": "https://finance.sina.com.cn"}
-            resp = requests.get(url, headers=headers, timeout=10)
+            resp = http_session.get(url, headers=self._SINA_HEADERS, timeout=10)
 
             if resp.status_code == 200 and "=" in resp.text:
                 # 解析数据: var hq_str_sh600580="名称,今开,昨收,最新价,最高,最低,买入,卖出,成交量,成交额,..."
@@ -243,40 +413,21 @@ class StockClient(BaseClient):
 
         # 首先尝试从热门列表获取
         try:
-            df = ak.stock_zh_a_spot_em()
-            for _, row in df.iterrows():
-                code = row.get("代码", "")
-                if code in codes:
-                    now = datetime.now()
-                    result.append(
-                        {
-                            "time": now,
-                            "code": code,
-                            "market": "CN",
-                            "name": row["名称"],
-                            "open": float(row.get("今开", 0) or 0),
-                            "high": float(row.get("最高", 0) or 0),
-                            "low": float(row.get("最低", 0) or 0),
-                            "close": float(row.get("最新价", 0) or 0),
-                            "volume": int(row.get("成交量", 0) or 0),
-                            "amount": float(row.get("成交额", 0) or 0),
-                            "change": float(row.get("涨跌额", 0) or 0),
-                            "change_percent": float(row.get("涨跌幅", 0) or 0),
-                            "turnover": float(row.get("换手率", 0) or 0),
-                            "pe_ratio": float(row.get("市盈率-动态", 0) or 0),
-                            "pb_ratio": float(row.get("市净率", 0) or 0),
-                            "total_value": float(row.get("总市值", 0) or 0),
-                            "circulating_value": float(row.get("流通市值", 0) or 0),
-                        }
-                    )
-                    found_codes.add(code)
+            df = self._get_cn_spot_cached()
+            df = self._select_spot_rows(df, codes)
+            result.extend(self._cn_spot_records(df, datetime.now()))
+            found_codes.update(df["代码"])
         except Exception as e:
             logger.warning(f"Failed to get batch realtime from spot: {e}")
 
         # 对于没找到的股票，单独获取
-        missing_codes = set(codes) - found_codes
-        for code in missing_codes:
-            data = self.get_single_stock_realtime(code)
+        # 各只互不依赖，并发获取
+        missing_codes = [
+            code for code in dict.fromkeys(codes) if code not in found_codes
+        ]
+        for code, data in zip(
+            missing_codes, self._io_pool.map(self.get_single_stock_realtime, missing_codes)
+        ):
             if data:
                 result.append(data)
             else:
@@ -308,47 +459,101 @@ class StockClient(BaseClient):
                 return []
 
             # 按日期过滤
-            if start_date:
-                start_dt = pd.to_datetime(start_date)
-                df = df[df["date"] >= start_dt]
-            if end_date:
-                end_dt = pd.to_datetime(end_date)
-                df = df[df["date"] <= end_dt]
-
-            result = []
-            for _, row in df.iterrows():
-                # 计算涨跌额和涨跌幅（stock_zh_a_daily 不直接提供）
-                result.append(
-                    {
-                        "time": pd.to_datetime(row["date"]),
-                        "code": code,
-                        "market": "CN",
-                        "open": float(row.get("open", 0)),
-                        "high": float(row.get("high", 0)),
-                        "low": float(row.get("low", 0)),
-                        "close": float(row.get("close", 0)),
-                        "volume": int(row.get("volume", 0)),
-                        "amount": float(row.get("amount", 0)),
-                        "change": 0,  # 需要计算
-                        "change_percent": 0,  # 需要计算
-                        "turnover": float(row.get("turnover", 0) or 0),
-                    }
-                )
+            df = self._filter_by_date(df, "date", start_date, end_date)
 
-            # 计算涨跌额和涨跌幅
-            for i in range(1, len(result)):
-                prev_close = result[i - 1]["close"]
-                if prev_close > 0:
-                    result[i]["change"] = round(result[i]["close"] - prev_close, 2)
-                    result[i]["change_percent"] = round(
-                        (result[i]["close"] - prev_close) / prev_close * 100, 2
-                    )
+            # 数值列整列转换，缺失列或空值填 0
+            numeric = coerce_numeric(
+                df, ("open", "high", "low", "close", "volume", "amount", "turnover")
+            )
 
-            return result
+            # 计算涨跌额和涨跌幅（stock_zh_a_daily 不直接提供），首行及前收盘 <= 0 时为 0
+            close = numeric["close"]
+            prev_close = close.shift(1)
+            has_prev = prev_close > 0
+            change = close - prev_close
+            change_percent = (change / prev_close * 100).where(has_prev, 0.0).round(2)
+            change = change.where(has_prev, 0.0).round(2)
+
+            out = pd.DataFrame(
+                {
+                    "time": pd.to_datetime(df["date"]),
+                    "code": code,
+                    "market": "CN",
+                    "open": numeric["open"],
+                    "high": numeric["high"],
+                    "low": numeric["low"],
+                    "close": close,
+                    "volume": numeric["volume"].astype("int64"),
+                    "amount": numeric["amount"],
+                    "change": change,
+                    "change_percent": change_percent,
+                    "turnover": numeric["turnover"],
+                },
+                index=df.index,
+            )
+            return frame_to_records(out)
         except Exception as e:
             logger.error(f"Failed to get stock history for {code}: {e}")
             return []
 
+    def get_stock_recent_closes(self, code: str, days: int = 7) -> List[float]:
+        """
+        获取最近 days 个交易日的收盘价（前复权，走势图用）
+        stock_zh_a_daily 每次都下载全部历史，这里改用支持服务端日期区间的
+        stock_zh_a_hist 只取最近一段；失败时回退到完整历史
+        """
+        end = datetime.now()
+        # 按自然日多取一段，覆盖周末和长假
+        start = end - timedelta(days=days * 2 + 10)
+        try:
+            df = ak.stock_zh_a_hist(
+                symbol=code,
+                period="daily",
+                start_date=start.strftime("%Y%m%d"),
+                end_date=end.strftime("%Y%m%d"),
+                adjust="qfq",
+            )
+            if df is not None and not df.empty:
+                return coerce_numeric(df.tail(days), ["收盘"])["收盘"].tolist()
+        except Exception as e:
+            logger.debug(f"Failed to get recent closes for {code}: {e}")
+
+        history = self.get_stock_history(code, period="daily")
+        return [h["close"] for h in history[-days:]]
+
+    @staticmethod
+    def _filter_by_date(
+        df: pd.DataFrame, column: str, start_date: str = None, end_date: str = None
+    ) -> pd.DataFrame:
+        """按日期区间过滤（含首尾），日期列只解析一次，起止条件合并为一个掩码"""
+        if not (start_date or end_date):
+            return df
+        dates = pd.to_datetime(df[column]).to_numpy()
+        mask = np.ones(len(df), dtype=bool)
+        if start_date:
+            mask &= dates >= np.datetime64(pd.to_datetime(start_date))
+        if end_date:
+            mask &= dates <= np.datetime64(pd.to_datetime(end_date))
+        return df[mask]
+
+    @staticmethod
+    def _get_stock_search_index(
+        df: pd.DataFrame,
+    ) -> Tuple[pd.DataFrame, np.ndarray, np.ndarray]:
+        """
+        获取股票列表的搜索索引（代码、小写名称的 NumPy 字符串数组）
+        与列表 DataFrame 绑定缓存，列表刷新后首次搜索时重建
+        """
+        index = StockClient._stock_search_index
+        if index is None or index[0] is not df:
+            index = (
+                df,
+                df["code"].fillna("").astype(str).to_numpy(dtype=str),
+                df["name"].fillna("").astype(str).str.lower().to_numpy(dtype=str),
+            )
+            StockClient._stock_search_index = index
+        return index
+
     def search_stock(self, keyword: str) -> List[Dict[str, Any]]:
         """搜索股票（使用缓存的股票列表）"""
         try:
@@ -358,84 +563,121 @@ class StockClient(BaseClient):
             if df.empty:
                 return []
 
-            # 按代码或名称搜索
-            mask = df["code"].str.contains(keyword, na=False) | df["name"].str.contains(
-                keyword, na=False
+            # 按代码或名称搜索（子串匹配，名称不区分大小写），取前 20 条
+            _, codes_arr, names_arr = self._get_stock_search_index(df)
+            hits = (np.char.find(codes_arr, keyword) >= 0) | (
+                np.char.find(names_arr, keyword.lower()) >= 0
             )
-            df = df[mask].head(20)
+            df = df.iloc[np.flatnonzero(hits)[:20]]
 
             if df.empty:
                 return []
 
             # 获取搜索结果的股票代码
             codes = df["code"].tolist()
+            price = np.zeros(len(codes))
+            change_percent = np.zeros(len(codes))
+            found = np.zeros(len(codes), dtype=bool)
 
-            # 尝试获取实时价格
-            price_map = {}
+            # 尝试从行情快照整列取实时价格
             try:
-                realtime_df = ak.stock_zh_a_spot_em()
-                for _, row in realtime_df.iterrows():
-                    code = row.get("代码", "")
-                    if code in codes:
-                        price_map[code] = {
-                            "price": float(row.get("最新价", 0) or 0),
-                            "change_percent": float(row.get("涨跌幅", 0) or 0),
-                        }
+                spot = self._select_spot_rows(self._get_cn_spot_cached(), codes)
+                numeric = coerce_numeric(spot, ["最新价", "涨跌幅"])
+                numeric.index = spot["代码"].to_numpy()
+                numeric = numeric[~numeric.index.duplicated()].reindex(codes)
+                found = numeric["最新价"].notna().to_numpy()
+                price = numeric["最新价"].fillna(0).to_numpy(copy=True)
+                change_percent = numeric["涨跌幅"].fillna(0).to_numpy(copy=True)
             except Exception as e:
                 logger.debug(f"Failed to get realtime prices from spot: {e}")
 
-            # 对于没有实时价格的股票，单独获取
-            result = []
-            for _, row in df.iterrows():
-                code = row["code"]
-                if code in price_map:
-                    price_info = price_map[code]
-                else:
-                    # 单独获取这只股票的实时数据
-                    single_data = self.get_single_stock_realtime(code)
-                    if single_data:
-                        price_info = {
-                            "price": single_data["close"],
-                            "change_percent": single_data["change_percent"],
-                        }
-                    else:
-                        price_info = {"price": 0, "change_percent": 0}
-
-                result.append(
-                    {
-                        "code": code,
-                        "name": row["name"],
-                        "market": "CN",
-                        "price": price_info["price"],
-                        "change_percent": price_info["change_percent"],
-                    }
+            # 对于没有实时价格的股票，单独获取（并发）
+            missing = np.flatnonzero(~found)
+            if len(missing):
+                singles = self._io_pool.map(
+                    self.get_single_stock_realtime, [codes[i] for i in missing]
                 )
+                for i, single_data in zip(missing, singles):
+                    if single_data:
+                        price[i] = single_data["close"]
+                        change_percent[i] = single_data["change_percent"]
 
-            return result
+            out = pd.DataFrame(
+                {
+                    "code": codes,
+                    "name": df["name"].to_numpy(),
+                    "market": "CN",
+                    "price": price,
+                    "change_percent": change_percent,
+                }
+            )
+            return frame_to_records(out)
         except Exception as e:
             logger.error(f"Failed to search stock: {e}")
             return []
 
     # ========== 港股搜索（使用新浪 API + Redis 缓存） ==========
 
-    # Redis 缓存键
-    _HK_STOCK_LIST_CACHE_KEY = "stock_list:HK"
-    _US_STOCK_LIST_CACHE_KEY = "stock_list:US"
+    # Redis 缓存键（msgpack 编码，带版本号避免读到旧的 JSON 缓存）
+    _HK_STOCK_LIST_CACHE_KEY = "stock_list:HK:v2"
+    _US_STOCK_LIST_CACHE_KEY = "stock_list:US:v2"
     _STOCK_LIST_CACHE_TTL = 86400  # 缓存 1 天
+    _HK_STOCK_LIST_URL = (
+        "http://vip.stock.finance.sina.com.cn/quotes_service/api/json_v2.php/"
+        "Market_Center.getHKStockData"
+    )
+    _HK_STOCK_LIST_PARAMS = {"num": 100, "sort": "symbol", "asc": 1, "node": "qbgg_hk"}
+    _HK_STOCK_LIST_MAX_PAGE = 99  # 新浪港股列表最多取 99 页
+    _HK_STOCK_LIST_PAGE_BATCH = 4  # 每轮并发请求的页数，与 _io_pool 线程数一致
+    # 港股/美股列表的进程内记忆：Redis 键 -> (读取时间, 列表)
+    _stock_list_memo: Dict[str, Tuple[float, List[Dict]]] = {}
+    _STOCK_LIST_MEMO_TTL = 60  # 记忆 60 秒
+    # 港股/美股列表整理成的 DataFrame（按代码索引，数值列已转换）：
+    # 市场 -> (来源列表, DataFrame)，来源列表即进程内记忆的对象，记忆更新后按需重建
+    _stock_frames: Dict[str, Tuple[List[Dict], pd.DataFrame]] = {}
+    # 港股/美股搜索索引：市场 -> (来源列表, 小写代码数组, 名称数组)，来源列表更新后按需重建
+    _list_search_index: Dict[str, Tuple[List[Dict], np.ndarray, np.ndarray]] = {}
+    # 列表中需要转为数值的字段
+    _HK_LIST_NUMERIC_FIELDS = (
+        "open",
+        "high",
+        "low",
+        "lasttrade",
+        "prevclose",
+        "pricechange",
+        "changepercent",
+        "volume",
+        "amount",
+        "pe_ratio",
+        "market_value",
+    )
+    _US_LIST_NUMERIC_FIELDS = ("price", "change_percent")
+    # 合并为美股列表的 AKShare 分类
+    _US_STOCK_CATEGORIES = (
+        "科技类",
+        "金融类",
+        "医药食品类",
+        "媒体类",
+        "汽车能源类",
+        "制造零售类",
+    )
 
     def _get_hk_stock_list_cached(self) -> List[Dict]:
         """获取缓存的港股列表（新浪 API，支持分页获取全量，Redis 缓存）"""
-        import json
-
-        import requests
+        import msgpack
         from src.infrastructure.cache.redis_cache import cache
 
-        # 1. 先从 Redis 获取
+        # 1. 先从进程内记忆和 Redis 获取
+        memo = self._get_memo_list(self._HK_STOCK_LIST_CACHE_KEY)
+        if memo is not None:
+            return memo
         try:
             cached = cache.client.get(self._HK_STOCK_LIST_CACHE_KEY)
             if cached:
                 logger.debug("Using Redis cached HK stock list")
-                return json.loads(cached)
+                return self._remember_list(
+                    self._HK_STOCK_LIST_CACHE_KEY, msgpack.unpackb(cached, raw=False)
+                )
         except Exception as e:
             logger.warning(f"Failed to get HK stock list from Redis: {e}")
 
@@ -443,23 +685,20 @@ class StockClient(BaseClient):
         logger.info("Fetching HK stock list from Sina API...")
         all_stocks = []
 
-        # 分页获取全部港股
-        for page in range(1, 100):  # 最多100页
-            try:
-                url = (
-                    f"http://vip.stock.finance.sina.com.cn/quotes_service/api/json_v2.php/"
-                    f"Market_Center.getHKStockData?page={page}&num=100&sort=symbol&asc=1&node=qbgg_hk"
-                )
-                resp = requests.get(url, timeout=10)
-                if resp.status_code == 200:
-                    data = resp.json()
-                    if not data:
-                        break
-                    all_stocks.extend(data)
-                else:
+        # 分页获取全部港股：每轮并发请求一批页，遇到空页或失败页即停止
+        # 新浪接口不返回总数，按批推进，最多多请求一批尾部空页
+        batch = self._HK_STOCK_LIST_PAGE_BATCH
+        last_page = self._HK_STOCK_LIST_MAX_PAGE
+        finished = False
+        for start in range(1, last_page + 1, batch):
+            pages = range(start, min(start + batch, last_page + 1))
+            # map 按页号顺序返回，保证拼接顺序与串行一致
+            for data in self._io_pool.map(self._fetch_hk_stock_page, pages):
+                if not data:
+                    finished = True
                     break
-            except Exception as e:
-                logger.warning(f"Failed to get HK stocks page {page}: {e}")
+                all_stocks.extend(data)
+            if finished:
                 break
 
         # 3. 存入 Redis
@@ -468,13 +707,133 @@ class StockClient(BaseClient):
                 cache.client.setex(
                     self._HK_STOCK_LIST_CACHE_KEY,
                     self._STOCK_LIST_CACHE_TTL,
-                    json.dumps(all_stocks, ensure_ascii=False),
+                    msgpack.packb(all_stocks, use_bin_type=True),
                 )
                 logger.info(f"HK stock list cached to Redis: {len(all_stocks)} stocks")
             except Exception as e:
                 logger.warning(f"Failed to cache HK stock list to Redis: {e}")
 
-        return all_stocks or []
+        # 获取失败（空列表）不记忆，下次重新请求
+        if not all_stocks:
+            return []
+        return self._remember_list(self._HK_STOCK_LIST_CACHE_KEY, all_stocks)
+
+    def warmup_stock_lists(self) -> None:
+        """一次 MGET 读取港股/美股列表的 Redis 缓存，写入进程内记忆"""
+        import msgpack
+        from src.infrastructure.cache.redis_cache import cache
+
+        keys = [self._HK_STOCK_LIST_CACHE_KEY, self._US_STOCK_LIST_CACHE_KEY]
+        try:
+            values = cache.client.mget(keys)
+        except Exception as e:
+            logger.warning(f"Failed to warm up stock lists from Redis: {e}")
+            return
+
+        now = time.time()
+        for key, cached in zip(keys, values):
+            if cached:
+                try:
+                    StockClient._stock_list_memo[key] = (
+                        now,
+                        msgpack.unpackb(cached, raw=False),
+                    )
+                except Exception as e:
+                    logger.warning(f"Failed to decode {key}: {e}")
+
+    def _remember_list(self, key: str, stock_list: List[Dict]) -> List[Dict]:
+        """写入进程内记忆并原样返回"""
+        StockClient._stock_list_memo[key] = (time.time(), stock_list)
+        return stock_list
+
+    def _get_memo_list(self, key: str) -> Optional[List[Dict]]:
+        """取进程内记忆的列表，过期或不存在时返回 None"""
+        entry = StockClient._stock_list_memo.get(key)
+        if entry is not None and time.time() - entry[0] < self._STOCK_LIST_MEMO_TTL:
+            return entry[1]
+        return None
+
+    def _get_stock_frame(
+        self,
+        market: str,
+        load: Callable[[], List[Dict]],
+        key: str,
+        numeric: Tuple[str, ...],
+    ) -> pd.DataFrame:
+        """
+        将港股/美股列表整理为按代码索引的 DataFrame（name + 数值列）
+        数值为空或无法解析时填 0；代码重复时保留最后一条，与按代码建 dict 一致
+        """
+        stock_list = load()
+        entry = StockClient._stock_frames.get(market)
+        if entry is not None and entry[0] is stock_list:
+            return entry[1]
+
+        df = pd.DataFrame(stock_list)
+        if df.empty or key not in df.columns:
+            return pd.DataFrame(columns=["name", *numeric])
+        frame = pd.concat(
+            [
+                df.reindex(columns=[key, "name"]).fillna(""),
+                coerce_numeric(df, numeric),
+            ],
+            axis=1,
+        )
+        frame = frame.drop_duplicates(subset=key, keep="last").set_index(key)
+        StockClient._stock_frames[market] = (stock_list, frame)
+        return frame
+
+    def _search_list(
+        self, market: str, stock_list: List[Dict], code_field: str, keyword: str
+    ) -> List[Dict]:
+        """
+        在港股/美股列表中按代码（不区分大小写）或名称子串匹配，按列表顺序取前 20 条
+        小写代码和名称数组与列表绑定缓存，不必每次搜索都逐条 lower()
+        """
+        entry = StockClient._list_search_index.get(market)
+        if entry is None or entry[0] is not stock_list:
+            entry = (
+                stock_list,
+                np.array(
+                    [str(s.get(code_field) or "").lower() for s in stock_list],
+                    dtype=str,
+                ),
+                np.array([str(s.get("name") or "") for s in stock_list], dtype=str),
+            )
+            StockClient._list_search_index[market] = entry
+        _, codes_arr, names_arr = entry
+        hits = (np.char.find(codes_arr, keyword.lower()) >= 0) | (
+            np.char.find(names_arr, keyword) >= 0
+        )
+        return [stock_list[i] for i in np.flatnonzero(hits)[:20]]
+
+    @staticmethod
+    def _select_codes(
+        frame: pd.DataFrame, codes: List[str], market: str
+    ) -> pd.DataFrame:
+        """按请求顺序取出 codes 对应的行，缺失的代码记录告警后跳过"""
+        sub = frame.reindex(codes)
+        missing = sub["name"].isna()
+        for code in sub.index[missing]:
+            logger.warning(f"{market} stock {code} not found in cache")
+        return sub[~missing.to_numpy()]
+
+    @staticmethod
+    def _fetch_hk_stock_page(page: int) -> Optional[List[Dict]]:
+        """获取新浪港股列表的单页数据，请求失败时返回 None"""
+        try:
+            resp = http_session.get(
+                StockClient._HK_STOCK_LIST_URL,
+                params={**StockClient._HK_STOCK_LIST_PARAMS, "page": page},
+                headers=StockClient._SINA_HEADERS,
+                timeout=10,
+            )
+            if resp.status_code == 200:
+                # 安装了 orjson 时用它解析，文本仍由 requests 按响应编码解码
+                return orjson.loads(resp.text) if orjson is not None else resp.json()
+        except Exception as e:
+            logger.warning(f"Failed to get HK stocks page {page}: {e}")
+        return None
 
     def search_hk_stock(self, keyword: str) -> List[Dict[str, Any]]:
         """搜索港股"""
@@ -485,27 +844,16 @@ class StockClient(BaseClient):
                 return []
 
             # 按代码或名称搜索
-            results = []
-            keyword_lower = keyword.lower()
-            for stock in stock_list:
-                code = stock.get("symbol", "")
-                name = stock.get("name", "")
-                if keyword_lower in code.lower() or keyword in name:
-                    price = float(stock.get("lasttrade", 0) or 0)
-                    change_pct = float(stock.get("changepercent", 0) or 0)
-                    results.append(
-                        {
-                            "code": code,
-                            "name": name,
-                            "market": "HK",
-                            "price": price,
-                            "change_percent": change_pct,
-                        }
-                    )
-                    if len(results) >= 20:
-                        break
-
-            return results
+            return [
+                {
+                    "code": stock.get("symbol", ""),
+                    "name": stock.get("name", ""),
+                    "market": "HK",
+                    "price": float(stock.get("lasttrade", 0) or 0),
+                    "change_percent": float(stock.get("changepercent", 0) or 0),
+                }
+                for stock in self._search_list("HK", stock_list, "symbol", keyword)
+            ]
         except Exception as e:
             logger.error(f"Failed to search HK stock: {e}")
             return []
@@ -515,52 +863,60 @@ class StockClient(BaseClient):
         if not codes:
             return []
 
-        results = []
         now = datetime.now()
 
-        # 从缓存的港股列表获取数据
-        stock_list = self._get_hk_stock_list_cached()
-        stock_map = {s.get("symbol", ""): s for s in stock_list}
-
-        for code in codes:
-            stock = stock_map.get(code)
-            if stock:
-                # 计算涨跌额
-                lasttrade = float(stock.get("lasttrade", 0) or 0)
-                prevclose = float(stock.get("prevclose", 0) or 0)
-                change = float(stock.get("pricechange", 0) or 0)
-                if change == 0 and prevclose > 0:
-                    change = lasttrade - prevclose
-
-                results.append(
-                    {
-                        "time": now,
-                        "code": code,
-                        "market": "HK",
-                        "name": stock.get("name", ""),
-                        "open": float(stock.get("open", 0) or 0),
-                        "high": float(stock.get("high", 0) or 0),
-                        "low": float(stock.get("low", 0) or 0),
-                        "close": lasttrade,
-                        "volume": int(float(stock.get("volume", 0) or 0)),
-                        "amount": float(stock.get("amount", 0) or 0),
-                        "change": round(change, 4),
-                        "change_percent": float(stock.get("changepercent", 0) or 0),
-                        "turnover": 0,  # 新浪 API 不提供换手率
-                        "pe_ratio": float(stock.get("pe_ratio", 0) or 0),
-                        "pb_ratio": 0,  # 新浪 API 不提供市净率
-                        "total_value": float(stock.get("market_value", 0) or 0),
-                        "circulating_value": 0,
-                    }
-                )
-            else:
-                logger.warning(f"HK stock {code} not found in cache")
+        # 从缓存的港股列表一次取出所有代码，整列计算
+        frame = self._get_stock_frame(
+            "HK", self._get_hk_stock_list_cached, "symbol", self._HK_LIST_NUMERIC_FIELDS
+        )
+        sub = self._select_codes(frame, codes, "HK")
+        if sub.empty:
+            return []
+
+        lasttrade = sub["lasttrade"].to_numpy()
+        prevclose = sub["prevclose"].to_numpy()
+        change = sub["pricechange"].to_numpy()
+        # 新浪未给出涨跌额时由昨收推算
+        change = np.where((change == 0) & (prevclose > 0), lasttrade - prevclose, change)
 
-        return results
+        out = pd.DataFrame(
+            {
+                "time": now,
+                "code": sub.index,
+                "market": "HK",
+                "name": sub["name"].to_numpy(),
+                "open": sub["open"].to_numpy(),
+                "high": sub["high"].to_numpy(),
+                "low": sub["low"].to_numpy(),
+                "close": lasttrade,
+                "volume": sub["volume"].to_numpy().astype("int64"),
+                "amount": sub["amount"].to_numpy(),
+                "change": change.round(4),
+                "change_percent": sub["changepercent"].to_numpy(),
+                "turnover": 0,  # 新浪 API 不提供换手率
+                "pe_ratio": sub["pe_ratio"].to_numpy(),
+                "pb_ratio": 0,  # 新浪 API 不提供市净率
+                "total_value": sub["market_value"].to_numpy(),
+                "circulating_value": 0,
+            }
+        )
+        return frame_to_records(out)
 
     # 港股历史数据缓存键前缀和 TTL
     _HK_HISTORY_CACHE_KEY_PREFIX = "hk_history:"
     _HK_HISTORY_CACHE_TTL = 86400  # 缓存 1 天
+    # 港股历史行情数值列 -> 输出字段（按输出顺序）
+    _HK_HISTORY_NUMERIC_FIELDS = {
+        "开盘": "open",
+        "最高": "high",
+        "最低": "low",
+        "收盘": "close",
+        "成交量": "volume",
+        "成交额": "amount",
+        "涨跌额": "change",
+        "涨跌幅": "change_percent",
+        "换手率": "turnover",
+    }
 
     def get_hk_stock_history(
         self,
@@ -603,41 +959,35 @@ class StockClient(BaseClient):
                 return []
 
             # 按日期过滤
-            if start_date:
-                start_dt = pd.to_datetime(start_date)
-                df = df[df["日期"] >= start_dt]
-            if end_date:
-                end_dt = pd.to_datetime(end_date)
-                df = df[df["日期"] <= end_dt]
-
-            result = []
-            for _, row in df.iterrows():
-                result.append(
-                    {
-                        "time": pd.to_datetime(row["日期"]),
-                        "code": code,
-                        "market": "HK",
-                        "open": float(row.get("开盘", 0) or 0),
-                        "high": float(row.get("最高", 0) or 0),
-                        "low": float(row.get("最低", 0) or 0),
-                        "close": float(row.get("收盘", 0) or 0),
-                        "volume": int(row.get("成交量", 0) or 0),
-                        "amount": float(row.get("成交额", 0) or 0),
-                        "change": float(row.get("涨跌额", 0) or 0),
-                        "change_percent": float(row.get("涨跌幅", 0) or 0),
-                        "turnover": float(row.get("换手率", 0) or 0),
-                    }
-                )
+            df = self._filter_by_date(df, "日期", start_date, end_date)
 
-            # 3. 存入 Redis 缓存（无日期过滤时才缓存）
+            # 数值列整列转换，缺失列或空值填 0
+            numeric = coerce_numeric(df, self._HK_HISTORY_NUMERIC_FIELDS).rename(
+                columns=self._HK_HISTORY_NUMERIC_FIELDS
+            )
+            numeric["volume"] = numeric["volume"].astype("int64")
+            out = pd.concat(
+                [
+                    pd.DataFrame(
+                        {
+                            "time": pd.to_datetime(df["日期"]),
+                            "code": code,
+                            "market": "HK",
+                        },
+                        index=df.index,
+                    ),
+                    numeric,
+                ],
+                axis=1,
+            )
+            result = frame_to_records(out)
+
+            # 3. 存入 Redis 缓存（无日期过滤时才缓存），time 转为 ISO 字符串
             if use_cache and result:
                 try:
-                    # 序列化时将 datetime 转为字符串
-                    cache_data = []
-                    for item in result:
-                        cache_item = item.copy()
-                        cache_item["time"] = item["time"].isoformat()
-                        cache_data.append(cache_item)
+                    cache_data = frame_to_records(
+                        out.assign(time=out["time"].dt.strftime("%Y-%m-%dT%H:%M:%S"))
+                    )
                     cache.client.setex(
                         cache_key,
                         self._HK_HISTORY_CACHE_TTL,
@@ -676,39 +1026,10 @@ class StockClient(BaseClient):
         except Exception as e:
             logger.warning(f"Failed to get HK valuation from cache: {e}")
 
-        # 2. 从 API 获取
-        valuation = {"pe_ratio": 0, "pb_ratio": 0, "total_value": 0}
-
-        # 获取市盈率(TTM)
-        try:
-            df = ak.stock_hk_valuation_baidu(
-                symbol=code, indicator="市盈率(TTM)", period="近一年"
-            )
-            if df is not None and not df.empty:
-                valuation["pe_ratio"] = float(df.iloc[-1]["value"])
-        except Exception as e:
-            logger.debug(f"Failed to get HK PE ratio for {code}: {e}")
-
-        # 获取市净率
-        try:
-            df = ak.stock_hk_valuation_baidu(
-                symbol=code, indicator="市净率", period="近一年"
-            )
-            if df is not None and not df.empty:
-                valuation["pb_ratio"] = float(df.iloc[-1]["value"])
-        except Exception as e:
-            logger.debug(f"Failed to get HK PB ratio for {code}: {e}")
-
-        # 获取总市值（单位：亿）
-        try:
-            df = ak.stock_hk_valuation_baidu(
-                symbol=code, indicator="总市值", period="近一年"
-            )
-            if df is not None and not df.empty:
-                # 百度返回的是亿为单位，转为元
-                valuation["total_value"] = float(df.iloc[-1]["value"]) * 100000000
-        except Exception as e:
-            logger.debug(f"Failed to get HK market cap for {code}: {e}")
+        # 2. 从 API 获取（各指标并发请求）
+        valuation = self._fetch_valuation(
+            ak.stock_hk_valuation_baidu, code, self._HK_VALUATION_INDICATORS
+        )
 
         # 3. 存入 Redis 缓存
         try:
@@ -735,9 +1056,10 @@ class StockClient(BaseClient):
             latest = history[-1]
 
             # 从缓存获取名称
-            stock_list = self._get_hk_stock_list_cached()
-            stock_map = {s.get("symbol", ""): s for s in stock_list}
-            stock = stock_map.get(code, {})
+            frame = self._get_stock_frame(
+                "HK", self._get_hk_stock_list_cached, "symbol", self._HK_LIST_NUMERIC_FIELDS
+            )
+            name = frame.at[code, "name"] if code in frame.index else ""
 
             # 获取估值数据
             valuation = self._get_hk_stock_valuation(code)
@@ -746,7 +1068,7 @@ class StockClient(BaseClient):
                 "time": latest["time"],
                 "code": code,
                 "market": "HK",
-                "name": stock.get("name", ""),
+                "name": name,
                 "open": latest["open"],
                 "high": latest["high"],
                 "low": latest["low"],
@@ -767,52 +1089,60 @@ class StockClient(BaseClient):
 
     # ========== 美股搜索（合并 AKShare 分类 + Redis 缓存） ==========
 
+    @staticmethod
+    def _fetch_us_category(category: str) -> Optional[pd.DataFrame]:
+        """获取 AKShare 单个美股分类的行情，失败时返回 None"""
+        try:
+            return ak.stock_us_famous_spot_em(symbol=category)
+        except Exception as e:
+            logger.debug(f"Failed to get US stocks ({category}): {e}")
+            return None
+
     def _get_us_stock_list_cached(self) -> List[Dict]:
         """获取缓存的美股列表（合并 AKShare 多个分类，Redis 缓存）"""
-        import json
-
+        import msgpack
         from src.infrastructure.cache.redis_cache import cache
 
-        # 1. 先从 Redis 获取
+        # 1. 先从进程内记忆和 Redis 获取
+        memo = self._get_memo_list(self._US_STOCK_LIST_CACHE_KEY)
+        if memo is not None:
+            return memo
         try:
             cached = cache.client.get(self._US_STOCK_LIST_CACHE_KEY)
             if cached:
                 logger.debug("Using Redis cached US stock list")
-                return json.loads(cached)
+                return self._remember_list(
+                    self._US_STOCK_LIST_CACHE_KEY, msgpack.unpackb(cached, raw=False)
+                )
         except Exception as e:
             logger.warning(f"Failed to get US stock list from Redis: {e}")
 
         # 2. 从 AKShare 获取
         logger.info("Fetching US stock list from AKShare...")
         all_stocks = []
-        seen_codes = set()
-
-        # 合并所有分类
-        categories = [
-            "科技类",
-            "金融类",
-            "医药食品类",
-            "媒体类",
-            "汽车能源类",
-            "制造零售类",
+
+        # 各分类并发请求，结果按分类顺序合并，同一代码保留最先出现的分类
+        frames = [
+            df
+            for df in self._io_pool.map(
+                self._fetch_us_category, self._US_STOCK_CATEGORIES
+            )
+            if df is not None and not df.empty
         ]
-        for cat in categories:
-            try:
-                df = ak.stock_us_famous_spot_em(symbol=cat)
-                for _, row in df.iterrows():
-                    code = row.get("代码", "")
-                    if code and code not in seen_codes:
-                        seen_codes.add(code)
-                        all_stocks.append(
-                            {
-                                "code": code,
-                                "name": row.get("名称", ""),
-                                "price": float(row.get("最新价", 0) or 0),
-                                "change_percent": float(row.get("涨跌幅", 0) or 0),
-                            }
-                        )
-            except Exception as e:
-                logger.debug(f"Failed to get US stocks ({cat}): {e}")
+        if frames:
+            merged = pd.concat(frames, ignore_index=True)
+            rows = merged.reindex(columns=["代码", "名称"]).fillna("")
+            numeric = coerce_numeric(merged, ["最新价", "涨跌幅"])
+            out = pd.DataFrame(
+                {
+                    "code": rows["代码"],
+                    "name": rows["名称"],
+                    "price": numeric["最新价"],
+                    "change_percent": numeric["涨跌幅"],
+                }
+            )
+            out = out[out["code"].astype(bool)].drop_duplicates(subset="code")
+            all_stocks = frame_to_records(out)
 
         # 3. 存入 Redis
         if all_stocks:
@@ -820,13 +1150,16 @@ class StockClient(BaseClient):
                 cache.client.setex(
                     self._US_STOCK_LIST_CACHE_KEY,
                     self._STOCK_LIST_CACHE_TTL,
-                    json.dumps(all_stocks, ensure_ascii=False),
+                    msgpack.packb(all_stocks, use_bin_type=True),
                 )
                 logger.info(f"US stock list cached to Redis: {len(all_stocks)} stocks")
             except Exception as e:
                 logger.warning(f"Failed to cache US stock list to Redis: {e}")
 
-        return all_stocks or []
+        # 获取失败（空列表）不记忆，下次重新请求
+        if not all_stocks:
+            return []
+        return self._remember_list(self._US_STOCK_LIST_CACHE_KEY, all_stocks)
 
     def search_us_stock(self, keyword: str) -> List[Dict[str, Any]]:
         """搜索美股"""
@@ -836,32 +1169,17 @@ class StockClient(BaseClient):
             if not stock_list:
                 return []
 
-            # 按代码或名称搜索
-            results = []
-            keyword_lower = keyword.lower()
-            for stock in stock_list:
-                code = stock.get("code", "")
-                name = stock.get("name", "")
-                # 代码格式: 105.AAPL, 搜索时也匹配去掉前缀的代码
-                code_short = code.split(".")[-1] if "." in code else code
-                if (
-                    keyword_lower in code.lower()
-                    or keyword_lower in code_short.lower()
-                    or keyword in name
-                ):
-                    results.append(
-                        {
-                            "code": code,
-                            "name": name,
-                            "market": "US",
-                            "price": stock.get("price", 0),
-                            "change_percent": stock.get("change_percent", 0),
-                        }
-                    )
-                    if len(results) >= 20:
-                        break
-
-            return results
+            # 按代码或名称搜索（代码格式: 105.AAPL，去掉前缀的代码是其子串，无需单独匹配）
+            return [
+                {
+                    "code": stock.get("code", ""),
+                    "name": stock.get("name", ""),
+                    "market": "US",
+                    "price": stock.get("price", 0),
+                    "change_percent": stock.get("change_percent", 0),
+                }
+                for stock in self._search_list("US", stock_list, "code", keyword)
+            ]
         except Exception as e:
             logger.error(f"Failed to search US stock: {e}")
             return []
@@ -871,38 +1189,35 @@ class StockClient(BaseClient):
         if not codes:
             return []
 
-        results = []
         now = datetime.now()
 
-        # 从缓存的美股列表获取数据
-        stock_list = self._get_us_stock_list_cached()
-        stock_map = {s.get("code", ""): s for s in stock_list}
-
-        for code in codes:
-            stock = stock_map.get(code)
-            if stock:
-                results.append(
-                    {
-                        "time": now,
-                        "code": code,
-                        "market": "US",
-                        "name": stock.get("name", ""),
-                        "open": 0,
-                        "high": 0,
-                        "low": 0,
-                        "close": float(stock.get("price", 0) or 0),
-                        "volume": 0,
-                        "amount": 0,
-                        "change": 0,
-                        "change_percent": float(stock.get("change_percent", 0) or 0),
-                        "turnover": 0,
-                        "pe_ratio": 0,
-                        "pb_ratio": 0,
-                        "total_value": 0,
-                        "circulating_value": 0,
-                    }
-                )
-            else:
-                logger.warning(f"US stock {code} not found in cache")
+        # 从缓存的美股列表一次取出所有代码
+        frame = self._get_stock_frame(
+            "US", self._get_us_stock_list_cached, "code", self._US_LIST_NUMERIC_FIELDS
+        )
+        sub = self._select_codes(frame, codes, "US")
+        if sub.empty:
+            return []
 
-        return results
+        out = pd.DataFrame(
+            {
+                "time": now,
+                "code": sub.index,
+                "market": "US",
+                "name": sub["name"].to_numpy(),
+                "open": 0,
+                "high": 0,
+                "low": 0,
+                "close": sub["price"].to_numpy(),
+                "volume": 0,
+                "amount": 0,
+                "change": 0,
+                "change_percent": sub["change_percent"].to_numpy(),
+                "turnover": 0,
+                "pe_ratio": 0,
+                "pb_ratio": 0,
+                "total_value": 0,
+                "circulating_value": 0,
+            }
+        )
+        return frame_to_records(out)
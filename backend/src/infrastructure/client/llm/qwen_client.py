@@ -2,11 +2,12 @@
 阿里百炼平台 Qwen 模型客户端（使用 OpenAI 兼容模式）
 """
 
+import asyncio
 import json
 import logging
 from typing import Any, Dict, List, Optional
 
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 from src.config import DASHSCOPE_API_KEY, DASHSCOPE_MODEL, DASHSCOPE_MODEL_SUMMARY
 
@@ -17,7 +18,10 @@ DASHSCOPE_BASE_URL = "https://dashscope.aliyuncs.com/compatible-mode/v1"
 
 
 class QwenClient:
-    """Qwen大模型客户端（OpenAI兼容模式）"""
+    """Qwen大模型客户端（OpenAI兼容模式，异步调用）"""
+
+    # 同时进行的模型调用上限，避免批量处理时触发百炼平台限流
+    MAX_CONCURRENT_CALLS = 10
 
     def __init__(self, api_key: str = None, model: str = None):
         """
@@ -29,15 +33,16 @@ class QwenClient:
         self.model = model or DASHSCOPE_MODEL
 
         if self.api_key:
-            self.client = OpenAI(
+            self.client = AsyncOpenAI(
                 api_key=self.api_key,
                 base_url=DASHSCOPE_BASE_URL,
             )
         else:
             self.client = None
             logger.warning("DASHSCOPE_API_KEY not configured")
+        self._semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_CALLS)
 
-    def _call(
+    async def _call(
         self,
         messages: List[Dict[str, str]],
         temperature: float = 0.7,
@@ -59,13 +64,14 @@ class QwenClient:
             return None
 
         try:
-            completion = self.client.chat.completions.create(
-                model=model or self.model,
-                messages=messages,
-                temperature=temperature,
-                max_tokens=max_tokens,
-                top_p=top_p,
-            )
+            async with self._semaphore:
+                completion = await self.client.chat.completions.create(
+                    model=model or self.model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    top_p=top_p,
+                )
 
             return completion.choices[0].message.content
 
@@ -73,7 +79,7 @@ class QwenClient:
             logger.error(f"Failed to call Qwen model: {e}")
             return None
 
-    def chat(
+    async def chat(
         self,
         prompt: str,
         system_prompt: str = None,
@@ -93,9 +99,11 @@ class QwenClient:
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
 
-        return self._call(messages, temperature=temperature, max_tokens=max_tokens)
+        return await self._call(
+            messages, temperature=temperature, max_tokens=max_tokens
+        )
 
-    def summarize_news(self, news_content: str, max_length: int = 100) -> Optional[str]:
+    async def summarize_news(self, news_content: str, max_length: int = 100) -> Optional[str]:
         """
         生成新闻摘要（使用 qwen-plus 模型）
         :param news_content: 新闻内容
@@ -117,14 +125,14 @@ class QwenClient:
         ]
 
         # 使用 qwen-plus 模型进行新闻摘要
-        return self._call(
+        return await self._call(
             messages,
             temperature=0.3,
             max_tokens=500,
             model=DASHSCOPE_MODEL_SUMMARY,
         )
 
-    def analyze_news_sentiment(
+    async def analyze_news_sentiment(
         self, news_content: str
     ) -> Optional[Dict[str, Any]]:
         """
@@ -162,7 +170,7 @@ class QwenClient:
             {"role": "user", "content": prompt},
         ]
 
-        result = self._call(
+        result = await self._call(
             messages,
             temperature=0.2,
             max_tokens=500,
@@ -183,7 +191,7 @@ class QwenClient:
                 return None
         return None
 
-    def generate_investment_recommendation(
+    async def generate_investment_recommendation(
         self,
         news_list: List[Dict[str, str]],
         market_trends: Dict[str, Any] = None,
@@ -231,7 +239,7 @@ class QwenClient:
 
         prompt = f"最新财经新闻：\n{news_text}{trends_text}\n\n请给出投资建议。"
 
-        return self.chat(
+        return await self.chat(
             prompt=prompt,
             system_prompt=system_prompt,
             temperature=0.5,
@@ -39,6 +39,24 @@ class BaseService(ABC):
             logger.warning(f"Cache set failed: {e}")
             return False
 
+    async def _get_packed_from_cache(self, key: str) -> Optional[Any]:
+        """从缓存获取 msgpack 编码的数据"""
+        try:
+            return await self.cache.get_packed(key)
+        except Exception as e:
+            logger.warning(f"Cache get_packed failed: {e}")
+            return None
+
+    async def _set_packed_to_cache(
+        self, key: str, value: Any, ttl: int = CACHE_TTL_REALTIME
+    ) -> bool:
+        """以 msgpack 编码设置缓存（K 线等大体积数值数据）"""
+        try:
+            return await self.cache.set_packed(key, value, timeout=ttl)
+        except Exception as e:
+            logger.warning(f"Cache set_packed failed: {e}")
+            return False
+
     async def _delete_from_cache(self, key: str) -> bool:
         """删除缓存"""
         try:
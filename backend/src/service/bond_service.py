@@ -56,7 +56,7 @@ class BondService(BaseService):
         cache_key = self._cache_key("realtime", bond_type or "all")
         
         if use_cache:
-            cached = await self._get_from_cache(cache_key)
+            cached = await self._get_packed_from_cache(cache_key)
             if cached:
                 return cached
 
@@ -68,7 +68,8 @@ class BondService(BaseService):
             except Exception as e:
                 logger.warning(f"Failed to save bond quotes: {e}")
             
-            await self._set_to_cache(cache_key, data, CACHE_TTL_REALTIME)
+            # 全量债券行情数据量大，使用 msgpack 编码
+            await self._set_packed_to_cache(cache_key, data, CACHE_TTL_REALTIME)
         
         return data
 
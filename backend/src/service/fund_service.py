@@ -1,6 +1,7 @@
 """
 基金服务
 """
+import asyncio
 import logging
 from typing import Any, Dict, List, Optional
 
@@ -40,7 +41,7 @@ class FundService(BaseService):
             if cached:
                 return cached
 
-        data = self.client.get_fund_realtime(codes)
+        data = await self.client.request(self.client.get_fund_realtime, codes)
         
         # 过滤类型
         if fund_type:
@@ -66,7 +67,7 @@ class FundService(BaseService):
             if cached:
                 return cached
 
-        data = self.client.get_fund_type_summary()
+        data = await self.client.request(self.client.get_fund_type_summary)
         
         if data:
             await self._set_to_cache(cache_key, data, CACHE_TTL_REALTIME)
@@ -81,7 +82,7 @@ class FundService(BaseService):
         if cached:
             return cached
 
-        data = self.client.get_fund_realtime([code])
+        data = await self.client.request(self.client.get_fund_realtime, [code])
         if data:
             result = data[0]
             await self._set_to_cache(cache_key, result, CACHE_TTL_REALTIME)
@@ -97,7 +98,7 @@ class FundService(BaseService):
         if cached:
             return cached
 
-        data = self.client.get_fund_history(code)
+        data = await self.client.request(self.client.get_fund_history, code)
         
         if data:
             await self._set_to_cache(cache_key, data, CACHE_TTL_DAILY)
@@ -112,7 +113,7 @@ class FundService(BaseService):
         if cached:
             return cached
 
-        data = self.client.search_fund(keyword)
+        data = await self.client.request(self.client.search_fund, keyword)
         
         if data:
             await self._set_to_cache(cache_key, data, CACHE_TTL_DAILY)
@@ -136,7 +137,7 @@ class FundService(BaseService):
             if cached:
                 return cached
 
-        data = self.client.get_fund_ranking(fund_type, sort_by, limit)
+        data = await self.client.request(self.client.get_fund_ranking, fund_type, sort_by, limit)
 
         if data:
             await self._set_to_cache(cache_key, data, CACHE_TTL_DAILY)
@@ -152,11 +153,13 @@ class FundService(BaseService):
             if cached:
                 return cached
 
-        data = self.client.get_fund_detail(code)
+        # 详情与历史净值走势互不依赖，并发获取
+        data, history = await asyncio.gather(
+            self.client.request(self.client.get_fund_detail, code),
+            self.client.request(self.client.get_fund_history, code),
+        )
 
         if data:
-            # 获取历史净值走势
-            history = self.client.get_fund_history(code)
             if history:
                 data["history"] = history[-90:]  # 最近 90 天
 
@@ -172,7 +175,7 @@ class FundService(BaseService):
         if cached:
             return cached
 
-        data = self.client.search_otc_fund(keyword)
+        data = await self.client.request(self.client.search_otc_fund, keyword)
 
         if data:
             await self._set_to_cache(cache_key, data, CACHE_TTL_DAILY)
@@ -195,7 +198,7 @@ class FundService(BaseService):
             return []
 
         codes = [item.code for item in watchlist]
-        navs = self.client.get_fund_realtime(codes)
+        navs = await self.client.request(self.client.get_fund_realtime, codes)
         
         nav_map = {n["code"]: n for n in navs}
         result = []
@@ -274,14 +277,15 @@ class FundService(BaseService):
             return []
 
         # 从缓存的完整列表中获取数据
-        all_funds = self.client._get_otc_fund_list_cached()
-        fund_map = {f["code"]: f for f in all_funds}
+        fund_map = await self.client.request(
+            self.client._get_otc_by_codes, [item.code for item in otc_items]
+        )
 
         # 获取历史走势
         history_map = {}
         for item in otc_items:
             try:
-                history = self.client.get_fund_history(item.code)
+                history = await self.client.request(self.client.get_fund_history, item.code)
                 if history:
                     history_map[item.code] = [h["nav"] for h in history[-30:]]
             except Exception as e:
@@ -360,14 +364,15 @@ class FundService(BaseService):
                 return
 
             # 从缓存的完整列表中获取数据
-            all_funds = self.client._get_otc_fund_list_cached()
-            fund_map = {f["code"]: f for f in all_funds}
+            fund_map = await self.client.request(
+                self.client._get_otc_by_codes, [item.code for item in otc_items]
+            )
 
             # 获取历史走势
             history_map = {}
             for item in otc_items:
                 try:
-                    history = self.client.get_fund_history(item.code)
+                    history = await self.client.request(self.client.get_fund_history, item.code)
                     if history:
                         history_map[item.code] = [h["nav"] for h in history[-30:]]
                 except Exception as e:
@@ -424,7 +429,7 @@ class FundService(BaseService):
             if cached:
                 return cached
 
-        data = self.client.get_etf_realtime(codes)
+        data = await self.client.request(self.client.get_etf_realtime, codes)
 
         # 按类型过滤
         if etf_type and etf_type != "全部":
@@ -449,7 +454,7 @@ class FundService(BaseService):
             if cached:
                 return cached
 
-        data = self.client.get_etf_history(code, days=days)
+        data = await self.client.request(self.client.get_etf_history, code, days=days)
 
         if data:
             # ETF 历史数据缓存 1 小时
@@ -465,7 +470,7 @@ class FundService(BaseService):
         if cached:
             return cached
 
-        data = self.client.search_etf(keyword)
+        data = await self.client.request(self.client.search_etf, keyword)
 
         if data:
             await self._set_to_cache(cache_key, data, CACHE_TTL_DAILY)
@@ -481,7 +486,7 @@ class FundService(BaseService):
             if cached:
                 return cached
 
-        data = self.client.get_hot_etfs()
+        data = await self.client.request(self.client.get_hot_etfs)
 
         if data:
             await self._set_to_cache(cache_key, data, CACHE_TTL_REALTIME)
@@ -515,14 +520,14 @@ class FundService(BaseService):
             return []
 
         codes = [item.code for item in etf_items]
-        etf_data = self.client.get_etf_realtime(codes)
+        etf_data = await self.client.request(self.client.get_etf_realtime, codes)
         etf_map = {e["code"]: e for e in etf_data}
 
         # 获取走势数据
         history_map = {}
         for code in codes:
             try:
-                history = self.client.get_etf_history(code, days=7)
+                history = await self.client.request(self.client.get_etf_history, code, days=7)
                 if history:
                     history_map[code] = [h["close"] for h in history]
             except Exception as e:
@@ -599,14 +604,14 @@ class FundService(BaseService):
             codes = [item.code for item in etf_items]
 
             # 获取实时数据
-            etf_data = self.client.get_etf_realtime(codes)
+            etf_data = await self.client.request(self.client.get_etf_realtime, codes)
             etf_map = {e["code"]: e for e in etf_data}
 
             # 获取走势数据
             history_map = {}
             for code in codes:
                 try:
-                    history = self.client.get_etf_history(code, days=7)
+                    history = await self.client.request(self.client.get_etf_history, code, days=7)
                     if history:
                         history_map[code] = [h["close"] for h in history]
                 except Exception as e:
@@ -38,7 +38,7 @@ class FuturesService(BaseService):
             if cached:
                 return cached
 
-        data = self.client.get_futures_realtime(category)
+        data = await self.client.request(self.client.get_futures_realtime, category)
         
         if data:
             try:
@@ -59,7 +59,7 @@ class FuturesService(BaseService):
         if cached:
             return cached
 
-        data = self.client.get_main_contracts()
+        data = await self.client.request(self.client.get_main_contracts)
         
         if data:
             await self._set_to_cache(cache_key, data, CACHE_TTL_DAILY)
@@ -87,7 +87,9 @@ class FuturesService(BaseService):
         if cached:
             return cached
 
-        data = self.client.get_futures_history(code, start_date, end_date)
+        data = await self.client.request(
+            self.client.get_futures_history, code, start_date, end_date
+        )
         
         if data:
             await self._set_to_cache(cache_key, data, CACHE_TTL_DAILY)
@@ -31,7 +31,7 @@ class GoldService(BaseService):
             if cached:
                 return cached
 
-        data = self.client.get_gold_realtime()
+        data = await self.client.request(self.client.get_gold_realtime)
         
         if data:
             try:
@@ -65,7 +65,9 @@ class GoldService(BaseService):
         if cached:
             return cached
 
-        data = self.client.get_gold_history(code, start_date, end_date)
+        data = await self.client.request(
+            self.client.get_gold_history, code, start_date, end_date
+        )
         
         if data:
             await self._set_to_cache(cache_key, data, CACHE_TTL_DAILY)
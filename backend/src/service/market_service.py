@@ -5,7 +5,7 @@
 import logging
 from typing import Any, Dict, List
 
-from src.config import CACHE_TTL_DAILY, CACHE_TTL_HISTORY, CACHE_TTL_REALTIME
+from src.config import CACHE_TTL_DAILY, CACHE_TTL_INDEX_HISTORY, CACHE_TTL_REALTIME
 from src.infrastructure.client.akshare.market import MarketClient
 from src.service.base import BaseService
 
@@ -32,7 +32,9 @@ class MarketService(BaseService):
                 return cached_data
 
         # 从API获取
-        data = self.client.get_market_index(market=market, symbol=symbol, period=period)
+        data = await self.client.request(
+            self.client.get_market_index, market=market, symbol=symbol, period=period
+        )
 
         # 始终写入缓存（无论 use_cache 是 True 还是 False）
         if data:
@@ -40,6 +42,38 @@ class MarketService(BaseService):
 
         return data
 
+    async def get_market_data_batch(
+        self, market: str, symbols: List[str], period: str, use_cache: bool = True
+    ) -> Dict[str, Dict[str, Any]]:
+        """批量获取同一市场的多个指数数据，未命中缓存的指数一次性从 API 获取"""
+        result = {}
+        if use_cache:
+            for symbol in symbols:
+                cached_data = await self._get_from_cache(
+                    self._cache_key("index", market, symbol, period)
+                )
+                if cached_data:
+                    result[symbol] = cached_data
+
+        missing = [symbol for symbol in symbols if symbol not in result]
+        if missing:
+            fetched = await self.client.request(
+                self.client.get_market_indices,
+                market=market,
+                symbols=missing,
+                period=period,
+            )
+            for symbol, data in fetched.items():
+                if data:
+                    await self._set_to_cache(
+                        self._cache_key("index", market, symbol, period),
+                        data,
+                        CACHE_TTL_REALTIME,
+                    )
+                result[symbol] = data
+
+        return result
+
     async def get_market_history(
         self,
         market: str,
@@ -103,15 +137,18 @@ class MarketService(BaseService):
         cache_key = self._cache_key("index_history", market, symbol, str(days))
 
         if use_cache:
-            cached_data = await self._get_from_cache(cache_key)
+            cached_data = await self._get_packed_from_cache(cache_key)
             if cached_data:
                 return cached_data
 
         # 从 API 获取历史数据
-        data = self.client.get_index_history(market=market, symbol=symbol, days=days)
+        data = await self.client.request(
+            self.client.get_index_history, market=market, symbol=symbol, days=days
+        )
 
         if data:
-            # 历史数据缓存1小时，因为历史数据不会变化
-            await self._set_to_cache(cache_key, data, CACHE_TTL_HISTORY)
+            # 日线在 Redis 中跨进程共享，最后一根为当日K线，按 4 小时过期；
+            # K 线数据量大，使用 msgpack 编码
+            await self._set_packed_to_cache(cache_key, data, CACHE_TTL_INDEX_HISTORY)
 
         return data
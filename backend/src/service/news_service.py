@@ -2,6 +2,7 @@
 新闻服务层
 """
 
+import asyncio
 import logging
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
@@ -21,6 +22,9 @@ logger = logging.getLogger(__name__)
 class NewsService(BaseService):
     """新闻服务"""
 
+    # LLM 处理新闻时每批并发的条数
+    _LLM_BATCH_SIZE = 10
+
     def __init__(self):
         super().__init__("news")
         self.client = NewsClient()
@@ -332,12 +336,15 @@ class NewsService(BaseService):
                 # 生成摘要
                 content = news.content or news.title
                 if content:
-                    summary = self.llm_client.summarize_news(content)
+                    # 摘要与情感分析互不依赖，并发请求
+                    summary, analysis = await asyncio.gather(
+                        self.llm_client.summarize_news(content),
+                        self.llm_client.analyze_news_sentiment(content),
+                    )
                     if summary:
                         news.summary = summary
 
                     # 分析情感和相关板块
-                    analysis = self.llm_client.analyze_news_sentiment(content)
                     if analysis:
                         news.sentiment = analysis.get("sentiment")
                         sectors = analysis.get("related_sectors", [])
@@ -359,7 +366,7 @@ class NewsService(BaseService):
 
     async def process_unprocessed_news(self) -> int:
         """
-        处理所有未处理的新闻（逐条处理，处理完一条立即更新数据库）
+        处理所有未处理的新闻（分批并发处理，每条处理完立即更新数据库）
         :return: 处理成功的数量
         """
         if not self.llm_client.is_configured():
@@ -387,12 +394,17 @@ class NewsService(BaseService):
         logger.info(f"[News] 发现 {total} 条未处理的新闻，开始处理...")
 
         processed = 0
-        for i, news in enumerate(news_list, 1):
-            if await self.process_news_with_llm(news.id):
-                processed += 1
-            # 每处理10条输出一次进度
-            if i % 10 == 0:
-                logger.info(f"[News] 处理进度: {i}/{total}")
+        batch = self._LLM_BATCH_SIZE
+        for start in range(0, total, batch):
+            results = await asyncio.gather(
+                *(
+                    self.process_news_with_llm(news.id)
+                    for news in news_list[start : start + batch]
+                )
+            )
+            processed += sum(results)
+            # 每处理一批输出一次进度
+            logger.info(f"[News] 处理进度: {min(start + batch, total)}/{total}")
 
         return processed
 
@@ -427,7 +439,7 @@ class NewsService(BaseService):
             for n in important_news
         ]
 
-        return self.llm_client.generate_investment_recommendation(news_list)
+        return await self.llm_client.generate_investment_recommendation(news_list)
 
     def _news_to_dict(self, news: News) -> Dict[str, Any]:
         """将 News 模型转换为字典"""
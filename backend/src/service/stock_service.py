@@ -73,7 +73,7 @@ class StockService(BaseService):
                 return cached
 
         # 从 API 获取数据
-        data = self.client.get_cn_stock_realtime(codes)
+        data = await self.client.request(self.client.get_cn_stock_realtime, codes)
 
         if data:
             # 保存到数据库
@@ -96,7 +96,7 @@ class StockService(BaseService):
             return cached
 
         # 获取实时数据
-        data = self.client.get_cn_stock_realtime([code])
+        data = await self.client.request(self.client.get_cn_stock_realtime, [code])
         if data:
             result = data[0]
             await self._set_to_cache(cache_key, result, CACHE_TTL_REALTIME)
@@ -114,14 +114,17 @@ class StockService(BaseService):
         """获取股票历史数据"""
         cache_key = self._cache_key("history", code, period, start_date, end_date)
 
-        cached = await self._get_from_cache(cache_key)
+        cached = await self._get_packed_from_cache(cache_key)
         if cached:
             return cached
 
-        data = self.client.get_stock_history(code, period, start_date, end_date)
+        data = await self.client.request(
+            self.client.get_stock_history, code, period, start_date, end_date
+        )
 
         if data:
-            await self._set_to_cache(cache_key, data, CACHE_TTL_DAILY)
+            # K 线数据量大，使用 msgpack 编码
+            await self._set_packed_to_cache(cache_key, data, CACHE_TTL_DAILY)
 
         return data
 
@@ -139,15 +142,15 @@ class StockService(BaseService):
 
         if market == "CN" or market is None:
             # A股搜索
-            data.extend(self.client.search_stock(keyword))
+            data.extend(await self.client.request(self.client.search_stock, keyword))
 
         if market == "HK" or market is None:
             # 港股搜索
-            data.extend(self.client.search_hk_stock(keyword))
+            data.extend(await self.client.request(self.client.search_hk_stock, keyword))
 
         if market == "US" or market is None:
             # 美股搜索
-            data.extend(self.client.search_us_stock(keyword))
+            data.extend(await self.client.request(self.client.search_us_stock, keyword))
 
         if data:
             # 限制返回数量
@@ -194,24 +197,36 @@ class StockService(BaseService):
 
         # 获取 A股实时行情
         cn_codes = [item.code for item in cn_items]
-        cn_quotes = self.client.get_stocks_realtime_batch(cn_codes) if cn_codes else []
+        cn_quotes = (
+            await self.client.request(self.client.get_stocks_realtime_batch, cn_codes)
+            if cn_codes
+            else []
+        )
 
         # 获取港股实时行情和走势（一次性获取，避免重复调用）
         hk_codes = [item.code for item in hk_items]
         hk_quotes = []
         hk_history_map = {}
         for code in hk_codes:
-            quote = self.client.get_hk_stock_realtime_with_history(code)
+            quote = await self.client.request(
+                self.client.get_hk_stock_realtime_with_history, code
+            )
             if quote:
                 hk_quotes.append(quote)
                 # 同时获取走势数据（复用历史数据调用）
-                history = self.client.get_hk_stock_history(code, period="daily")
+                history = await self.client.request(
+                    self.client.get_hk_stock_history, code, period="daily"
+                )
                 if history:
                     hk_history_map[code] = [h["close"] for h in history[-7:]]
 
         # 获取美股实时行情
         us_codes = [item.code for item in us_items]
-        us_quotes = self.client.get_us_stock_realtime(us_codes) if us_codes else []
+        us_quotes = (
+            await self.client.request(self.client.get_us_stock_realtime, us_codes)
+            if us_codes
+            else []
+        )
 
         # 合并所有行情数据
         all_quotes = cn_quotes + hk_quotes + us_quotes
@@ -222,9 +237,11 @@ class StockService(BaseService):
         # A股走势
         for code in cn_codes:
             try:
-                history = self.client.get_stock_history(code, period="daily")
-                if history:
-                    history_map[code] = [h["close"] for h in history[-7:]]
+                closes = await self.client.request(
+                    self.client.get_stock_recent_closes, code, days=7
+                )
+                if closes:
+                    history_map[code] = closes
             except Exception as e:
                 logger.debug(f"Failed to get CN history for {code}: {e}")
 
@@ -301,17 +318,31 @@ class StockService(BaseService):
         if not cn_codes and not hk_codes and not us_codes:
             return
 
+        # 港股/美股列表缓存一次 MGET 取回，避免各自访问 Redis
+        if hk_codes or us_codes:
+            await self.client.request(self.client.warmup_stock_lists)
+
         # 获取各市场实时行情
-        cn_quotes = self.client.get_stocks_realtime_batch(cn_codes) if cn_codes else []
+        cn_quotes = (
+            await self.client.request(self.client.get_stocks_realtime_batch, cn_codes)
+            if cn_codes
+            else []
+        )
 
         # 港股使用历史数据获取更完整信息（包含换手率）
         hk_quotes = []
         for code in hk_codes:
-            quote = self.client.get_hk_stock_realtime_with_history(code)
+            quote = await self.client.request(
+                self.client.get_hk_stock_realtime_with_history, code
+            )
             if quote:
                 hk_quotes.append(quote)
 
-        us_quotes = self.client.get_us_stock_realtime(us_codes) if us_codes else []
+        us_quotes = (
+            await self.client.request(self.client.get_us_stock_realtime, us_codes)
+            if us_codes
+            else []
+        )
 
         all_quotes = cn_quotes + hk_quotes + us_quotes
 
@@ -330,16 +361,20 @@ class StockService(BaseService):
             # A股走势
             for code in cn_codes:
                 try:
-                    history = self.client.get_stock_history(code, period="daily")
-                    if history:
-                        history_map[code] = [h["close"] for h in history[-7:]]
+                    closes = await self.client.request(
+                        self.client.get_stock_recent_closes, code, days=7
+                    )
+                    if closes:
+                        history_map[code] = closes
                 except Exception as e:
                     logger.debug(f"Failed to get CN history for {code}: {e}")
 
             # 港股走势
             for code in hk_codes:
                 try:
-                    history = self.client.get_hk_stock_history(code, period="daily")
+                    history = await self.client.request(
+                        self.client.get_hk_stock_history, code, period="daily"
+                    )
                     if history:
                         history_map[code] = [h["close"] for h in history[-7:]]
                 except Exception as e:
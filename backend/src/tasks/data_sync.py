@@ -84,21 +84,20 @@ class DataSyncTask:
         while self._running:
             try:
                 for market, codes in indices.items():
-                    for code in codes:
-                        try:
-                            # 获取数据并缓存（use_cache=False 强制刷新）
-                            await service.get_market_data(
-                                market=market,
-                                symbol=code,
-                                period="day",
-                                use_cache=False,
-                            )
-                            logger.debug(f"Synced market data: {market}/{code}")
-                        except Exception as e:
-                            logger.warning(f"Failed to sync {market}/{code}: {e}")
-
-                        # 每个请求间隔 1 秒，避免请求过快
-                        await asyncio.sleep(1)
+                    try:
+                        # 同一市场的指数批量获取并缓存（use_cache=False 强制刷新）
+                        await service.get_market_data_batch(
+                            market=market,
+                            symbols=codes,
+                            period="day",
+                            use_cache=False,
+                        )
+                        logger.debug(f"Synced market data: {market}/{','.join(codes)}")
+                    except Exception as e:
+                        logger.warning(f"Failed to sync {market}: {e}")
+
+                    # 每个市场间隔 1 秒，避免请求过快
+                    await asyncio.sleep(1)
 
                 # 首次启动时预同步历史数据（只同步一次，缓存1小时）
                 if not history_synced: